@@ -0,0 +1,373 @@
+"""
+asgi_server.py - Asynchronous server for Direktor EXE Scrabble Tournament Manager
+
+This module serves the same routes as server.py from a single asyncio
+process. Rendered tournament files and live event streams are handled
+natively, so thousands of idle keep-alive and Server-Sent Events
+connections cost no threads; every other route is passed to the Flask app
+on a bounded thread pool.
+
+Run it with uvicorn (pip install uvicorn):
+    python asgi_server.py
+    uvicorn asgi_server:app --host 0.0.0.0 --port $PORT
+"""
+
+import io
+import os
+import re
+import sys
+import asyncio
+import threading
+import mimetypes
+from email.utils import formatdate, parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.security import safe_join
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import server
+import live_events
+from render_pipeline import compressed_variants
+
+PORT = int(os.environ.get("PORT", 8000))
+WSGI_THREADS = int(os.environ.get("WSGI_THREADS", 32))
+CHUNK_SIZE = 64 * 1024
+WSGI_QUEUE_CHUNKS = 16  # Response chunks buffered between a Flask thread and the event loop
+
+TOURNAMENT_PATH = re.compile(r"/tournaments?/([^/]+)(?:/(.*))?")
+
+_executor = ThreadPoolExecutor(max_workers=WSGI_THREADS, thread_name_prefix="wsgi")
+
+def get_header(scope, name):
+    """Get a request header from an ASGI scope, or "" if it is missing."""
+    name = name.lower().encode("latin-1")
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return ""
+
+def accepted_encodings(scope):
+    """
+    Parse the Accept-Encoding header.
+
+    Args:
+        scope (dict): ASGI HTTP scope
+
+    Returns:
+        set: Content codings the client accepts
+    """
+    accepted = set()
+    for item in get_header(scope, "accept-encoding").split(","):
+        coding, _, params = item.strip().partition(";")
+        params = params.strip()
+        try:
+            quality = float(params[2:]) if params.startswith("q=") else 1.0
+        except ValueError:
+            quality = 0.0
+        if coding and quality > 0:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+def not_modified(scope, etag, mtime):
+    """Check the conditional request headers against a file's ETag and mtime."""
+    if_none_match = get_header(scope, "if-none-match")
+    if if_none_match:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or f'"{etag}"' in tags
+    if_modified_since = get_header(scope, "if-modified-since")
+    if if_modified_since:
+        try:
+            return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+def locate_static(path, accepted):
+    """
+    Pick the variant of a file to send and read its size, mtime and ETag.
+
+    Runs on a worker thread, since every step touches the disk.
+
+    Args:
+        path (str): Requested file
+        accepted (set): Content codings the client accepts
+
+    Returns:
+        tuple: (variant path, content coding or None, os.stat_result, ETag),
+            or None if the file does not exist
+    """
+    if not os.path.isfile(path):
+        return None
+    variant, encoding = path, None
+    for suffix, candidate in reversed(compressed_variants()):
+        if candidate in accepted and os.path.isfile(path + suffix):
+            variant, encoding = path + suffix, candidate
+            break
+    stat_result = os.stat(variant)
+    return variant, encoding, stat_result, server.file_etag(variant, stat_result)
+
+async def send_static(scope, send, folder_name, filename):
+    """
+    Send a rendered tournament file without blocking the event loop.
+
+    Mirrors server.send_tournament_file(): precompressed variants, strong
+    ETags, Last-Modified and 304 responses for unchanged files.
+
+    Args:
+        scope (dict): ASGI HTTP scope
+        send (callable): ASGI send function
+        folder_name (str): Tournament folder name
+        filename (str): File path relative to the tournament folder
+
+    Returns:
+        bool: True if the file was sent, False if it does not exist
+    """
+    folder = os.path.abspath(os.path.join("rendered", "tournaments", folder_name))
+    path = safe_join(folder, filename)
+    if path is None:
+        return False
+    loop = asyncio.get_running_loop()
+    located = await loop.run_in_executor(_executor, locate_static, path, accepted_encodings(scope))
+    if located is None:
+        return False
+    variant, encoding, stat_result, etag = located
+    headers = [
+        (b"etag", f'"{etag}"'.encode("latin-1")),
+        (b"last-modified", formatdate(stat_result.st_mtime, usegmt=True).encode("latin-1")),
+        (b"cache-control", b"no-cache"),
+        (b"vary", b"Accept-Encoding"),
+    ]
+    if not_modified(scope, etag, stat_result.st_mtime):
+        await send({"type": "http.response.start", "status": 304, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
+        return True
+    content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    if content_type.startswith("text/"):
+        content_type += "; charset=utf-8"
+    headers.append((b"content-type", content_type.encode("latin-1")))
+    headers.append((b"content-length", str(stat_result.st_size).encode("latin-1")))
+    if encoding:
+        headers.append((b"content-encoding", encoding.encode("latin-1")))
+    await send({"type": "http.response.start", "status": 200, "headers": headers})
+    if scope["method"] == "HEAD":
+        await send({"type": "http.response.body", "body": b""})
+        return True
+    f = await loop.run_in_executor(_executor, open, variant, "rb")
+    with f:
+        while True:
+            chunk = await loop.run_in_executor(_executor, f.read, CHUNK_SIZE)
+            more = len(chunk) == CHUNK_SIZE
+            await send({"type": "http.response.body", "body": chunk, "more_body": more})
+            if not more:
+                break
+    return True
+
+async def wait_for_disconnect(receive):
+    """Consume the request body and wait until the client disconnects."""
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+async def stream_events(receive, send, folder_name):
+    """
+    Stream a tournament's live result events as Server-Sent Events.
+
+    Args:
+        receive (callable): ASGI receive function, watched for disconnects
+        send (callable): ASGI send function
+        folder_name (str): Tournament folder name
+    """
+    subscriber = live_events.subscribe_async(folder_name)
+    events = subscriber[1]
+    disconnected = asyncio.ensure_future(wait_for_disconnect(receive))
+    try:
+        await send({"type": "http.response.start", "status": 200, "headers": [
+            (b"content-type", b"text/event-stream; charset=utf-8"),
+            (b"cache-control", b"no-cache"),
+            (b"x-accel-buffering", b"no"),
+        ]})
+        message = f"retry: {live_events.RETRY_MILLISECONDS}\n\n"
+        while message is not None:
+            await send({"type": "http.response.body", "body": message.encode("utf-8"), "more_body": True})
+            next_event = asyncio.ensure_future(events.get())
+            done, _ = await asyncio.wait({next_event, disconnected}, timeout=live_events.KEEPALIVE_SECONDS,
+                                         return_when=asyncio.FIRST_COMPLETED)
+            if disconnected in done:
+                next_event.cancel()
+                break
+            if next_event in done:
+                message = next_event.result()
+            else:
+                next_event.cancel()
+                message = ": keep-alive\n\n"
+        await send({"type": "http.response.body", "body": b""})
+    finally:
+        disconnected.cancel()
+        live_events.unsubscribe_async(folder_name, subscriber)
+
+def build_environ(scope, body):
+    """
+    Build a WSGI environ for an ASGI HTTP request.
+
+    Args:
+        scope (dict): ASGI HTTP scope
+        body (bytes): Complete request body
+
+    Returns:
+        dict: WSGI environ
+    """
+    server_name, server_port = scope.get("server") or ("localhost", PORT)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", ""),
+        "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope["query_string"].decode("latin-1"),
+        "SERVER_NAME": server_name,
+        "SERVER_PORT": str(server_port),
+        "SERVER_PROTOCOL": f"HTTP/{scope['http_version']}",
+        "REMOTE_ADDR": scope["client"][0] if scope.get("client") else "",
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+    for key, value in scope["headers"]:
+        name = key.decode("latin-1").upper().replace("-", "_")
+        value = value.decode("latin-1")
+        if name == "CONTENT_TYPE":
+            environ["CONTENT_TYPE"] = value
+        elif name != "CONTENT_LENGTH":
+            name = f"HTTP_{name}"
+            environ[name] = f"{environ[name]},{value}" if name in environ else value
+    return environ
+
+def run_wsgi(environ, loop, chunks, cancelled):
+    """
+    Run the Flask app for one request and hand its response to the event loop.
+
+    The whole response is produced on this one pool thread, because the
+    app's iterable may use thread-bound resources such as the pooled SQLite
+    connection. Items put on chunks are ("start", status, headers),
+    ("body", bytes) and finally ("end",). The queue is bounded, so a slow
+    client holds the app back instead of the response piling up in memory.
+    """
+    response = {}
+
+    def start_response(status, headers, exc_info=None):
+        response["status"] = int(status.split(" ", 1)[0])
+        response["headers"] = [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers]
+        return lambda data: None
+
+    def put(item):
+        if not cancelled.is_set():
+            asyncio.run_coroutine_threadsafe(chunks.put(item), loop).result()
+
+    result = server.app(environ, start_response)
+    try:
+        started = False
+        for chunk in result:
+            if cancelled.is_set():
+                return
+            if not started:
+                put(("start", response["status"], response["headers"]))
+                started = True
+            if chunk:
+                put(("body", chunk))
+        if not started:
+            put(("start", response["status"], response["headers"]))
+        put(("end",))
+    finally:
+        if hasattr(result, "close"):
+            result.close()
+
+async def call_wsgi(scope, receive, send):
+    """
+    Hand a request to the Flask app on the thread pool.
+
+    The response is forwarded chunk by chunk as the app yields it, so
+    streamed responses such as the results export are never held in
+    memory whole.
+    """
+    body = b""
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get("body", b"")
+        more_body = message.get("more_body", False)
+    loop = asyncio.get_running_loop()
+    chunks = asyncio.Queue(maxsize=WSGI_QUEUE_CHUNKS)
+    cancelled = threading.Event()
+    worker = loop.run_in_executor(_executor, run_wsgi, build_environ(scope, body), loop, chunks, cancelled)
+    try:
+        while True:
+            getter = asyncio.ensure_future(chunks.get())
+            await asyncio.wait({getter, worker}, return_when=asyncio.FIRST_COMPLETED)
+            if not getter.done() and chunks.empty():
+                # The app failed before finishing its response.
+                getter.cancel()
+                await worker
+                raise RuntimeError("WSGI response ended without completing")
+            item = await getter
+            if item[0] == "start":
+                await send({"type": "http.response.start", "status": item[1], "headers": item[2]})
+            elif item[0] == "body":
+                await send({"type": "http.response.body", "body": item[1], "more_body": True})
+            else:
+                await send({"type": "http.response.body", "body": b""})
+                break
+    finally:
+        # Unblock a worker waiting for queue space so it can close the response.
+        cancelled.set()
+        while not worker.done():
+            while not chunks.empty():
+                chunks.get_nowait()
+            await asyncio.wait({worker}, timeout=0.05)
+        await worker
+
+async def lifespan(receive, send):
+    """Answer the ASGI lifespan protocol."""
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            _executor.shutdown(wait=False)
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+async def app(scope, receive, send):
+    """ASGI entry point."""
+    if scope["type"] == "lifespan":
+        await lifespan(receive, send)
+        return
+    if scope["type"] != "http":
+        return
+    match = TOURNAMENT_PATH.fullmatch(scope["path"])
+    if match and scope["method"] in ("GET", "HEAD"):
+        folder_name, filename = match.group(1), match.group(2) or "index.html"
+        if filename == "events":
+            await stream_events(receive, send, folder_name)
+            return
+        # Dynamic pages are rendered by the Flask app; files on disk are sent here.
+        if not (server.DYNAMIC_PAGES and filename.endswith(".html")):
+            if await send_static(scope, send, folder_name, filename):
+                return
+    await call_wsgi(scope, receive, send)
+
+if __name__ == "__main__":
+    try:
+        import uvicorn
+    except ImportError:
+        print("uvicorn is not installed. Install it with: pip install uvicorn")
+        sys.exit(1)
+    try:
+        from schema import initialize_database
+        print("Initializing database...")
+        initialize_database()
+    except Exception as e:
+        print(f"Error initializing database: {e}")
+    uvicorn.run(app, host="0.0.0.0", port=PORT, log_level="warning", backlog=4096)
@@ -0,0 +1,186 @@
+"""
+auto_publish.py - Automatic publishing for Direktor EXE Scrabble Tournament Manager
+
+When auto-publish is on, every committed result or pairing marks the pages
+it affects as dirty. The PublishQueue collects them and decides when a
+publish job should run: once entry has paused for the debounce interval,
+or earlier if waiting longer would break the latency budget, the time
+allowed between a result being entered and its pages being online. The
+job re-renders the dirty pages and pushes them to one target:
+
+    folder  copies the pages into another local folder
+    ftp     mirrors changed files with ftp_sync.sync_folder()
+    server  PUTs the pages to a server.py instance with a publish token
+"""
+
+import os
+import time
+import shutil
+import threading
+import urllib.parse
+import urllib.request
+
+from render_pipeline import compressed_variants, create_temp_file
+
+AUTO_PUBLISH_DEBOUNCE = 2.0   # Seconds without new results before publishing
+AUTO_PUBLISH_BUDGET = 15.0    # Seconds from the first unpublished result to its pages being online
+HTTP_TIMEOUT = 30
+
+class PublishQueue:
+    """
+    Dirty pages waiting to be published.
+
+    Args:
+        debounce (float): Seconds without new marks before a job is due
+        budget (float): Latency budget in seconds
+    """
+
+    def __init__(self, debounce=AUTO_PUBLISH_DEBOUNCE, budget=AUTO_PUBLISH_BUDGET):
+        self.debounce = debounce
+        self.budget = budget
+        self.expected_duration = 0.0  # Running average of job durations
+        self._pending = set()
+        self._in_flight = 0
+        self._first = None
+        self._last = None
+        self._lock = threading.Lock()
+
+    def mark(self, filenames, now=None):
+        """Mark pages dirty."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if not self._pending:
+                self._first = now
+            self._pending.update(filenames)
+            self._last = now
+
+    def due(self, now=None):
+        """
+        Check whether a publish job should start now.
+
+        A job is due after the debounce interval without new marks, or when
+        the oldest dirty page would otherwise miss the latency budget, given
+        how long recent jobs took.
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if not self._pending or self._in_flight:
+                return False
+            if now - self._last >= self.debounce:
+                return True
+            return now - self._first >= max(0.0, self.budget - self.expected_duration)
+
+    def take(self):
+        """
+        Remove the dirty pages for a job.
+
+        Returns:
+            tuple: (set of page file names, monotonic time the oldest was marked)
+        """
+        with self._lock:
+            pages, first = self._pending, self._first
+            self._pending = set()
+            self._in_flight = len(pages)
+            self._first = self._last = None
+            return pages, first
+
+    def finished(self, seconds):
+        """Record that the running job succeeded after the given number of seconds."""
+        with self._lock:
+            self._in_flight = 0
+            self.expected_duration = seconds if not self.expected_duration else \
+                0.7 * self.expected_duration + 0.3 * seconds
+
+    def failed(self, pages, now=None):
+        """Put the pages of a failed job back in the queue."""
+        with self._lock:
+            self._in_flight = 0
+        if pages:
+            self.mark(pages, now)
+
+    def depth(self):
+        """Number of pages waiting or being published."""
+        with self._lock:
+            return len(self._pending) + self._in_flight
+
+def page_variants(src_dir, filenames):
+    """
+    List the files to push for some pages: each page and its precompressed copies.
+
+    Args:
+        src_dir (str): Rendered tournament folder
+        filenames (iterable): Page file names
+
+    Returns:
+        list: Existing file names relative to src_dir
+    """
+    files = []
+    for filename in sorted(filenames):
+        for suffix in [""] + [suffix for suffix, _ in compressed_variants()]:
+            if os.path.isfile(os.path.join(src_dir, filename + suffix)):
+                files.append(filename + suffix)
+    return files
+
+def publish_to_folder(src_dir, files, dest_dir, task=None):
+    """
+    Copy files into another folder, replacing each one atomically.
+
+    Returns:
+        int: Number of bytes copied
+    """
+    copied = 0
+    os.makedirs(dest_dir, exist_ok=True)
+    for done, name in enumerate(files, start=1):
+        if task:
+            task.check_cancelled()
+        dest = os.path.join(dest_dir, name)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        fd, tmp_path = create_temp_file(os.path.dirname(dest))
+        os.close(fd)
+        try:
+            shutil.copyfile(os.path.join(src_dir, name), tmp_path)
+            os.replace(tmp_path, dest)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        copied += os.path.getsize(dest)
+        if task:
+            task.report(done, len(files), f"{done}/{len(files)} files")
+    return copied
+
+def publish_to_server(src_dir, files, server_url, folder_name, token, task=None):
+    """
+    Upload files to server.py's PUT /api/publish endpoint.
+
+    Args:
+        src_dir (str): Rendered tournament folder
+        files (list): File names relative to src_dir
+        server_url (str): Server base URL, e.g. https://example.onrender.com
+        folder_name (str): Tournament folder name on the server
+        token (str): The server's PUBLISH_TOKEN
+        task (Task): Optional background task for progress and cancellation
+
+    Returns:
+        int: Number of bytes uploaded
+
+    Raises:
+        urllib.error.URLError: If an upload fails
+    """
+    sent = 0
+    base = server_url.rstrip("/") + "/api/publish/" + urllib.parse.quote(folder_name)
+    for done, name in enumerate(files, start=1):
+        if task:
+            task.check_cancelled()
+        with open(os.path.join(src_dir, name), "rb") as f:
+            body = f.read()
+        upload = urllib.request.Request(f"{base}/{urllib.parse.quote(name)}", data=body, method="PUT", headers={
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/octet-stream",
+        })
+        with urllib.request.urlopen(upload, timeout=HTTP_TIMEOUT) as response:
+            response.read()
+        sent += len(body)
+        if task:
+            task.report(done, len(files), f"{done}/{len(files)} files")
+    return sent
@@ -0,0 +1,81 @@
+"""
+bench_optimal_pairing.py - Optimal Matching pairing benchmark for Direktor EXE
+
+Simulates a Swiss-style event with seeded random scores and times how long
+the Optimal Matching system takes to pair each round. The run fails when
+any round takes longer than the time budget (one second for 300 players
+by default).
+
+Usage:
+    python benchmarks/bench_optimal_pairing.py [--players 300] [--rounds 12] [--budget 1.0]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+# Add the repository root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pairings import optimal_pairings, record_pairings
+
+def simulate(num_players, num_rounds, seed):
+    """
+    Pair and score a synthetic event round by round.
+
+    Args:
+        num_players (int): Number of players
+        num_rounds (int): Number of rounds to pair
+        seed (int): Random seed for scores
+
+    Returns:
+        tuple: (list of per-round pairing times in seconds, number of rematches)
+    """
+    rng = random.Random(seed)
+    random.seed(seed)
+    stats = {f"Player {i}": [0, 0] for i in range(1, num_players + 1)}
+    completed_rounds = {}
+    history = {}
+    timings = []
+    for round_num in range(1, num_rounds + 1):
+        players = [(i, name, 0, wins, 0, spread) for i, (name, (wins, spread)) in enumerate(stats.items())]
+        start = time.perf_counter()
+        pairings = optimal_pairings(players, completed_rounds, history)
+        timings.append(time.perf_counter() - start)
+        completed_rounds[round_num] = pairings
+        record_pairings(history, pairings)
+        for p1, p2, _ in pairings:
+            if "BYE" in (p1, p2):
+                stats[p1 if p2 == "BYE" else p2][0] += 1
+                continue
+            score1, score2 = rng.randint(250, 550), rng.randint(250, 550)
+            stats[p1][0] += 1 if score1 > score2 else 0.5 if score1 == score2 else 0
+            stats[p2][0] += 1 if score2 > score1 else 0.5 if score1 == score2 else 0
+            stats[p1][1] += score1 - score2
+            stats[p2][1] += score2 - score1
+    rematches = sum(count - 1 for count in history.values() if count > 1)
+    return timings, rematches
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Optimal Matching pairing system.")
+    parser.add_argument("--players", type=int, default=300)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--budget", type=float, default=1.0, help="Maximum seconds allowed per round")
+    parser.add_argument("--seed", type=int, default=2025)
+    args = parser.parse_args()
+
+    timings, rematches = simulate(args.players, args.rounds, args.seed)
+    for round_num, seconds in enumerate(timings, start=1):
+        print(f"Round {round_num:>3}: {seconds * 1000:8.1f} ms")
+    worst = max(timings)
+    print(f"{args.players} players, {args.rounds} rounds: worst {worst * 1000:.1f} ms, "
+          f"mean {sum(timings) / len(timings) * 1000:.1f} ms, rematches {rematches}")
+    if worst > args.budget:
+        print(f"FAIL: slowest round exceeded the {args.budget:.2f} s budget")
+        sys.exit(1)
+    print(f"OK: every round paired within {args.budget:.2f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""
+bench_tournament.py - Pairing, stats, render and .tou benchmark for Direktor EXE
+
+Builds synthetic events of every requested size with seeded random scores
+and times:
+
+  • each pairing system on the standings before a sample of rounds
+    spread over the event (every round with --pairing-rounds 0),
+  • utils.recalculate_player_stats over the finished event,
+  • a full render of the event's pages and an unchanged re-render, the
+    work generate_tournament_html does once the players are read from the
+    database,
+  • saving and loading the event as a .tou file.
+
+The results are written as JSON. Pass an earlier results file as
+--baseline to flag every timing that got slower than the tolerance allows;
+the run then fails, so it can gate a release.
+
+Usage:
+    python benchmarks/bench_tournament.py [--players 16 100 500 2000] [--rounds 7 15 40]
+        [--output bench_results.json] [--baseline previous.json] [--tolerance 0.25]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import subprocess
+
+# Add the repository root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pairings import (create_round_robin_schedule, round_robin_pairing_round, round_robin_round_count,
+                      random_pairings, king_of_the_hills_pairings, australian_draw_pairings,
+                      lagged_australian_pairings, optimal_pairings, record_pairings)
+from utils import recalculate_player_stats
+from site_templates import tournament_pages
+from render_pipeline import render_pages
+from tou_format import write_tou, read_tou
+
+PAIRING_SYSTEMS = ["Round Robin", "Random Pairing", "King of the Hills Pairing",
+                   "Australian Draw", "Lagged Australian", "Optimal Matching"]
+DRIVER = "Australian Draw"  # System whose pairings are played, so standings evolve like a real event
+
+def synthetic_players(num_players, seed):
+    """
+    Create player rows as returned by get_players_for_tournament, with no games played.
+
+    Args:
+        num_players (int): Number of players
+        seed (int): Random seed for ratings and countries
+
+    Returns:
+        list: (id, name, rating, wins, losses, spread, last_result, scorecard, team, player_number, country) tuples
+    """
+    rng = random.Random(seed)
+    countries = ["ng", "gh", "ke", "gb", "us", "au", "my", "th"]
+    return [(i, f"Player {i}", rng.randint(800, 2200), 0, 0, 0, "", "[]", "", i, rng.choice(countries))
+            for i in range(1, num_players + 1)]
+
+def pair_with(system, players, round_num, completed_rounds, results_by_round, history, schedule):
+    """Pair one round with the named system, as the desktop app does."""
+    if system == "Round Robin":
+        return round_robin_pairing_round(schedule, round_num)
+    if system == "Random Pairing":
+        return random_pairings(players)
+    if system == "King of the Hills Pairing":
+        return king_of_the_hills_pairings(players)
+    if system == "Australian Draw":
+        return australian_draw_pairings(players, completed_rounds, history)
+    if system == "Lagged Australian":
+        return lagged_australian_pairings(players, round_num - 1, results_by_round, completed_rounds, history)
+    return optimal_pairings(players, completed_rounds, history)
+
+def summarize(timings):
+    """Reduce a list of timings in seconds to total, mean and max."""
+    return {"total": sum(timings), "mean": sum(timings) / len(timings), "max": max(timings)}
+
+def sample_rounds(num_rounds, count):
+    """Pick up to count round numbers spread evenly from the first to the last round; 0 picks all."""
+    if count <= 0 or count >= num_rounds:
+        return set(range(1, num_rounds + 1))
+    if count == 1:
+        return {1}
+    return {1 + round(i * (num_rounds - 1) / (count - 1)) for i in range(count)}
+
+def bench_event(num_players, num_rounds, seed, systems, pairing_rounds=0):
+    """
+    Simulate one event and time every stage.
+
+    The event is paired with the DRIVER system and every pairing system is
+    timed on the same standings, so all systems see identical inputs.
+
+    Args:
+        num_players (int): Number of players
+        num_rounds (int): Number of rounds
+        seed (int): Random seed for ratings, pairings and scores
+        systems (list): Pairing systems to time
+        pairing_rounds (int): Number of rounds the pairing systems are timed
+            on, spread over the event; 0 times every round
+
+    Returns:
+        dict: Timings in seconds and sizes for the event
+    """
+    rng = random.Random(seed)
+    random.seed(seed)
+    players = synthetic_players(num_players, seed)
+    names = [p[1] for p in players]
+    stats = {name: [0, 0, 0] for name in names}  # wins, losses, spread
+    completed_rounds = {}
+    results_by_round = {}
+    history = {}
+    per_cycle = num_players - 1 + num_players % 2
+    cycles = 1 if num_rounds <= per_cycle else 2 if num_rounds <= per_cycle * 2 else 4
+    schedule = None
+    pairing_timings = {system: [] for system in systems}
+    timed_rounds = sample_rounds(num_rounds, pairing_rounds)
+
+    for round_num in range(1, num_rounds + 1):
+        standings = [p[:3] + tuple(stats[p[1]]) + p[6:] for p in players]
+        schedule_seconds = 0
+        if round_num == 1 and "Round Robin" in systems:
+            # Building the schedule counts towards the first round robin round.
+            start = time.perf_counter()
+            schedule = create_round_robin_schedule(names, seed=seed, cycles=cycles)
+            schedule_seconds = time.perf_counter() - start
+        played = None
+        for system in systems:
+            if round_num not in timed_rounds:
+                break
+            if system == "Round Robin" and round_num > round_robin_round_count(schedule):
+                continue
+            start = time.perf_counter()
+            pairings = pair_with(system, standings, round_num, completed_rounds, results_by_round, history, schedule)
+            pairing_timings[system].append(time.perf_counter() - start + (schedule_seconds if system == "Round Robin" else 0))
+            if system == DRIVER:
+                played = pairings
+        if played is None:
+            played = pair_with(DRIVER, standings, round_num, completed_rounds, results_by_round, history, schedule)
+        completed_rounds[round_num] = played
+        record_pairings(history, played)
+        round_results = []
+        for p1, p2, _ in played:
+            if "BYE" in (p1, p2):
+                round_results.append(None)
+                continue
+            score1, score2 = rng.randint(250, 550), rng.randint(250, 550)
+            round_results.append((score1, score2))
+            for name, own, other in ((p1, score1, score2), (p2, score2, score1)):
+                stats[name][0] += 1 if own > other else 0.5 if own == other else 0
+                stats[name][1] += 1 if own < other else 0.5 if own == other else 0
+                stats[name][2] += own - other
+        results_by_round[round_num] = round_results
+
+    start = time.perf_counter()
+    final_players = recalculate_player_stats(players, completed_rounds, results_by_round)
+    recalc_seconds = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory(prefix="direktor-bench-") as folder:
+        site = os.path.join(folder, "site")
+        os.makedirs(site)
+        page_args = (1, "Benchmark Open", "2026-01-01", "Benchmark Hall", final_players,
+                     completed_rounds, [], "http://127.0.0.1:8000/tournaments/Benchmark_Open")
+        start = time.perf_counter()
+        full = render_pages(site, tournament_pages(*page_args))
+        full_seconds = time.perf_counter() - start
+        # Nothing changed, so every page is skipped by its input hash.
+        start = time.perf_counter()
+        render_pages(site, tournament_pages(*page_args))
+        rerender_seconds = time.perf_counter() - start
+
+        tou_path = os.path.join(folder, "benchmark.tou")
+        data = {
+            "tournament": {"id": 1, "name": "Benchmark Open", "date": "2026-01-01", "venue": "Benchmark Hall"},
+            "players": [{"name": p[1], "rating": p[2], "wins": p[3], "losses": p[4], "spread": p[5],
+                         "last_result": p[6], "scorecard": p[7], "team": p[8], "player_number": p[9],
+                         "country": p[10]} for p in final_players],
+            "progress": {"current_round_number": num_rounds, "completed_rounds": completed_rounds,
+                         "results_by_round": results_by_round, "last_pairing_system": DRIVER},
+        }
+        start = time.perf_counter()
+        write_tou(tou_path, data)
+        save_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        loaded = read_tou(tou_path)
+        load_seconds = time.perf_counter() - start
+        if len(loaded["players"]) != num_players or len(loaded["progress"]["completed_rounds"]) != num_rounds:
+            raise RuntimeError("The .tou file did not load back the event that was saved")
+        tou_bytes = os.path.getsize(tou_path)
+
+    return {
+        "players": num_players,
+        "rounds": num_rounds,
+        "pairing": {system: summarize(timings) for system, timings in pairing_timings.items() if timings},
+        "recalculate_player_stats": recalc_seconds,
+        "render": {"full": full_seconds, "pages": full["written"], "bytes": full["bytes"],
+                   "unchanged": rerender_seconds},
+        "tou": {"save": save_seconds, "load": load_seconds, "bytes": tou_bytes},
+    }
+
+def flatten_timings(event):
+    """Map each timing of an event result to a dotted name, e.g. "pairing.Random Pairing.mean"."""
+    timings = {
+        "recalculate_player_stats": event["recalculate_player_stats"],
+        "render.full": event["render"]["full"],
+        "render.unchanged": event["render"]["unchanged"],
+        "tou.save": event["tou"]["save"],
+        "tou.load": event["tou"]["load"],
+    }
+    for system, summary in event["pairing"].items():
+        timings[f"pairing.{system}.mean"] = summary["mean"]
+        timings[f"pairing.{system}.max"] = summary["max"]
+    return timings
+
+def compare(results, baseline, tolerance, floor):
+    """
+    Find timings that regressed against a baseline results file.
+
+    Args:
+        results (dict): Results of this run
+        baseline (dict): Results of an earlier run
+        tolerance (float): Allowed slowdown, e.g. 0.25 for 25%
+        floor (float): Timings below this many seconds in both runs are ignored as noise
+
+    Returns:
+        list: Descriptions of the regressions
+    """
+    previous = {(e["players"], e["rounds"]): flatten_timings(e) for e in baseline.get("events", [])}
+    regressions = []
+    for event in results["events"]:
+        old = previous.get((event["players"], event["rounds"]))
+        if old is None:
+            continue
+        for name, seconds in flatten_timings(event).items():
+            before = old.get(name)
+            if before is None or max(before, seconds) < floor:
+                continue
+            if seconds > before * (1 + tolerance):
+                regressions.append(f"{event['players']} players x {event['rounds']} rounds, {name}: "
+                                   f"{before * 1000:.1f} ms -> {seconds * 1000:.1f} ms")
+    return regressions
+
+def git_revision():
+    """Return the current git commit of the repository, or None outside a checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pairing, stats, rendering and .tou files on synthetic events.")
+    parser.add_argument("--players", type=int, nargs="+", default=[16, 100, 500, 2000])
+    parser.add_argument("--rounds", type=int, nargs="+", default=[7, 15, 40])
+    parser.add_argument("--systems", nargs="+", default=PAIRING_SYSTEMS, choices=PAIRING_SYSTEMS, metavar="SYSTEM",
+                        help="Pairing systems to time (default: all)")
+    parser.add_argument("--pairing-rounds", type=int, default=5,
+                        help="Rounds per event the pairing systems are timed on; 0 times every round")
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--output", default="bench_results.json", help="JSON file the results are written to")
+    parser.add_argument("--baseline", help="Earlier results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown against the baseline")
+    parser.add_argument("--floor", type=float, default=0.005, help="Ignore timings below this many seconds")
+    args = parser.parse_args()
+
+    results = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "pairing_rounds": args.pairing_rounds,
+        "events": [],
+    }
+    for num_players in args.players:
+        for num_rounds in args.rounds:
+            event = bench_event(num_players, num_rounds, args.seed, args.systems, args.pairing_rounds)
+            results["events"].append(event)
+            pairing = ", ".join(f"{system} {summary['mean'] * 1000:.1f}" for system, summary in event["pairing"].items())
+            print(f"{num_players:>5} players x {num_rounds:>2} rounds: pairing ms/round [{pairing}]")
+            print(f"{'':>23} recalc {event['recalculate_player_stats'] * 1000:.1f} ms, "
+                  f"render {event['render']['pages']} pages in {event['render']['full'] * 1000:.1f} ms "
+                  f"(unchanged {event['render']['unchanged'] * 1000:.1f} ms), "
+                  f".tou save {event['tou']['save'] * 1000:.1f} ms / load {event['tou']['load'] * 1000:.1f} ms")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance, args.floor)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        if regressions:
+            print(f"FAIL: {len(regressions)} timings slower than the baseline by more than {args.tolerance:.0%}")
+            sys.exit(1)
+        print("OK: no timing regressed against the baseline")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+load_test.py - HTTP load test for the Direktor EXE results site
+
+Fires keep-alive GET requests at one page from many concurrent clients
+while optionally holding Server-Sent Events streams open, and reports
+throughput and latency. Run it once against each server to compare them:
+
+    gunicorn server:app --bind 127.0.0.1:8000
+    python benchmarks/load_test.py --url http://127.0.0.1:8000/tournaments/<name>/index.html --sse 200
+
+    python asgi_server.py
+    python benchmarks/load_test.py --url http://127.0.0.1:8000/tournaments/<name>/index.html --sse 200
+
+Only the standard library is used.
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+from urllib.parse import urlsplit
+
+async def read_response(reader):
+    """
+    Read one HTTP/1.1 response from a keep-alive connection.
+
+    Args:
+        reader (asyncio.StreamReader): Connection reader
+
+    Returns:
+        tuple: (status code, headers dict, body bytes)
+    """
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("Connection closed by server")
+    status = int(status_line.split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        body = b""
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                await reader.readline()
+                break
+            body += await reader.readexactly(size)
+            await reader.readline()
+    elif "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+    elif status == 304 or status < 200:
+        body = b""
+    else:
+        body = await reader.read()
+    return status, headers, body
+
+async def client(url, requests, latencies, stats, use_gzip, use_etag):
+    """Send requests over one keep-alive connection, reconnecting when the server closes it."""
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    etag = None
+    reader = writer = None
+    for _ in range(requests):
+        if writer is None:
+            reader, writer = await asyncio.open_connection(parts.hostname, parts.port or 80)
+        headers = [f"GET {path} HTTP/1.1", f"Host: {parts.netloc}", "Connection: keep-alive"]
+        if use_gzip:
+            headers.append("Accept-Encoding: gzip")
+        if use_etag and etag:
+            headers.append(f"If-None-Match: {etag}")
+        start = time.perf_counter()
+        try:
+            writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1"))
+            status, response_headers, body = await read_response(reader)
+        except (ConnectionError, asyncio.IncompleteReadError, OSError):
+            stats["errors"] += 1
+            writer.close()
+            writer = None
+            continue
+        latencies.append(time.perf_counter() - start)
+        stats["bytes"] += len(body)
+        stats["statuses"][status] = stats["statuses"].get(status, 0) + 1
+        etag = response_headers.get("etag", etag)
+        if response_headers.get("connection", "").lower() == "close":
+            writer.close()
+            writer = None
+    if writer is not None:
+        writer.close()
+
+async def hold_event_stream(url, stats, stop):
+    """Open a Server-Sent Events stream and keep reading it until stopped."""
+    parts = urlsplit(url)
+    try:
+        reader, writer = await asyncio.open_connection(parts.hostname, parts.port or 80)
+        writer.write(f"GET {parts.path} HTTP/1.1\r\nHost: {parts.netloc}\r\nAccept: text/event-stream\r\n\r\n".encode("latin-1"))
+        status_line = await reader.readline()
+        if b" 200 " not in status_line:
+            stats["sse_failed"] += 1
+            writer.close()
+            return
+        stats["sse_open"] += 1
+        while not stop.is_set():
+            try:
+                if not await asyncio.wait_for(reader.readline(), timeout=1):
+                    break
+            except asyncio.TimeoutError:
+                continue
+        writer.close()
+    except OSError:
+        stats["sse_failed"] += 1
+
+def percentile(values, fraction):
+    """Return the value below which the given fraction of values fall."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+async def run(args):
+    latencies = []
+    stats = {"errors": 0, "bytes": 0, "statuses": {}, "sse_open": 0, "sse_failed": 0}
+    stop = asyncio.Event()
+    events_url = args.events_url or args.url.rsplit("/", 1)[0] + "/events"
+    streams = [asyncio.ensure_future(hold_event_stream(events_url, stats, stop)) for _ in range(args.sse)]
+    if streams:
+        await asyncio.sleep(args.warmup)
+    per_client = max(1, args.requests // args.concurrency)
+    start = time.perf_counter()
+    await asyncio.gather(*(client(args.url, per_client, latencies, stats, args.gzip, args.etag)
+                           for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await asyncio.gather(*streams)
+    return latencies, stats, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the tournament results site.")
+    parser.add_argument("--url", required=True, help="Page to request, e.g. http://127.0.0.1:8000/tournaments/<name>/index.html")
+    parser.add_argument("--requests", type=int, default=5000, help="Total number of page requests")
+    parser.add_argument("--concurrency", type=int, default=100, help="Number of concurrent keep-alive clients")
+    parser.add_argument("--sse", type=int, default=0, help="Number of event streams held open during the test")
+    parser.add_argument("--events-url", help="Event stream URL (defaults to <page folder>/events)")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Seconds to wait for event streams to connect")
+    parser.add_argument("--gzip", action="store_true", help="Send Accept-Encoding: gzip")
+    parser.add_argument("--etag", action="store_true", help="Revalidate with If-None-Match after the first response")
+    args = parser.parse_args()
+
+    latencies, stats, elapsed = asyncio.run(run(args))
+    completed = len(latencies)
+    print(f"URL:          {args.url}")
+    print(f"Requests:     {completed} ok, {stats['errors']} errors in {elapsed:.2f} s ({completed / elapsed:.0f} req/s)")
+    print(f"Latency:      p50 {percentile(latencies, 0.50) * 1000:.1f} ms, p95 {percentile(latencies, 0.95) * 1000:.1f} ms, "
+          f"p99 {percentile(latencies, 0.99) * 1000:.1f} ms")
+    print(f"Statuses:     {', '.join(f'{code}: {count}' for code, count in sorted(stats['statuses'].items()))}")
+    print(f"Body bytes:   {stats['bytes']}")
+    if args.sse:
+        print(f"Event streams: {stats['sse_open']} open, {stats['sse_failed']} failed")
+    if stats["errors"] or stats["sse_failed"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -82,3 +82,12 @@ def update_player_stats(player_id, wins, losses, spread, last_result, scorecard)
     """
     execute_query(query, (wins, losses, spread, last_result, scorecard, player_id))
 
+def get_players_by_name(tournament_id, names):
+    """Get the players of a tournament with the given names."""
+    placeholders = ", ".join("?" for _ in names)
+    query = f"""
+    SELECT id, name, rating, wins, losses, spread, last_result, scorecard, team, player_number, country
+    FROM players
+    WHERE tournament_id = ? AND name IN ({placeholders})
+    """
+    return execute_query(query, (tournament_id, *names), fetch="all")
@@ -2,12 +2,55 @@
 database_utils.py - Database utility functions for Direktor EXE Scrabble Tournament Manager
 
 This module provides database connection and query execution utilities.
+
+Connections are pooled and shared by the GUI, the Flask server and
+data/database.py: SQLite connections are kept open per thread and reused,
+while PostgreSQL (the DATABASE_URL path) draws from a bounded pool.
 """
 
 import os
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 import psycopg2
-from psycopg2.extras import DictCursor
+from psycopg2 import pool as pg_pool
+from psycopg2.extras import DictCursor, execute_batch
+
+SQLITE_DATABASE_FILE = "direktor.db"
+
+# Pool sizing for the PostgreSQL path; override through the environment on Render.
+DB_POOL_MIN = int(os.environ.get("DB_POOL_MIN", 1))
+DB_POOL_MAX = int(os.environ.get("DB_POOL_MAX", 10))
+DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", 30))
+
+_thread_local = threading.local()
+_pool_lock = threading.Lock()
+_stats_lock = threading.Lock()
+_postgres_pool = None
+_postgres_slots = None
+_stats = {
+    "sqlite_connections": 0,
+    "postgres_in_use": 0,
+    "acquisitions": 0,
+    "total_wait": 0.0,
+    "max_wait": 0.0,
+}
+
+class _ThreadConnections(dict):
+    """Per-thread SQLite connections, keyed by database path."""
+
+    def __del__(self):
+        # Runs when the owning thread exits; the connections close with the dict.
+        with _stats_lock:
+            _stats["sqlite_connections"] -= len(self)
+
+def _record_wait(seconds):
+    with _stats_lock:
+        _stats["acquisitions"] += 1
+        _stats["total_wait"] += seconds
+        if seconds > _stats["max_wait"]:
+            _stats["max_wait"] = seconds
 
 def create_connection_postgres(database_url):
     """Create a database connection to a PostgreSQL database."""
@@ -20,49 +63,212 @@ def create_connection_postgres(database_url):
         return None
 
 def get_db_connection():
-    """Get the appropriate database connection based on environment."""
+    """
+    Get a new, unpooled database connection based on environment.
+
+    The caller owns the connection and must close it. Prefer
+    pooled_connection() or execute_query() for regular queries.
+    """
     database_url = os.environ.get("DATABASE_URL")
     if database_url:
         # We're on Render, use PostgreSQL
         return create_connection_postgres(database_url)
     else:
         # We're local, use SQLite
-        return sqlite3.connect("direktor.db")
+        return sqlite3.connect(SQLITE_DATABASE_FILE)
+
+def get_sqlite_connection(database_file=SQLITE_DATABASE_FILE):
+    """
+    Get the calling thread's SQLite connection, opening it on first use.
+
+    The connection is reused by every later call from the same thread and
+    must not be closed by the caller.
+
+    Args:
+        database_file (str): Path to the SQLite database file
+
+    Returns:
+        sqlite3.Connection: Thread-local connection
+    """
+    connections = getattr(_thread_local, "sqlite", None)
+    if connections is None:
+        connections = _ThreadConnections()
+        _thread_local.sqlite = connections
+    conn = connections.get(database_file)
+    if conn is None:
+        start = time.perf_counter()
+        conn = sqlite3.connect(database_file)
+        _record_wait(time.perf_counter() - start)
+        connections[database_file] = conn
+        with _stats_lock:
+            _stats["sqlite_connections"] += 1
+    else:
+        _record_wait(0.0)
+    return conn
+
+def _get_postgres_pool(database_url):
+    global _postgres_pool, _postgres_slots
+    with _pool_lock:
+        if _postgres_pool is None:
+            _postgres_pool = pg_pool.ThreadedConnectionPool(DB_POOL_MIN, DB_POOL_MAX, database_url)
+            _postgres_slots = threading.BoundedSemaphore(DB_POOL_MAX)
+        return _postgres_pool
+
+@contextmanager
+def pooled_connection():
+    """
+    Borrow a pooled connection for the current backend.
+
+    SQLite connections are thread-local and stay open after the block.
+    PostgreSQL connections are checked out of a bounded pool, waiting up to
+    DB_POOL_TIMEOUT seconds when every connection is busy, and returned when
+    the block exits.
+
+    Yields:
+        Connection: sqlite3 or psycopg2 connection
+    """
+    database_url = os.environ.get("DATABASE_URL")
+    if not database_url:
+        conn = get_sqlite_connection()
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+        return
+
+    pool = _get_postgres_pool(database_url)
+    start = time.perf_counter()
+    if not _postgres_slots.acquire(timeout=DB_POOL_TIMEOUT):
+        raise pg_pool.PoolError(f"No database connection available after {DB_POOL_TIMEOUT} seconds")
+    try:
+        conn = pool.getconn()
+    except Exception:
+        _postgres_slots.release()
+        raise
+    _record_wait(time.perf_counter() - start)
+    with _stats_lock:
+        _stats["postgres_in_use"] += 1
+    broken = False
+    try:
+        if not conn.autocommit:
+            conn.autocommit = True
+        yield conn
+    except psycopg2.InterfaceError:
+        broken = True
+        raise
+    finally:
+        pool.putconn(conn, close=broken or bool(conn.closed))
+        with _stats_lock:
+            _stats["postgres_in_use"] -= 1
+        _postgres_slots.release()
+
+def get_pool_stats():
+    """
+    Report connection pool size and wait time.
+
+    Returns:
+        dict: Backend name, open/in-use connection counts, pool bound and
+        acquisition wait statistics in seconds
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+    acquisitions = stats["acquisitions"]
+    return {
+        "backend": "postgres" if os.environ.get("DATABASE_URL") else "sqlite",
+        "sqlite_connections": stats["sqlite_connections"],
+        "postgres_pool_size": len(_postgres_pool._pool) + len(_postgres_pool._used) if _postgres_pool else 0,
+        "postgres_in_use": stats["postgres_in_use"],
+        "postgres_max": DB_POOL_MAX,
+        "acquisitions": acquisitions,
+        "total_wait": stats["total_wait"],
+        "max_wait": stats["max_wait"],
+        "average_wait": stats["total_wait"] / acquisitions if acquisitions else 0.0,
+    }
+
+def close_all_connections():
+    """Close the calling thread's SQLite connections and the PostgreSQL pool."""
+    global _postgres_pool, _postgres_slots
+    connections = getattr(_thread_local, "sqlite", None)
+    if connections:
+        for conn in connections.values():
+            conn.close()
+        with _stats_lock:
+            _stats["sqlite_connections"] -= len(connections)
+        connections.clear()
+    with _pool_lock:
+        if _postgres_pool is not None:
+            _postgres_pool.closeall()
+            _postgres_pool = None
+            _postgres_slots = None
 
 def execute_query(query, params=None, fetch=None):
-    """Execute a query with proper connection handling."""
-    conn = get_db_connection()
+    """Execute a query on a pooled connection."""
     try:
-        if isinstance(conn, sqlite3.Connection):
-            cursor = conn.cursor()
-            # For SQLite, replace RETURNING with a separate SELECT
-            if "RETURNING" in query:
-                # Execute the insert without RETURNING
-                insert_query = query.split("RETURNING")[0]
-                cursor.execute(insert_query, params)
-                # Get the last inserted ID
-                cursor.execute("SELECT last_insert_rowid()")
+        with pooled_connection() as conn:
+            if isinstance(conn, sqlite3.Connection):
+                cursor = conn.cursor()
+                # For SQLite, replace RETURNING with a separate SELECT
+                if "RETURNING" in query:
+                    # Execute the insert without RETURNING
+                    insert_query = query.split("RETURNING")[0]
+                    cursor.execute(insert_query, params or ())
+                    # Get the last inserted ID
+                    cursor.execute("SELECT last_insert_rowid()")
+                    result = cursor.fetchone()
+                    conn.commit()
+                    cursor.close()
+                    return result
+                cursor.execute(query, params or ())
+            else:
+                cursor = conn.cursor(cursor_factory=DictCursor)
+                cursor.execute(query, params)
+
+            if fetch == "one":
                 result = cursor.fetchone()
+            elif fetch == "all":
+                result = cursor.fetchall()
+            else:
+                result = None
                 conn.commit()
-                return result
-        else:
-            cursor = conn.cursor(cursor_factory=DictCursor)
-            cursor.execute(query, params)
-            
-        if fetch == "one":
-            result = cursor.fetchone()
-        elif fetch == "all":
-            result = cursor.fetchall()
-        else:
-            result = None
-            conn.commit()
-            
-        cursor.close()
-        return result
+
+            cursor.close()
+            return result
     except Exception as e:
         print(f"Database error: {e}")
         return None
-    finally:
-        if conn:
-            conn.close()
 
+def execute_many(query, params_seq):
+    """
+    Execute one statement for every parameter tuple inside a single transaction.
+
+    Args:
+        query (str): SQL statement with placeholders
+        params_seq (iterable): Parameter tuples, one per execution
+
+    Returns:
+        bool: True if the whole batch was committed, False if it was rolled back
+    """
+    params_seq = list(params_seq)
+    if not params_seq:
+        return True
+    try:
+        with pooled_connection() as conn:
+            if isinstance(conn, sqlite3.Connection):
+                with conn:
+                    conn.executemany(query, params_seq)
+            else:
+                conn.autocommit = False
+                try:
+                    with conn.cursor() as cursor:
+                        execute_batch(cursor, query, params_seq)
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                finally:
+                    conn.autocommit = True
+        return True
+    except Exception as e:
+        print(f"Database error: {e}")
+        return False
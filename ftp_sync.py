@@ -0,0 +1,231 @@
+"""
+ftp_sync.py - Incremental FTP mirroring for Direktor EXE Scrabble Tournament Manager
+
+Mirrors a tournament folder to an FTP server, uploading only the files that
+changed since the last mirror to the same server and folder. The size and
+SHA-256 of every uploaded file are kept in a manifest in the local folder,
+and changed files are sent over a few parallel FTP sessions. Each file is
+stored under a temporary name and then renamed, so visitors never load a
+half-uploaded page. Files and folders starting with a dot stay local, as
+do .tou save files and their journals, which hold the organiser's
+complete tournament data.
+"""
+
+import os
+import json
+import time
+import ftplib
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from render_pipeline import write_atomic
+
+FTP_MANIFEST_FILE = ".ftp_manifest.json"
+FTP_SESSIONS = 4
+FTP_TIMEOUT = 30
+PRIVATE_SUFFIXES = (".tou", ".journal")  # Save files and journals are never mirrored
+
+def is_mirrored(name):
+    """Check whether a file or folder name is uploaded by the mirror."""
+    return not name.startswith(".") and not name.lower().endswith(PRIVATE_SUFFIXES)
+
+def file_digest(path, cached=None):
+    """
+    Get a file's size and SHA-256.
+
+    Args:
+        path (str): File path
+        cached (dict): Previous manifest entry; its hash is reused when the
+            file's size and mtime have not changed
+
+    Returns:
+        dict: "size", "mtime_ns" and "sha256"
+    """
+    stat = os.stat(path)
+    if cached and cached.get("size") == stat.st_size and cached.get("mtime_ns") == stat.st_mtime_ns:
+        return cached
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest.hexdigest()}
+
+def local_files(local_dir):
+    """
+    List the files of a folder that are mirrored: everything except
+    dot-files, dot-folders, .tou save files and journals.
+
+    Args:
+        local_dir (str): Local folder
+
+    Returns:
+        list: Paths relative to local_dir, with "/" separators
+    """
+    files = []
+    for folder, dirs, names in os.walk(local_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        relative = os.path.relpath(folder, local_dir).replace(os.sep, "/")
+        prefix = "" if relative == "." else relative + "/"
+        files.extend(prefix + name for name in sorted(names) if is_mirrored(name))
+    return files
+
+def load_ftp_manifest(local_dir, target):
+    """Load the manifest entries for one FTP target ("user@host/remote_dir")."""
+    try:
+        with open(os.path.join(local_dir, FTP_MANIFEST_FILE), "r", encoding="utf-8") as f:
+            return json.load(f).get(target, {"files": {}, "dirs": []})
+    except (OSError, ValueError):
+        return {"files": {}, "dirs": []}
+
+def save_ftp_manifest(local_dir, target, entry):
+    """Save the manifest entries for one FTP target, keeping the other targets."""
+    path = os.path.join(local_dir, FTP_MANIFEST_FILE)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    manifest[target] = entry
+    write_atomic(path, json.dumps(manifest, sort_keys=True))
+
+def plan_sync(local_dir, entry, force=False):
+    """
+    Work out which files need uploading.
+
+    Args:
+        local_dir (str): Local folder
+        entry (dict): Manifest entry of the FTP target
+        force (bool): Upload every file regardless of the manifest
+
+    Returns:
+        tuple: (changed files as (relative path, digest) pairs, digests of unchanged files)
+    """
+    changed, unchanged = [], {}
+    for relative in local_files(local_dir):
+        cached = entry["files"].get(relative)
+        digest = file_digest(os.path.join(local_dir, relative), cached)
+        if force or cached is None or cached.get("sha256") != digest["sha256"] or cached.get("size") != digest["size"]:
+            changed.append((relative, digest))
+        else:
+            unchanged[relative] = digest
+    return changed, unchanged
+
+def ensure_remote_dirs(ftp, remote_dir, relative_paths, known_dirs):
+    """
+    Create the remote folders the uploads need, skipping folders known to exist.
+
+    Args:
+        ftp (ftplib.FTP): Logged-in session
+        remote_dir (str): Remote base folder
+        relative_paths (list): Files about to be uploaded
+        known_dirs (set): Remote folders created by earlier mirrors; updated in place
+    """
+    needed = {remote_dir}
+    for relative in relative_paths:
+        parts = relative.split("/")[:-1]
+        needed.update("/".join([remote_dir] + parts[:i]) for i in range(1, len(parts) + 1))
+    for folder in sorted(needed - known_dirs, key=lambda d: d.count("/")):
+        try:
+            ftp.mkd(folder)
+        except ftplib.error_perm as e:
+            # 550 is returned when the folder already exists.
+            if not str(e).startswith("550"):
+                raise
+        known_dirs.add(folder)
+
+def upload_file(ftp, local_path, remote_path):
+    """Upload one file under a temporary name and rename it into place."""
+    folder, name = remote_path.rsplit("/", 1) if "/" in remote_path else ("", remote_path)
+    temp_path = f"{folder}/.tmp-{name}" if folder else f".tmp-{name}"
+    with open(local_path, "rb") as f:
+        ftp.storbinary(f"STOR {temp_path}", f)
+    try:
+        ftp.rename(temp_path, remote_path)
+    except ftplib.error_perm:
+        # Some servers refuse to rename over an existing file.
+        try:
+            ftp.delete(remote_path)
+        except ftplib.error_perm:
+            pass
+        ftp.rename(temp_path, remote_path)
+
+def sync_folder(host, user, password, local_dir, remote_dir, sessions=FTP_SESSIONS, force=False, task=None):
+    """
+    Mirror a local folder to an FTP server, uploading only changed files.
+
+    Args:
+        host (str): FTP host
+        user (str): FTP username
+        password (str): FTP password
+        local_dir (str): Local folder
+        remote_dir (str): Remote folder
+        sessions (int): Maximum number of parallel FTP sessions
+        force (bool): Upload every file regardless of the manifest
+        task (Task): Optional background task for progress and cancellation
+
+    Returns:
+        dict: Sync report with "uploaded", "skipped", "bytes" and "elapsed" (seconds)
+
+    Raises:
+        ftplib.all_errors: If logging in or an upload fails; files uploaded
+        before the failure are kept in the manifest
+    """
+    start = time.perf_counter()
+    target = f"{user}@{host}/{remote_dir}"
+    entry = load_ftp_manifest(local_dir, target)
+    changed, unchanged = plan_sync(local_dir, entry, force)
+    uploaded = dict(unchanged)
+    known_dirs = set(entry.get("dirs", []))
+    lock = threading.Lock()
+    progress = {"done": 0, "bytes": 0}
+
+    def connect():
+        ftp = ftplib.FTP(host, timeout=FTP_TIMEOUT)
+        ftp.login(user, password)
+        return ftp
+
+    def upload_batch(batch):
+        ftp = connect()
+        try:
+            for relative, digest in batch:
+                if task:
+                    task.check_cancelled()
+                upload_file(ftp, os.path.join(local_dir, relative), f"{remote_dir}/{relative}")
+                with lock:
+                    uploaded[relative] = digest
+                    progress["done"] += 1
+                    progress["bytes"] += digest["size"]
+                    done = progress["done"]
+                if task:
+                    task.report(done, len(changed), f"{done}/{len(changed)} files")
+        finally:
+            try:
+                ftp.quit()
+            except ftplib.all_errors:
+                ftp.close()
+
+    try:
+        if changed:
+            ftp = connect()
+            try:
+                ensure_remote_dirs(ftp, remote_dir, [relative for relative, _ in changed], known_dirs)
+            finally:
+                try:
+                    ftp.quit()
+                except ftplib.all_errors:
+                    ftp.close()
+            workers = max(1, min(sessions, len(changed)))
+            batches = [changed[i::workers] for i in range(workers)]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for future in [executor.submit(upload_batch, batch) for batch in batches]:
+                    future.result()
+    finally:
+        save_ftp_manifest(local_dir, target, {"files": uploaded, "dirs": sorted(known_dirs)})
+
+    return {
+        "uploaded": progress["done"],
+        "skipped": len(unchanged),
+        "bytes": progress["bytes"],
+        "elapsed": time.perf_counter() - start,
+    }
@@ -0,0 +1,220 @@
+"""
+live_events.py - Live result events for Direktor EXE Scrabble Tournament Manager
+
+This module is a small in-process publish/subscribe hub for Server-Sent
+Events. The desktop app and the result submission route publish an event
+whenever a result is entered, and every spectator connected to a
+tournament's event stream receives it as a compact JSON message.
+Subscribers are either thread queues (the Flask server) or asyncio queues
+(the ASGI server), and publish() may be called from any thread.
+"""
+
+import json
+import queue
+import asyncio
+import threading
+
+KEEPALIVE_SECONDS = 15
+RETRY_MILLISECONDS = 5000
+QUEUE_SIZE = 100
+
+_lock = threading.Lock()
+_subscribers = {}  # Tournament folder name -> set of subscriber queues
+_async_subscribers = {}  # Tournament folder name -> set of (event loop, asyncio.Queue)
+_sequence = {}  # Tournament folder name -> ID of the last published event
+
+def subscribe(folder_name):
+    """
+    Register a new subscriber for a tournament's events.
+
+    Args:
+        folder_name (str): Tournament folder name
+
+    Returns:
+        queue.Queue: Queue the subscriber's events are delivered to
+    """
+    subscriber = queue.Queue(maxsize=QUEUE_SIZE)
+    with _lock:
+        _subscribers.setdefault(folder_name, set()).add(subscriber)
+    return subscriber
+
+def unsubscribe(folder_name, subscriber):
+    """Remove a subscriber registered with subscribe()."""
+    with _lock:
+        subscribers = _subscribers.get(folder_name)
+        if subscribers is not None:
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del _subscribers[folder_name]
+
+def subscribe_async(folder_name):
+    """
+    Register a subscriber living on the running asyncio event loop.
+
+    Must be called from a coroutine.
+
+    Args:
+        folder_name (str): Tournament folder name
+
+    Returns:
+        tuple: (event loop, asyncio.Queue); pass it to unsubscribe_async()
+    """
+    subscriber = (asyncio.get_running_loop(), asyncio.Queue(maxsize=QUEUE_SIZE))
+    with _lock:
+        _async_subscribers.setdefault(folder_name, set()).add(subscriber)
+    return subscriber
+
+def unsubscribe_async(folder_name, subscriber):
+    """Remove a subscriber registered with subscribe_async()."""
+    with _lock:
+        subscribers = _async_subscribers.get(folder_name)
+        if subscribers is not None:
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del _async_subscribers[folder_name]
+
+def subscriber_count(folder_name=None):
+    """Count the connected subscribers of one tournament, or of all tournaments."""
+    with _lock:
+        if folder_name is not None:
+            return len(_subscribers.get(folder_name, ())) + len(_async_subscribers.get(folder_name, ()))
+        return sum(len(subscribers) for subscribers in _subscribers.values()) + \
+            sum(len(subscribers) for subscribers in _async_subscribers.values())
+
+def _deliver_async(folder_name, subscriber, message):
+    # Runs on the subscriber's event loop.
+    events = subscriber[1]
+    try:
+        events.put_nowait(message)
+    except asyncio.QueueFull:
+        unsubscribe_async(folder_name, subscriber)
+        events.get_nowait()
+        events.put_nowait(None)  # Wakes the stream so it closes
+
+def publish(folder_name, event, data):
+    """
+    Send an event to every subscriber of a tournament.
+
+    Subscribers whose queue is full are too slow to keep up and are dropped;
+    their browser reconnects and picks up from the current pages.
+
+    Args:
+        folder_name (str): Tournament folder name
+        event (str): Event name, e.g. "result"
+        data (dict): JSON-serialisable event payload
+
+    Returns:
+        int: Number of subscribers the event was delivered to
+    """
+    payload = json.dumps(data, separators=(",", ":"), default=str)
+    with _lock:
+        event_id = _sequence.get(folder_name, 0) + 1
+        _sequence[folder_name] = event_id
+        subscribers = list(_subscribers.get(folder_name, ()))
+        async_subscribers = list(_async_subscribers.get(folder_name, ()))
+    message = format_event(event, payload, event_id)
+    delivered = 0
+    for subscriber in async_subscribers:
+        try:
+            subscriber[0].call_soon_threadsafe(_deliver_async, folder_name, subscriber, message)
+            delivered += 1
+        except RuntimeError:
+            # The subscriber's event loop has been closed.
+            unsubscribe_async(folder_name, subscriber)
+    for subscriber in subscribers:
+        try:
+            subscriber.put_nowait(message)
+            delivered += 1
+        except queue.Full:
+            unsubscribe(folder_name, subscriber)
+            try:
+                subscriber.get_nowait()
+                subscriber.put_nowait(None)  # Wakes the stream so it closes
+            except (queue.Empty, queue.Full):
+                pass
+    return delivered
+
+def format_event(event, payload, event_id=None):
+    """
+    Format one Server-Sent Events message.
+
+    Args:
+        event (str): Event name
+        payload (str): Event data; newlines are split over several data lines
+        event_id (int): Optional event ID
+
+    Returns:
+        str: Message text, terminated by a blank line
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.extend(f"data: {line}" for line in payload.split("\n"))
+    return "\n".join(lines) + "\n\n"
+
+def iter_events(subscriber, timeout=KEEPALIVE_SECONDS):
+    """
+    Yield a subscriber's messages, with a comment line when idle.
+
+    The keep-alive comments stop proxies from closing idle streams. The
+    generator ends when the subscriber is dropped.
+
+    Args:
+        subscriber (queue.Queue): Queue returned by subscribe()
+        timeout (float): Seconds of silence before a keep-alive is sent
+
+    Yields:
+        str: Server-Sent Events message text
+    """
+    yield f"retry: {RETRY_MILLISECONDS}\n\n"
+    while True:
+        try:
+            message = subscriber.get(timeout=timeout)
+        except queue.Empty:
+            yield ": keep-alive\n\n"
+            continue
+        if message is None:
+            return
+        yield message
+
+def _standings_rows(players):
+    # The standings columns of player rows, as sent to the live page script.
+    return [
+        {"id": p[0], "name": p[1], "wins": p[3], "losses": p[4], "spread": p[5], "last": p[6]}
+        for p in players or []
+    ]
+
+def result_event(match_id, player1, player2, score1, score2, players=None):
+    """
+    Build the payload of a "result" event.
+
+    Args:
+        match_id (str): Match ID, e.g. "R3-M12"
+        player1 (str): First player's name
+        player2 (str): Second player's name
+        score1 (int): First player's score
+        score2 (int): Second player's score
+        players (list): Updated player rows as returned by get_players_for_tournament,
+            or None when standings have not been recalculated yet
+
+    Returns:
+        dict: Event payload with the match and the changed standings rows
+    """
+    return {
+        "match": match_id,
+        "text": f"{player1} {score1} - {score2} {player2}",
+        "players": _standings_rows(players),
+    }
+
+def standings_event(players):
+    """
+    Build the payload of a "standings" event, sent after a full recalculation.
+
+    Args:
+        players (list): Player rows as returned by get_players_for_tournament
+
+    Returns:
+        dict: Event payload with every player's standings row
+    """
+    return {"players": _standings_rows(players)}
@@ -12,7 +12,7 @@ Features:
   • The "Enter Results" tab lets the user manually enter or update match scores for each pairing.
   • The Prize Table tab provides a UI for setting up both monetary and non‑monetary prizes (with a searchable currency selector).
   • The Event Coverage Index is regenerated on demand (when clicking Render) to reflect the latest data.
-  • Pairings are generated using several pairing systems (Round Robin, Random Pairing, King of the Hills, Australian Draw, Lagged Australian).
+  • Pairings are generated using several pairing systems (Round Robin, Random Pairing, King of the Hills, Australian Draw, Lagged Australian, Optimal Matching).
   • A new "FTP Settings" tab lets the user enter FTP Host, Username, and Password. When the user clicks "Mirror Website", the tournament folder is uploaded via FTP to their host, and the shareable link is updated.
   • A new remote results submission feature is added via Flask:
        – A custom HTTP endpoint (/submit_results) is served.
@@ -36,19 +36,29 @@ Author: Manuelito
 # Imports and Global Variables
 ##################################
 import customtkinter as ctk
-import os, re, shutil, webbrowser, sqlite3, threading, socket, random, json, ftplib
+import os, re, shutil, webbrowser, sqlite3, threading, socket, random, json, queue, time
 import tkinter.filedialog as fd
 import tkinter.messagebox as messagebox
 import tkinter.simpledialog as simpledialog
 from functools import partial
 from data.database import create_connection, create_tables
-from data.database import insert_tournament, update_tournament_link, get_tournament, get_all_tournaments, insert_player, get_players_for_tournament
+from data.database import insert_tournament, update_tournament_link, get_tournament, get_all_tournaments, insert_player, get_players_for_tournament, get_players_by_name
 from schema import initialize_database
-from pairings import round_robin_rounds, assign_firsts, random_pairings, king_of_the_hills_pairings, australian_draw_pairings, lagged_australian_pairings
+from pairings import create_round_robin_schedule, round_robin_pairing_round, round_robin_round_count, random_pairings, king_of_the_hills_pairings, australian_draw_pairings, lagged_australian_pairings, optimal_pairings
+from pairings import build_pairing_history, record_pairings, forget_pairings, play_count
 from theme import set_theme_mode, apply_theme
-from utils import get_local_ip, get_tournament_folder, recalculate_player_stats
-from server import run_flask_app
-from database_utils import execute_query
+from utils import get_local_ip, get_tournament_folder, sanitize_filename, generate_match_id, parse_match_id, recalculate_player_stats, apply_result_delta
+from server import run_flask_app, publish_tournament_state, refresh_tournament_folder_index
+from database_utils import execute_query, execute_many
+from render_pipeline import render_pages
+from live_events import publish, result_event, standings_event, subscribe, unsubscribe
+from tou_format import read_tou, write_tou
+from tournament_state import RoundTable, Result
+from task_executor import TaskExecutor
+from ftp_sync import sync_folder
+from auto_publish import PublishQueue, page_variants, publish_to_folder, publish_to_server
+from tou_journal import COMPACT_EVERY, append_records, journal_size, replay as replay_journal, clear as clear_journal
+from site_templates import tournament_pages, page_files, scorecard_file, pairings_file
 
 # Import all currencies
 all_currencies = [
@@ -83,45 +93,43 @@ team_size = 0         # Not used in general mode
 last_pairing_system = "Round Robin"
 last_team_size = 3    # Not used
 current_round_number = 0
-completed_rounds = {}
-results_by_round = {}
+rounds = RoundTable()     # Pairings and results of every round, indexed by round number
+completed_rounds = rounds.pairings
+results_by_round = rounds.results
+pairing_history = {}      # Repeat-pairing index kept in step with completed_rounds
 team_round_results = {}   # Not used
 desired_rr_rounds = None
 app = None
 status_label = None
 main_frame_global = None
 shareable_link = ""
-full_round_robin_schedule = None
+round_robin_schedule = None  # Cached round robin schedule description, saved in the .tou file
 public_ip = ""  # Will store public IP or custom domain
 sponsor_logos = ""  # Holds sponsor logo file paths
-
-# HTML header with <base> tag – base_href will be injected via .format()
-#header_html = """<head>
-#  <meta charset="UTF-8">
-#  <meta name="viewport" content="width=device-width, initial-scale=1">
-#  <base href="{0}">
-#  <title>Tournament</title>
-#  <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
-#  <style>
-#    body { background-color: #f8f9fa; color: #343a40; }
-#    .container-custom { max-width:800px; margin:auto; }
-#    footer { margin-top: 40px; font-size: 0.9em; text-align: center; padding: 20px 0; }
-#  </style>
-#</head>"""
-
-def get_header_html(base_href):
-    return """<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1">
-  <base href=\"""" + base_href + """\">
-  <title>Tournament</title>
-  <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
-  <style>
-    body { background-color: #f8f9fa; color: #343a40; }
-    .container-custom { max-width:800px; margin:auto; }
-    footer { margin-top: 40px; font-size: 0.9em; text-align: center; padding: 20px 0; }
-  </style>
-</head>"""
+INGEST_POLL_SECONDS = 2   # How often the ingester checks for remote results when not notified
+ingested_revision = 0     # Highest results.revision merged from remote submissions, saved in the .tou file
+review_queue = []         # Remote results that could not be merged automatically
+remote_results = queue.Queue()  # (tournament id, rows) handed from the ingester thread to the Tk thread
+review_refresh = None     # Redraws the Remote Results tab when the review queue changes
+journal_records = 0       # Records in the .tou journal since the last snapshot
+loaded_tou_path = None    # .tou file the tournament was loaded from; None for the default file
+compact_task = None       # Running journal compaction, if any
+snapshot_lock = threading.Lock()  # Serialises snapshot writes and journal trims
+snapshot_sequence = 0     # Number of the latest snapshot built
+snapshot_written = 0      # Number of the latest snapshot written to disk
+task_executor = TaskExecutor()  # Runs rendering, recalculation and FTP uploads off the Tk thread
+recalc_task = None        # Running standings recalculation, if any
+recalc_pending = False    # Whether another recalculation was requested while one was running
+task_status_label = None
+task_progress_bar = None
+task_cancel_button = None
+auto_publish_queue = PublishQueue()  # Pages changed since the last automatic publish
+auto_publish_settings = None  # Target settings while auto-publish is switched on
+auto_publish_task = None      # Running publish job, if any
+auto_publish_label = None
+last_publish_report = None    # Files, bytes and latency of the last automatic publish
+last_publish_error = None     # Error of the last publish job if it failed; it is retried
+changed_players = None    # IDs of players whose scorecards changed since the last render; None if unknown
 
 ##################################
 # Toast Notification Function
@@ -134,6 +142,40 @@ def show_toast(parent, message, duration=2000):
     label.pack(expand=True, fill="both")
     toast.after(duration, toast.destroy)
 
+##################################
+# Background Task Status
+##################################
+def setup_task_status(parent):
+    global task_status_label, task_progress_bar, task_cancel_button
+    task_status_label = ctk.CTkLabel(parent, text="", wraplength=160)
+    task_status_label.pack(pady=(20, 5), padx=20)
+    task_progress_bar = ctk.CTkProgressBar(parent, width=160)
+    task_progress_bar.set(0)
+    task_cancel_button = ctk.CTkButton(parent, text="Cancel", width=80, command=task_executor.cancel_all)
+
+def drain_tasks():
+    # Deliver background task results on the Tk thread and show progress.
+    task_executor.poll()
+    tasks = task_executor.active_tasks()
+    if task_status_label is not None:
+        if tasks:
+            task = tasks[0]
+            text = f"{task.name}... {task.message}".strip()
+            if len(tasks) > 1:
+                text += f" (+{len(tasks) - 1} queued)"
+            task_status_label.configure(text=text)
+            fraction = task.fraction()
+            if not task_progress_bar.winfo_ismapped():
+                task_progress_bar.pack(pady=5, padx=20)
+                task_cancel_button.pack(pady=5, padx=20)
+            task_progress_bar.set(fraction if fraction is not None else 0)
+        elif task_progress_bar.winfo_ismapped():
+            task_status_label.configure(text="")
+            task_progress_bar.pack_forget()
+            task_cancel_button.pack_forget()
+    auto_publish_tick()
+    app.after(100, drain_tasks)
+
 ##################################
 # Folder & File Helpers
 ##################################
@@ -148,26 +190,38 @@ def finalize_tournament_html(tournament_name, generated_filename):
 # Database & Save/Load Functions
 ##################################
 def update_tournament_link(tournament_id, link):
-    conn = create_connection()
-    cursor = conn.cursor()
-    cursor.execute("UPDATE tournaments SET shareable_link = ? WHERE id = ?", (link, tournament_id))
-    conn.commit()
-    conn.close()
+    execute_query("UPDATE tournaments SET shareable_link = ? WHERE id = ?", (link, tournament_id))
 
 def save_current_tournament():
-    global current_tournament_id, app, tournament_mode, teams_list, team_size, current_round_number, completed_rounds, results_by_round, last_pairing_system, last_team_size
     if current_tournament_id is None:
         show_toast(app, "No tournament to save.")
         return
-    conn = create_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, name, date, venue, shareable_link FROM tournaments WHERE id = ?", (current_tournament_id,))
-    tournament_data = cursor.fetchone()
-    players = get_players_for_tournament(current_tournament_id)
-    conn.close()
-    if tournament_data is None:
+    task = submit_tournament_snapshot(
+        on_done=lambda filename: show_toast(app, f"Tournament saved successfully at {filename}."),
+        on_error=lambda e: messagebox.showerror("Error", f"Saving the tournament failed: {e}"))
+    if task is None:
         show_toast(app, "Tournament not found in database.")
-        return
+
+def current_tou_path():
+    # A loaded file keeps its name, so its journal is the one written to and
+    # compacted; new tournaments use <folder>/<name>_progress.tou.
+    if loaded_tou_path is not None:
+        return loaded_tou_path
+    tournament_data = get_tournament(current_tournament_id) if current_tournament_id is not None else None
+    if tournament_data is None:
+        return None
+    tournament_name = tournament_data[1]
+    return os.path.join(get_tournament_folder(tournament_name), f"{tournament_name}_progress.tou")
+
+def build_tournament_snapshot():
+    # Collect the whole tournament on the Tk thread, together with the
+    # journal size it covers. Returns (file name, data, journal size,
+    # sequence number) or None.
+    global snapshot_sequence
+    tournament_data = get_tournament(current_tournament_id) if current_tournament_id is not None else None
+    if tournament_data is None:
+        return None
+    players = get_players_for_tournament(current_tournament_id)
     data = {
         "tournament": {
             "id": tournament_data[0],
@@ -185,46 +239,134 @@ def save_current_tournament():
         ],
         "progress": {
             "current_round_number": current_round_number,
-            "completed_rounds": completed_rounds,
-            "results_by_round": results_by_round,
+            "completed_rounds": {r: list(pairings) for r, pairings in completed_rounds.items()},
+            "results_by_round": {r: list(round_results) for r, round_results in results_by_round.items()},
             "last_pairing_system": last_pairing_system,
-            "last_team_size": last_team_size
+            "last_team_size": last_team_size,
+            "round_robin_schedule": round_robin_schedule,
+            "ingested_revision": ingested_revision,
+            "review_queue": list(review_queue),
+            "prize_table": [dict(prize) for prize in prize_table]
         }
     }
-    tournament_name = tournament_data[1]
-    folder = get_tournament_folder(tournament_name)
-    filename = os.path.join(folder, f"{tournament_name}_progress.tou")
-    with open(filename, "w") as f:
-        json.dump(data, f)
-    show_toast(app, f"Tournament saved successfully at {filename}.")
+    filename = current_tou_path()
+    snapshot_sequence += 1
+    return filename, data, journal_size(filename), snapshot_sequence
+
+def store_tournament_snapshot(task, filename, data, covered, sequence):
+    # May run on a worker thread. Only the journal records the snapshot
+    # covers are dropped; records appended meanwhile stay. A snapshot older
+    # than the one already written is skipped.
+    global snapshot_written
+    with snapshot_lock:
+        if sequence < snapshot_written:
+            return filename
+        write_tou(filename, data)
+        clear_journal(filename, covered)
+        snapshot_written = sequence
+    return filename
+
+def write_tournament_snapshot():
+    # Write the whole tournament to its .tou file now; the journal's records
+    # are then part of the snapshot. Returns the file name.
+    global journal_records
+    snapshot = build_tournament_snapshot()
+    if snapshot is None:
+        return None
+    journal_records = 0
+    return store_tournament_snapshot(None, *snapshot)
+
+def submit_tournament_snapshot(on_done=None, on_error=None, on_cancel=None):
+    # Copy the tournament now and write it to its .tou file on a worker
+    # thread. Returns the task, or None if there is no tournament to save.
+    global journal_records
+    snapshot = build_tournament_snapshot()
+    if snapshot is None:
+        return None
+    journal_records = 0
+    return task_executor.submit("Saving tournament", store_tournament_snapshot, *snapshot,
+                                on_done=on_done, on_error=on_error, on_cancel=on_cancel)
+
+def compact_journal():
+    # Fold the journal into a new snapshot on a worker thread.
+    global compact_task
+    if compact_task is not None:
+        return
+    def finished(outcome=None):
+        global compact_task
+        compact_task = None
+        if isinstance(outcome, Exception):
+            # The journal is only trimmed after a successful write, so nothing is lost.
+            show_toast(app, f"Saving the tournament failed: {outcome}")
+    compact_task = submit_tournament_snapshot(on_done=finished, on_error=finished, on_cancel=finished)
+
+def journal(*records):
+    # Append pairing and result changes to the .tou journal so a crash loses
+    # nothing; every COMPACT_EVERY records they are folded into a snapshot.
+    global journal_records
+    filename = current_tou_path()
+    if filename is None:
+        return
+    if not os.path.exists(filename):
+        write_tournament_snapshot()  # Already includes the records
+        return
+    try:
+        append_records(filename, records)
+    except OSError as e:
+        messagebox.showerror("Error", f"Could not write the tournament journal: {e}")
+        return
+    journal_records += len(records)
+    if journal_records >= COMPACT_EVERY:
+        compact_journal()
+
+def journal_result(round_num, index, scores):
+    journal({"op": "result", "round": round_num, "index": index, "scores": list(scores)})
 
 def load_tournament():
-    global current_tournament_id, session_players, app, tournament_mode, teams_list, team_size, current_round_number, completed_rounds, results_by_round, last_pairing_system, last_team_size
+    global current_tournament_id, session_players, app, tournament_mode, teams_list, team_size, current_round_number, rounds, completed_rounds, results_by_round, last_pairing_system, last_team_size, pairing_history, round_robin_schedule, ingested_revision, review_queue, journal_records, changed_players, loaded_tou_path
     if not confirm_discard():
         return
     initial_dir = os.path.join(os.getcwd(), "rendered", "tournaments")
     filename = fd.askopenfilename(initialdir=initial_dir, filetypes=[("Tournament Files", "*.tou")])
     if filename:
-        with open(filename, "r") as f:
-            data = json.load(f)
+        try:
+            data = read_tou(filename)
+        except (OSError, ValueError, sqlite3.Error) as e:
+            show_toast(app, f"Invalid tournament file: {e}")
+            return
         tournament = data.get("tournament", {})
         players = data.get("players", [])
         progress = data.get("progress", {})
         if not tournament:
             show_toast(app, "Invalid tournament file.")
             return
+        # Changes made after the file was last saved are in its journal.
+        journal_records = replay_journal(filename, progress)
         current_tournament_id = tournament.get("id")
+        loaded_tou_path = filename
+        changed_players = None
         tournament_mode = tournament.get("mode", "General")
         teams_list = tournament.get("teams", [])
         team_size = tournament.get("team_size", 0)
         session_players = [(p["name"], p["rating"], p["wins"], p["losses"], p["spread"],
                              p.get("last_result", ""), p.get("scorecard", ""), p.get("team", ""), p.get("player_number", 1)) for p in players]
         current_round_number = progress.get("current_round_number", 0)
-        completed_rounds = progress.get("completed_rounds", {})
-        results_by_round = progress.get("results_by_round", {})
+        rounds = RoundTable.from_progress(progress)
+        completed_rounds, results_by_round = rounds.pairings, rounds.results
+        pairing_history = build_pairing_history(completed_rounds)
         last_pairing_system = progress.get("last_pairing_system", "Round Robin")
         last_team_size = progress.get("last_team_size", 3)
-        show_toast(app, "Tournament loaded successfully.")
+        round_robin_schedule = progress.get("round_robin_schedule")
+        # Files saved before results had revisions recorded the row id, which
+        # the migration copied into the revision.
+        ingested_revision = progress.get("ingested_revision", progress.get("ingested_result_id", 0))
+        review_queue = progress.get("review_queue", [])
+        prize_table[:] = progress.get("prize_table", [])
+        recalc_player_stats()
+        if journal_records:
+            show_toast(app, f"Tournament loaded successfully; recovered {journal_records} unsaved changes.")
+        else:
+            show_toast(app, "Tournament loaded successfully.")
         update_status()
 
 def update_status():
@@ -262,6 +404,10 @@ def confirm_discard():
 def quit_app():
     global app
     if messagebox.askyesnocancel("Confirm Quit", "Are you sure you want to quit?"):
+        if snapshot_written < snapshot_sequence and current_tournament_id is not None:
+            # Shutting down cancels queued tasks; write the pending save now.
+            write_tournament_snapshot()
+        task_executor.shutdown()
         app.destroy()
 
 def initialize_database():
@@ -272,12 +418,31 @@ def initialize_database():
 ##################################
 # Pairing System Functions (General Mode Only)
 ##################################
+def store_round_pairings(round_num, pairings):
+    if round_num in completed_rounds:
+        forget_pairings(pairing_history, completed_rounds[round_num])
+    completed_rounds[round_num] = pairings
+    record_pairings(pairing_history, pairings)
+    journal({"op": "pairings", "round": round_num, "pairings": pairings},
+            {"op": "progress", "values": {"current_round_number": max(current_round_number, round_num),
+                                          "last_pairing_system": last_pairing_system,
+                                          "round_robin_schedule": round_robin_schedule}})
+    if current_tournament_id is not None:
+        # Pairing pages are numbered by their position among the rounds.
+        position = sorted(completed_rounds).index(round_num) + 1
+        mark_pages_dirty([pairings_file(current_tournament_id, position), page_files(current_tournament_id)["index"]])
+    publish_live_state()
+
+def remove_round_pairings(round_num):
+    if round_num in completed_rounds:
+        forget_pairings(pairing_history, completed_rounds.pop(round_num))
+        journal({"op": "unpair", "round": round_num})
+        if current_tournament_id is not None:
+            mark_pages_dirty([page_files(current_tournament_id)["index"]])
+        publish_live_state()
+
 def has_played(player1, player2):
-    for rnd in completed_rounds.values():
-        for pairing in rnd:
-            if set(pairing[:2]) == set([player1, player2]):
-                return True
-    return False
+    return play_count(pairing_history, player1, player2) > 0
 
 def compute_lagged_standings(players, round_limit):
     stats = {}
@@ -308,28 +473,41 @@ def compute_lagged_standings(players, round_limit):
 
 def generate_general_pairings(players, system_choice):
     if system_choice == "Round Robin":
+        global desired_rr_rounds, current_round_number, round_robin_schedule
         names = [p[1] for p in players]
-        full_round_robin_schedule = assign_firsts(round_robin_rounds(names))
-        global desired_rr_rounds, current_round_number, completed_rounds
-        max_rounds = len(full_round_robin_schedule)
-        desired_rr_rounds = simpledialog.askinteger(
-            "Round Robin Schedule",
-            f"A full round robin schedule for {len(players)} players is completed in {max_rounds} rounds.\nHow many rounds do you want to generate?",
-            minvalue=1,
-            maxvalue=max_rounds
-        )
-        for r in range(1, desired_rr_rounds + 1):
-            completed_rounds[r] = full_round_robin_schedule[r - 1]
-        current_round_number = desired_rr_rounds
-        return full_round_robin_schedule[desired_rr_rounds - 1]
+        if round_robin_schedule is None or sorted(n for n in round_robin_schedule["seating"] if n != "BYE") != sorted(names):
+            per_cycle = len(names) - 1 + len(names) % 2
+            desired_rr_rounds = simpledialog.askinteger(
+                "Round Robin Schedule",
+                f"A full round robin schedule for {len(players)} players is completed in {per_cycle} rounds "
+                f"({per_cycle * 2} for a double, {per_cycle * 4} for a quadruple round robin).\nHow many rounds do you want to generate?",
+                minvalue=1,
+                maxvalue=per_cycle * 4
+            )
+            if not desired_rr_rounds:
+                return None
+            cycles = 1 if desired_rr_rounds <= per_cycle else 2 if desired_rr_rounds <= per_cycle * 2 else 4
+            round_robin_schedule = create_round_robin_schedule(names, seed=current_tournament_id, cycles=cycles, start_round=current_round_number + 1)
+            # Pair every requested round except the last, which pair_round stores.
+            first_round = current_round_number + 1
+            for r in range(first_round, first_round + desired_rr_rounds - 1):
+                store_round_pairings(r, round_robin_pairing_round(round_robin_schedule, r - first_round + 1))
+                current_round_number = r
+        schedule_round = current_round_number + 1 - round_robin_schedule["start_round"] + 1
+        if schedule_round > round_robin_round_count(round_robin_schedule):
+            messagebox.showerror("Error", "The round robin schedule is complete.")
+            return None
+        return round_robin_pairing_round(round_robin_schedule, schedule_round)
     elif system_choice == "Random Pairing":
         return random_pairings(players)
     elif system_choice == "King of the Hills Pairing":
         return king_of_the_hills_pairings(players)
     elif system_choice == "Australian Draw":
-        return australian_draw_pairings(players, completed_rounds)
+        return australian_draw_pairings(players, completed_rounds, pairing_history)
     elif system_choice == "Lagged Australian":
-        return lagged_australian_pairings(players, current_round_number, results_by_round, completed_rounds)
+        return lagged_australian_pairings(players, current_round_number, results_by_round, completed_rounds, pairing_history)
+    elif system_choice == "Optimal Matching":
+        return optimal_pairings(players, completed_rounds, pairing_history)
     else:
         raise ValueError("Invalid pairing system specified.")
 
@@ -339,511 +517,411 @@ def generate_pairings_system(players, system="Round Robin", team_size=None):
 ##################################
 # HTML Generation Functions
 ##################################
-def generate_player_scorecard_html(player, tournament_id, out_folder):
-    player_id = player[0]
-    try:
-        scorecard = json.loads(player[7]) if player[7] else []
-    except Exception:
-        scorecard = []
-    rows = ""
-    for entry in scorecard:
-        rows += f"<tr><td>{entry.get('round', 'N/A')}</td><td>{entry.get('result', 'N/A')}</td><td>{entry.get('cumulative', 'N/A')}</td></tr>\n"
-    base_href = "./"
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-{get_header_html(base_href)}
-<body>
-  <div class="container container-custom">
-    <h1 class="mt-4">Scorecard</h1>
-    <h3>{player[1]} (Rating: {player[2]})</h3>
-    <table class="table table-striped">
-      <thead>
-        <tr><th>Round</th><th>Result</th><th>Cumulative Spread</th></tr>
-      </thead>
-      <tbody>
-        {rows if rows else '<tr><td colspan="3">No scorecard data available.</td></tr>'}
-      </tbody>
-    </table>
-    <a href="./index.html" class="btn btn-secondary">Back to Standings</a>
-  </div>
-  <footer class="bg-light">Direktor Scrabble Tournament Manager by Manuelito</footer>
-  <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
-</body>
-</html>
-"""
-    out_path = os.path.join(out_folder, f"tournament_{tournament_id}_player_{player_id}.html")
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write(html)
-    return f"tournament_{tournament_id}_player_{player_id}.html"
+def mark_scorecards_dirty(player_ids):
+    # Record players whose scorecards changed since the last render.
+    if changed_players is not None:
+        changed_players.update(player_ids)
+
+def render_snapshot():
+    # Copies of the round and prize data a background render reads, so the
+    # director can keep entering results while it runs, and the players
+    # whose scorecards changed since the last render (None if unknown).
+    global changed_players
+    players, changed_players = changed_players, set()
+    return {r: list(pairings) for r, pairings in completed_rounds.items()}, [dict(prize) for prize in prize_table], players
 
-def generate_tournament_html(tournament_id, tournament_name, tournament_date):
+def generate_tournament_html(tournament_id, tournament_name, tournament_date, rounds=None, prizes=None, task=None, changed=None):
+    global changed_players
     out_folder = get_tournament_folder(tournament_name)
-    conn = create_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT name, date, venue FROM tournaments WHERE id = ?", (tournament_id,))
-    result = cursor.fetchone()
-    conn.close()
+    result = execute_query("SELECT name, date, venue FROM tournaments WHERE id = ?", (tournament_id,), fetch="one")
     if result:
         tournament_name_db, tournament_date_db, tournament_venue = result
     else:
         tournament_name_db, tournament_date_db, tournament_venue = tournament_name, tournament_date, ""
-    players = get_players_for_tournament(tournament_id)
-    if completed_rounds:
-        schedule = [completed_rounds[r] for r in sorted(completed_rounds.keys())]
-    else:
-        schedule = []
-    pairing_round_links = []
-    base = f"tournament_{tournament_id}"
-    index_file = "index.html"
-    roster_file = f"tournament_{tournament_id}_roster.html"
-    standings_file = f"tournament_{tournament_id}_standings.html"
-    prize_file = f"tournament_{tournament_id}_prize.html"
-    base_href = "./"
-    for idx, round_pairings in enumerate(schedule, start=1):
-        round_file = f"tournament_{tournament_id}_pairings_round_{idx}.html"
-        pairing_round_links.append((idx, round_file))
-        pairing_content = f"<h2>Round {idx} Pairings</h2>\n<table class='table table-bordered'><thead><tr><th>#</th><th>Pairing</th><th>First</th><th>Match ID</th></tr></thead><tbody>"
-        for i, pairing in enumerate(round_pairings, start=1):
-            match_id = f"R{idx}-M{i}"
-            if len(pairing) == 3:
-                p1, p2, first = pairing
-            elif len(pairing) == 2:
-                p1, p2 = pairing
-                first = random.choice([p1, p2])
-            else:
-                p1, p2, first = "???", "???", "???"
-            pairing_str = f"{p1} vs {p2}"
-            pairing_content += f"<tr><td>{i}</td><td>{pairing_str}</td><td>{first}</td><td>{match_id} <button onclick='navigator.clipboard.writeText(\"{match_id}\")'>Copy</button></td></tr>"
-        pairing_content += "</tbody></table>"
-        
-        navbar_html = f"""<nav class="navbar navbar-expand-lg navbar-light bg-light mb-4">
-  <div class="container">
-    <a class="navbar-brand" href="./index.html"></a>
-    <button class="navbar-toggler" type="button" data-bs-toggle="collapse" 
-            data-bs-target="#navbarNav" aria-controls="navbarNav" aria-expanded="false" 
-            aria-label="Toggle navigation">
-      <span class="navbar-toggler-icon"></span>
-    </button>
-    <div class="collapse navbar-collapse" id="navbarNav">
-      <ul class="navbar-nav ms-auto">
-        <li class="nav-item"><a class="nav-link" href="./index.html">Home</a></li>
-        <li class="nav-item"><a class="nav-link" href="./{roster_file}">Roster</a></li>
-        <li class="nav-item"><a class="nav-link" href="./{standings_file}">Standings</a></li>
-        <li class="nav-item"><a class="nav-link" href="./{prize_file}">Prize Table</a></li>
-      </ul>
-    </div>
-  </div>
-</nav>"""
-        footer_section = '<footer class="bg-light">Direktor Scrabble Tournament Manager by Manuelito</footer>'
-        pairing_page = f"""<!DOCTYPE html>
-<html lang="en">
-{get_header_html(base_href)}
-<body>
-  {navbar_html}
-  <div class="container container-custom">
-    <h1 class="mb-3">{tournament_name_db}</h1>
-    {pairing_content}
-    <a href="./index.html" class="btn btn-secondary">Back to Index</a>
-  </div>
-  {footer_section}
-  <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
-</body>
-</html>
-"""
-        with open(os.path.join(out_folder, round_file), "w", encoding="utf-8") as f:
-            f.write(pairing_page)
-    roster_rows = ""
-    for idx, p in enumerate(players, start=1):
-        if len(p) > 10 and p[10]:
-            country = p[10].strip().lower()
-            flag_html = f'<img src="https://flagcdn.com/16x12/{country}.png">'
-        else:
-            flag_html = ""
-        roster_rows += f"<tr><td>{idx}</td><td>{p[1]} {flag_html}</td><td>{p[2]}</td></tr>\n"
-    roster_html = f"""<!DOCTYPE html>
-<html lang="en">
-{get_header_html(base_href)}
-<body>
-  <div class="container container-custom">
-    <h1 class="mt-4">Player Roster - {tournament_name_db}</h1>
-    <table class="table table-striped">
-      <thead><tr><th>#</th><th>Name</th><th>Rating</th></tr></thead>
-      <tbody>
-        {roster_rows if roster_rows else '<tr><td colspan="3">No players registered.</td></tr>'}
-      </tbody>
-    </table>
-    <a href="./index.html" class="btn btn-secondary">Back to Index</a>
-  </div>
-  <footer class="bg-light">Direktor Scrabble Tournament Manager by Manuelito</footer>
-  <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
-</body>
-</html>
-"""
-    roster_path = os.path.join(out_folder, roster_file)
-    with open(roster_path, "w", encoding="utf-8") as f:
-        f.write(roster_html)
-    sorted_players = sorted(players, key=lambda x: (x[3], x[5]), reverse=True)
-    standings_rows = ""
-    for rank, player in enumerate(sorted_players, start=1):
-        scorecard_link = generate_player_scorecard_html(player, tournament_id, out_folder)
-        if len(player) > 10 and player[10]:
-            country = player[10].strip().lower()
-            flag_html = f'<img src="https://flagcdn.com/16x12/{country}.png">'
-        else:
-            flag_html = ""
-        standings_rows += f"<tr><td>{rank}</td><td><a href='./{scorecard_link}'>{player[1]} {flag_html}</a></td><td>{player[3]}</td><td>{player[4]}</td><td>{player[5]}</td><td>{player[6]}</td></tr>\n"
-    standings_html = f"""<!DOCTYPE html>
-<html lang="en">
-{get_header_html(base_href)}
-<body>
-  <div class="container container-custom">
-    <h1 class="mt-4">Standings - {tournament_name_db}</h1>
-    <table class="table table-hover">
-      <thead>
-        <tr><th>Rank</th><th>Name</th><th>Wins</th><th>Losses</th><th>Spread</th><th>Last Result</th></tr>
-      </thead>
-      <tbody>
-        {standings_rows if standings_rows else '<tr><td colspan="6">No standings available.</td></tr>'}
-      </tbody>
-    </table>
-    <a href="./index.html" class="btn btn-secondary">Back to Index</a>
-  </div>
-  <footer class="bg-light">Direktor Scrabble Tournament Manager by Manuelito</footer>
-  <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
-</body>
-</html>
-"""
-    standings_path = os.path.join(out_folder, standings_file)
-    with open(standings_path, "w", encoding="utf-8") as f:
-        f.write(standings_html)
-    prize_rows = ""
-    for prize in prize_table:
-        if prize["prize_type"] == "Monetary":
-            prize_rows += f"<tr><td>{prize['prize_name']}</td><td>{prize['currency']} {prize['amount']}</td></tr>\n"
-        else:
-            prize_rows += f"<tr><td>{prize['prize_name']}</td><td>{prize['prize_description']}</td></tr>\n"
-    prize_html = f"""<!DOCTYPE html>
-<html lang="en">
-{get_header_html(base_href)}
-<body>
-  <div class="container container-custom">
-    <h1 class="mt-4">Prize Table - {tournament_name_db}</h1>
-    <table class="table table-bordered">
-      <thead><tr><th>Prize Name</th><th>Details</th></tr></thead>
-      <tbody>
-        {prize_rows if prize_rows else '<tr><td colspan="2">No prizes set.</td></tr>'}
-      </tbody>
-    </table>
-    <a href="./index.html" class="btn btn-secondary">Back to Index</a>
-  </div>
-  <footer class="bg-light">Direktor Scrabble Tournament Manager by Manuelito</footer>
-  <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
-</body>
-</html>
-"""
-    prize_path = os.path.join(out_folder, prize_file)
-    with open(prize_path, "w", encoding="utf-8") as f:
-        f.write(prize_html)
-    round_links_html = ""
-    for r, link in pairing_round_links:
-        round_links_html += f"<li class='list-group-item'><a href='./{link}'>Round {r} Pairings</a></li>\n"
-    navbar_html = f"""<nav class="navbar navbar-expand-lg navbar-light bg-light mb-4">
-  <div class="container">
-    <a class="navbar-brand" href="./index.html"></a>
-    <button class="navbar-toggler" type="button" data-bs-toggle="collapse" 
-            data-bs-target="#navbarNav" aria-controls="navbarNav" aria-expanded="false" 
-            aria-label="Toggle navigation">
-      <span class="navbar-toggler-icon"></span>
-    </button>
-    <div class="collapse navbar-collapse" id="navbarNav">
-      <ul class="navbar-nav ms-auto">
-        <li class="nav-item"><a class="nav-link" href="./index.html">Home</a></li>
-        <li class="nav-item"><a class="nav-link" href="./{roster_file}">Roster</a></li>
-        <li class="nav-item"><a class="nav-link" href="./{standings_file}">Standings</a></li>
-        <li class="nav-item"><a class="nav-link" href="./{prize_file}">Prize Table</a></li>
-      </ul>
-    </div>
-  </div>
-</nav>"""
-    footer_section = '<footer class="bg-light">Direktor Scrabble Tournament Manager by Manuelito</footer>'
+    players = get_players_for_tournament(tournament_id) or []
     folder_name = re.sub(r'[\\/*?:"<>|]', "", tournament_name).replace(" ", "_")
     # If public_ip starts with http:// or https://, do not append the port.
     if public_ip.startswith("http://") or public_ip.startswith("https://"):
         shareable = f"{public_ip}/tournaments/{folder_name}"
     else:
         shareable = f"http://{public_ip}:{HTTP_PORT}/tournaments/{folder_name}"
-    index_html = f"""<!DOCTYPE html>
-<html lang="en">
-{get_header_html(base_href)}
-<body>
-  {navbar_html}
-  <div class="container container-custom">
-    <h1 class="mb-3">{tournament_name_db}</h1>
-    <p class="lead">{tournament_date_db} | {tournament_venue}</p>
-    <h2 class="mt-4">Event Coverage Index</h2>
-    <ul class="list-group">
-      <li class="list-group-item"><a href="{shareable}/{roster_file}">Player Roster</a></li>
-      {round_links_html}
-      <li class="list-group-item"><a href="{shareable}/{standings_file}">Standings</a></li>
-      <li class="list-group-item"><a href="{shareable}/{prize_file}">Prize Table</a></li>
-    </ul>
-    <br>
-    <a href="/submit_results" class="btn btn-primary">Submit Results</a>
-    <br><br>
-    <p>Shareable URL: <a href="{shareable}">{shareable}</a></p>
-  </div>
-  {footer_section}
-  <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
-</body>
-</html>
-"""
-    index_path = os.path.join(out_folder, index_file)
-    with open(index_path, "w", encoding="utf-8") as f:
-        f.write(index_html)
-    return index_path
+    # Pages whose inputs are unchanged since the last render are skipped.
+    pages = tournament_pages(tournament_id, tournament_name_db, tournament_date_db, tournament_venue,
+                             players, completed_rounds if rounds is None else rounds,
+                             prize_table if prizes is None else prizes, shareable)
+    # Scorecards of players outside changed are not even hashed.
+    unchanged = None
+    if changed is not None:
+        unchanged = {scorecard_file(tournament_id, p[0]) for p in players if p[0] not in changed}
+    def progress(done, total):
+        task.report(done, total, f"{done}/{total} pages")
+        task.check_cancelled()
+    try:
+        report = render_pages(out_folder, pages, progress=progress if task else None, unchanged=unchanged)
+    except BaseException:
+        # Which scorecards were written is unknown; hash them all next time.
+        changed_players = None
+        raise
+    if report["written"]:
+        refresh_tournament_folder_index()
+    return os.path.join(out_folder, page_files(tournament_id)["index"]), report
 
 ##################################
 # FTP Functions
 ##################################
-def ftp_upload_dir(ftp, local_dir, remote_dir):
-    try:
-        ftp.mkd(remote_dir)
-    except Exception:
-        pass
-    for item in os.listdir(local_dir):
-        local_path = os.path.join(local_dir, item)
-        remote_path = f"{remote_dir}/{item}"
-        if os.path.isfile(local_path):
-            with open(local_path, "rb") as f:
-                ftp.storbinary(f"STOR {remote_path}", f)
-        elif os.path.isdir(local_path):
-            ftp_upload_dir(ftp, local_path, remote_path)
-
-def mirror_website_via_ftp(ftp_host, ftp_user, ftp_pass):
-    try:
-        ftp = ftplib.FTP(ftp_host)
-        ftp.login(ftp_user, ftp_pass)
-    except Exception as e:
-        messagebox.showerror("FTP Error", f"FTP login failed: {e}")
-        return None
+def ftp_site_link(ftp_host, tournament_name):
+    return f"http://{ftp_host}/{tournament_name.replace(' ', '_')}/index.html"
+
+def mirror_website_via_ftp(task, ftp_host, ftp_user, ftp_pass, tournament_name, force=False):
+    # Runs on a worker thread; errors are raised for the caller's on_error.
+    # Only files changed since the last mirror to this server are uploaded.
+    # Returns (shareable link, sync report).
+    report = sync_folder(ftp_host, ftp_user, ftp_pass, get_tournament_folder(tournament_name),
+                         tournament_name.replace(" ", "_"), force=force, task=task)
+    return ftp_site_link(ftp_host, tournament_name), report
+
+def start_ftp_mirror(ftp_host, ftp_user, ftp_pass, on_done=None, on_error=None, force=False):
+    # Upload the current tournament's folder in the background.
     if current_tournament_id is None:
         messagebox.showerror("Error", "No tournament loaded.")
         return None
-    conn = create_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT name FROM tournaments WHERE id = ?", (current_tournament_id,))
-    result = cursor.fetchone()
-    conn.close()
+    result = execute_query("SELECT name FROM tournaments WHERE id = ?", (current_tournament_id,), fetch="one")
     if not result:
         messagebox.showerror("Error", "Tournament not found.")
         return None
-    tournament_name = result[0]
-    local_dir = get_tournament_folder(tournament_name)
-    remote_dir = tournament_name.replace(" ", "_")
-    ftp_upload_dir(ftp, local_dir, remote_dir)
-    ftp.quit()
-    new_link = f"http://{ftp_host}/{remote_dir}/index.html"
-    return new_link
+    def failed(e):
+        messagebox.showerror("FTP Error", f"FTP upload failed: {e}")
+        if on_error:
+            on_error(e)
+    return task_executor.submit("Uploading via FTP", mirror_website_via_ftp, ftp_host, ftp_user, ftp_pass, result[0], force,
+                                on_done=on_done, on_error=failed)
+
+##################################
+# Auto-Publish Functions
+##################################
+def mark_pages_dirty(filenames):
+    # Queue pages for the next automatic publish while auto-publish is on.
+    if auto_publish_settings is not None and current_tournament_id is not None:
+        auto_publish_queue.mark(filenames)
+
+def auto_publish_tick():
+    # Called from drain_tasks: shows the queue depth and starts a publish job
+    # once the queue is due. Only one job runs at a time.
+    global auto_publish_task
+    if auto_publish_label is not None:
+        depth = auto_publish_queue.depth()
+        text = f"Publish queue: {depth} page{'s' if depth != 1 else ''}"
+        if last_publish_report:
+            text += (f" | last: {last_publish_report['files']} files in {last_publish_report['elapsed']:.1f}s, "
+                     f"{last_publish_report['latency']:.1f}s after entry")
+            if last_publish_report["latency"] > auto_publish_queue.budget:
+                text += f" (over the {auto_publish_queue.budget:.0f}s budget)"
+        if last_publish_error:
+            text += f" | retrying after error: {last_publish_error}"
+        if auto_publish_label.cget("text") != text:
+            auto_publish_label.configure(text=text)
+    if auto_publish_settings is None or auto_publish_task is not None or current_tournament_id is None:
+        return
+    if recalc_task is not None or recalc_pending:
+        # Player rows are being rewritten; finish_recalc marks the standings
+        # dirty again, so the publish waits for the new rows.
+        return
+    if not auto_publish_queue.due():
+        return
+    tournament = get_tournament(current_tournament_id)
+    if not tournament:
+        return
+    pages, marked_at = auto_publish_queue.take()
+    rounds, prizes, changed = render_snapshot()
+    started = time.monotonic()
+    def done(report):
+        global auto_publish_task, last_publish_report, last_publish_error
+        auto_publish_task = None
+        auto_publish_queue.finished(time.monotonic() - started)
+        report["latency"] = time.monotonic() - marked_at
+        last_publish_report = report
+        last_publish_error = None
+    def failed(e):
+        global auto_publish_task, last_publish_error
+        auto_publish_task = None
+        auto_publish_queue.failed(pages)
+        if e is not None:
+            last_publish_error = e
+    auto_publish_task = task_executor.submit("Publishing", publish_dirty_pages, dict(auto_publish_settings),
+                                             tournament[0], tournament[1], tournament[2], rounds, prizes, changed, pages,
+                                             on_done=done, on_error=failed, on_cancel=lambda: failed(None))
+
+def publish_dirty_pages(task, settings, tournament_id, tname, tdate, rounds, prizes, changed, pages):
+    # Runs on a worker thread. The render rewrites only pages whose inputs
+    # changed; those and the queued pages are pushed to the target.
+    start = time.monotonic()
+    _, report = generate_tournament_html(tournament_id, tname, tdate, rounds, prizes, changed=changed)
+    out_folder = get_tournament_folder(tname)
+    files = page_variants(out_folder, set(pages) | set(report["written_files"]))
+    target = settings["target"]
+    if target == "Local folder":
+        sent = publish_to_folder(out_folder, files, os.path.join(settings["location"], sanitize_filename(tname)), task)
+    elif target == "Web server":
+        sent = publish_to_server(out_folder, files, settings["location"], sanitize_filename(tname), settings["secret"], task)
+    else:
+        # The FTP mirror compares every file with its manifest, so it also
+        # catches pages changed outside the queue.
+        report = sync_folder(settings["location"], settings["user"], settings["secret"], out_folder,
+                             tname.replace(" ", "_"), task=task)
+        return {"files": report["uploaded"], "bytes": report["bytes"], "elapsed": time.monotonic() - start}
+    return {"files": len(files), "bytes": sent, "elapsed": time.monotonic() - start}
 
 ##################################
 # Player Stats Recalculation
 ##################################
 def recalc_player_stats():
-    global current_tournament_id, completed_rounds, results_by_round
+    # Recalculate in the background from a copy of the rounds. A request made
+    # while a recalculation runs is run again once it finishes, so the last
+    # one always sees the latest results.
+    global recalc_task, recalc_pending
     if current_tournament_id is None:
         return
-    
-    # Update the recalc_player_stats function to use the new database functions
-    # This is a more complex function, so we'll need to make several changes
-    # Find the function recalc_player_stats()
-
-    # First, replace the connection creation:
-    #conn = create_connection()
-    #cursor = conn.cursor()
-
-    # With:
-    #from database_utils import execute_query
-
-    # Then, replace all cursor.execute calls with execute_query
-    # For example, replace:
-    #cursor.execute("""
-    #    UPDATE players 
-    #    SET wins = 0, losses = 0, spread = 0, last_result = '', scorecard = '[]'
-    #    WHERE id = ?
-    #""", (player_id,))
-
-    # With:
-    #execute_query("""
-    #    UPDATE players 
-    #    SET wins = 0, losses = 0, spread = 0, last_result = '', scorecard = '[]'
-    #    WHERE id = ?
-    #""", (player_id,))
-
-    # And replace:
-    #cursor.execute("SELECT id FROM players WHERE name = ? AND tournament_id = ?", (p1_name, current_tournament_id))
-    #p1_id_result = cursor.fetchone()
-
-    # With:
-    #p1_id_result = execute_query("SELECT id FROM players WHERE name = ? AND tournament_id = ?", 
-    #                        (p1_name, current_tournament_id), fetch="one")
-
-    # Finally, remove the conn.commit() and conn.close() calls at the end of the function
-    
-    from database_utils import execute_query
+    if recalc_task is not None:
+        recalc_pending = True
+        return
+    rounds = {r: list(pairings) for r, pairings in completed_rounds.items()}
+    results = {r: list(round_results) for r, round_results in results_by_round.items()}
+    recalc_task = task_executor.submit("Recalculating standings", store_recalculated_stats,
+                                       current_tournament_id, rounds, results,
+                                       on_done=finish_recalc, on_error=finish_recalc, on_cancel=finish_recalc)
 
-    # Get all players for the current tournament
-    players = get_players_for_tournament(current_tournament_id)
-    
-    # Reset player stats
-    for player in players:
-        player_id = player[0]
-        execute_query("""
-            UPDATE players 
-            SET wins = 0, losses = 0, spread = 0, last_result = '', scorecard = '[]'
-            WHERE id = ?
-        """, (player_id,))
-    
-    # Process results by round
-    for round_num in sorted(results_by_round.keys()):
-        round_pairings = completed_rounds.get(round_num, [])
-        round_results = results_by_round.get(round_num, [])
-        
-        for i, pairing in enumerate(round_pairings):
-            if i >= len(round_results) or round_results[i] is None:
-                continue
-                
-            p1_name, p2_name, _ = pairing
-            score1, score2 = round_results[i]
-            
-            # Skip BYE pairings
-            if p1_name == "BYE" or p2_name == "BYE":
-                continue
-                
-            # Find player IDs
-            p1_id_result = execute_query("SELECT id FROM players WHERE name = ? AND tournament_id = ?", 
-                                        (p1_name, current_tournament_id), fetch="one")
-            p2_id_result = execute_query("SELECT id FROM players WHERE name = ? AND tournament_id = ?", 
-                                        (p2_name, current_tournament_id), fetch="one")
-            
-            if not p1_id_result or not p2_id_result:
-                continue
-                
-            p1_id = p1_id_result[0]
-            p2_id = p2_id_result[0]
-            
-            # Update player 1 stats
-            if score1 > score2:
-                # Win
-                execute_query("""
-                    UPDATE players 
-                    SET wins = wins + 1, spread = spread + ?, last_result = ?
-                    WHERE id = ?
-                """, (score1 - score2, f"W {score1}-{score2}", p1_id))
-            elif score1 < score2:
-                # Loss
-                execute_query("""
-                    UPDATE players 
-                    SET losses = losses + 1, spread = spread - ?, last_result = ?
-                    WHERE id = ?
-                """, (score2 - score1, f"L {score1}-{score2}", p1_id))
-            else:
-                # Tie
-                execute_query("""
-                    UPDATE players 
-                    SET wins = wins + 0.5, losses = losses + 0.5, last_result = ?
-                    WHERE id = ?
-                """, (f"T {score1}-{score2}", p1_id))
-                
-            # Update player 2 stats
-            if score2 > score1:
-                # Win
-                execute_query("""
-                    UPDATE players 
-                    SET wins = wins + 1, spread = spread + ?, last_result = ?
-                    WHERE id = ?
-                """, (score2 - score1, f"W {score2}-{score1}", p2_id))
-            elif score2 < score1:
-                # Loss
-                execute_query("""
-                    UPDATE players 
-                    SET losses = losses + 1, spread = spread - ?, last_result = ?
-                    WHERE id = ?
-                """, (score1 - score2, f"L {score2}-{score1}", p2_id))
+def store_recalculated_stats(task, tournament_id, rounds, results):
+    # Rebuild every player's stats and scorecard in memory, then write them
+    # back in one transaction instead of one UPDATE per player and result.
+    players = get_players_for_tournament(tournament_id) or []
+    updated_players = recalculate_player_stats(players, rounds, results)
+    if task:
+        task.check_cancelled()
+    execute_many("""
+        UPDATE players
+        SET wins = ?, losses = ?, spread = ?, last_result = ?, scorecard = ?
+        WHERE id = ?
+    """, [(p[3], p[4], p[5], p[6], p[7], p[0]) for p in updated_players])
+    return len(updated_players)
+
+def finish_recalc(outcome=None):
+    global recalc_task, recalc_pending, changed_players
+    recalc_task = None
+    changed_players = None  # Any scorecard may have changed
+    if isinstance(outcome, Exception):
+        messagebox.showerror("Error", f"Recalculating standings failed: {outcome}")
+    else:
+        # Every scorecard may have changed; the publish job's render finds which.
+        mark_pages_dirty([page_files(current_tournament_id)["standings"]])
+        publish_standings_event()
+    publish_live_state()
+    if recalc_pending:
+        recalc_pending = False
+        recalc_player_stats()
+
+def apply_result_incrementally(round_num, p1, p2, old_scores, new_scores):
+    # Only the two players of the result change; their stored scorecards are
+    # patched in place. Inconsistent stored stats fall back to a full recalc.
+    # Returns True if the players' rows were updated now, False if they are
+    # left to a recalculation.
+    if current_tournament_id is None:
+        return False
+    if recalc_task is not None:
+        # The running recalculation would overwrite the update; queue another.
+        recalc_player_stats()
+        return False
+    players = {p[1]: p for p in get_players_by_name(current_tournament_id, (p1, p2)) or []}
+    updated = []
+    if p1 in players and p2 in players and p1 != p2:
+        swapped_old = old_scores[::-1] if old_scores is not None else None
+        updated = [
+            apply_result_delta(players[p1], round_num, p2, old_scores, new_scores),
+            apply_result_delta(players[p2], round_num, p1, swapped_old, new_scores[::-1])
+        ]
+    if len(updated) != 2 or None in updated:
+        recalc_player_stats()
+        return False
+    execute_many("""
+        UPDATE players
+        SET wins = ?, losses = ?, spread = ?, last_result = ?, scorecard = ?
+        WHERE id = ?
+    """, [(p[3], p[4], p[5], p[6], p[7], p[0]) for p in updated])
+    mark_scorecards_dirty([p[0] for p in updated])
+    mark_pages_dirty([page_files(current_tournament_id)["standings"]] +
+                     [scorecard_file(current_tournament_id, p[0]) for p in updated])
+    publish_live_state()
+    return True
+
+def publish_result_event(round_num, match_number, p1, p2, s1, s2, standings=True):
+    # Push the result and both players' new standings to live spectators.
+    # Without standings (a recalculation will produce them) only the result
+    # is sent; finish_recalc follows with a standings event.
+    tournament = get_tournament(current_tournament_id)
+    if tournament:
+        players = get_players_by_name(current_tournament_id, (p1, p2)) if standings else None
+        publish(sanitize_filename(tournament[1]), "result",
+                result_event(generate_match_id(round_num, match_number), p1, p2, s1, s2, players))
+
+def publish_standings_event():
+    # Push every player's recalculated standings row to live spectators.
+    tournament = get_tournament(current_tournament_id) if current_tournament_id is not None else None
+    if tournament:
+        publish(sanitize_filename(tournament[1]), "standings",
+                standings_event(get_players_for_tournament(current_tournament_id)))
+
+def publish_live_state():
+    # Hand the live pairings to the in-process server so its dynamic pages
+    # show them without waiting for the next render.
+    if current_tournament_id is None:
+        return
+    tournament = get_tournament(current_tournament_id)
+    if tournament:
+        publish_tournament_state(current_tournament_id, tournament[1], completed_rounds, prize_table)
+
+##################################
+# Remote Result Ingestion
+##################################
+def result_ingester_loop():
+    # Background thread: reads rows written to the results table since the
+    # last merged revision, new submissions and corrections alike, and hands
+    # them to the Tk thread. It never touches tournament state or widgets.
+    folder = None
+    subscriber = None
+    while True:
+        tournament = get_tournament(current_tournament_id) if current_tournament_id is not None else None
+        tournament_folder = sanitize_filename(tournament[1]) if tournament else None
+        if tournament_folder != folder:
+            if subscriber is not None:
+                unsubscribe(folder, subscriber)
+            folder = tournament_folder
+            subscriber = subscribe(folder) if folder else None
+        # Live result events wake the ingester at once; otherwise it polls.
+        try:
+            if subscriber is not None:
+                subscriber.get(timeout=INGEST_POLL_SECONDS)
             else:
-                # Tie
-                execute_query("""
-                    UPDATE players 
-                    SET wins = wins + 0.5, losses = losses + 0.5, last_result = ?
-                """, (f"T {score2}-{score1}", p2_id))
-    
-    # Update scorecards
-    for player in players:
-        player_id = player[0]
-        player_name = player[1]
-        
-        scorecard = []
-        cumulative_spread = 0
-        
-        for round_num in sorted(results_by_round.keys()):
-            round_pairings = completed_rounds.get(round_num, [])
-            round_results = results_by_round.get(round_num, [])
-            
-            for i, pairing in enumerate(round_pairings):
-                if i >= len(round_results) or round_results[i] is None:
-                    continue
-                    
-                p1_name, p2_name, _ = pairing
-                score1, score2 = round_results[i]
-                
-                # Skip BYE pairings
-                if p1_name == "BYE" or p2_name == "BYE":
-                    continue
-                    
-                if player_name == p1_name:
-                    opponent = p2_name
-                    if score1 > score2:
-                        result = f"W {score1}-{score2}"
-                        cumulative_spread += (score1 - score2)
-                    elif score1 < score2:
-                        result = f"L {score1}-{score2}"
-                        cumulative_spread -= (score2 - score1)
-                    else:
-                        result = f"T {score1}-{score2}"
-                    
-                    scorecard.append({
-                        "round": round_num,
-                        "opponent": opponent,
-                        "result": result,
-                        "cumulative": cumulative_spread
-                    })
-                    
-                elif player_name == p2_name:
-                    opponent = p1_name
-                    if score2 > score1:
-                        result = f"W {score2}-{score1}"
-                        cumulative_spread += (score2 - score1)
-                    elif score2 < score1:
-                        result = f"L {score2}-{score1}"
-                        cumulative_spread -= (score1 - score2)
-                    else:
-                        result = f"T {score2}-{score1}"
-                    
-                    scorecard.append({
-                        "round": round_num,
-                        "opponent": opponent,
-                        "result": result,
-                        "cumulative": cumulative_spread
-                    })
-        
-        # Update scorecard in database
-        execute_query("""
-            UPDATE players 
-            SET scorecard = ?
-            WHERE id = ?
-        """, (json.dumps(scorecard), player_id))
-    
-    #conn.commit()
-    #conn.close()
+                threading.Event().wait(INGEST_POLL_SECONDS)
+        except queue.Empty:
+            pass
+        if tournament:
+            # The web form submits the folder name with spaces for underscores.
+            rows = execute_query("""
+                SELECT revision, id, match_id, player1_score, player2_score FROM results
+                WHERE (tournament = ? OR tournament = ?) AND revision > ?
+                ORDER BY revision
+            """, (tournament[1], folder.replace("_", " "), ingested_revision), fetch="all")
+            if rows:
+                remote_results.put((tournament[0], [tuple(row) for row in rows]))
+
+def drain_remote_results():
+    # Runs on the Tk thread via app.after.
+    changed = False
+    try:
+        while True:
+            tournament_id, rows = remote_results.get_nowait()
+            if tournament_id != current_tournament_id:
+                continue
+            for revision, result_id, match_id, s1, s2 in rows:
+                if revision > ingested_revision:
+                    merge_remote_result(revision, result_id, match_id, s1, s2)
+                    changed = True
+    except queue.Empty:
+        pass
+    if changed:
+        journal({"op": "progress", "values": {"ingested_revision": ingested_revision, "review_queue": review_queue}})
+        if review_refresh:
+            review_refresh()
+    app.after(500, drain_remote_results)
+
+def merge_remote_result(revision, result_id, match_id, s1, s2):
+    # A corrected submission keeps its row id but takes a new revision. It is
+    # compared with the entered result like a new one, and replaces any
+    # earlier revision of the same match still waiting for review.
+    global ingested_revision
+    ingested_revision = max(ingested_revision, revision)
+    review_queue[:] = [entry for entry in review_queue if entry["match_id"] != match_id]
+    entry = {"result_id": result_id, "revision": revision, "match_id": match_id, "scores": [s1, s2],
+             "round": None, "index": None, "players": None, "current": None, "reason": ""}
+    parsed = parse_match_id(match_id)
+    if parsed is None or not 1 <= parsed[1] <= len(completed_rounds.get(parsed[0], [])):
+        entry["reason"] = "No such match in the current pairings"
+        review_queue.append(entry)
+        return
+    round_num, idx = parsed[0], parsed[1] - 1
+    p1, p2 = completed_rounds[round_num][idx].player1, completed_rounds[round_num][idx].player2
+    entry.update(round=round_num, index=idx, players=[p1, p2])
+    if "BYE" in (p1, p2):
+        entry["reason"] = "BYE pairing takes no result"
+        review_queue.append(entry)
+        return
+    round_results = results_by_round.setdefault(round_num, [])
+    round_results.extend([None] * (len(completed_rounds[round_num]) - len(round_results)))
+    current = round_results[idx]
+    if current is not None:
+        if tuple(current) != (s1, s2):
+            entry["current"] = list(current)
+            entry["reason"] = "Differs from the entered result"
+            review_queue.append(entry)
+        return
+    round_results[idx] = Result(s1, s2)
+    journal_result(round_num, idx, (s1, s2))
+    applied = apply_result_incrementally(round_num, p1, p2, None, (s1, s2))
+    publish_result_event(round_num, idx + 1, p1, p2, s1, s2, applied)
+
+def resolve_review(entry, accept):
+    # Accepting replaces the entered result with the remote one.
+    if entry in review_queue:
+        review_queue.remove(entry)
+        journal({"op": "progress", "values": {"review_queue": review_queue}})
+    if accept and entry["players"] and "BYE" not in entry["players"]:
+        if entry["round"] not in completed_rounds:
+            return
+        p1, p2 = entry["players"]
+        idx = entry["index"]
+        round_results = results_by_round.setdefault(entry["round"], [])
+        round_results.extend([None] * (len(completed_rounds[entry["round"]]) - len(round_results)))
+        old_scores = round_results[idx]
+        new_scores = Result(*entry["scores"])
+        round_results[idx] = new_scores
+        journal_result(entry["round"], idx, new_scores)
+        applied = apply_result_incrementally(entry["round"], p1, p2, tuple(old_scores) if old_scores is not None else None, new_scores)
+        publish_result_event(entry["round"], idx + 1, p1, p2, *new_scores, applied)
+
+##################################
+# UI Functions: Remote Results Tab
+##################################
+def setup_remote_results(tab_frame):
+    global review_refresh
+    label = ctk.CTkLabel(tab_frame, text="Remote Results", font=("Arial", 18))
+    label.pack(pady=10)
+    status = ctk.CTkLabel(tab_frame, text="")
+    status.pack(pady=5)
+    list_frame = ctk.CTkScrollableFrame(tab_frame, width=800, height=400)
+    list_frame.pack(pady=5, fill="both", expand=True)
+    def refresh():
+        for widget in list_frame.winfo_children():
+            widget.destroy()
+        status.configure(text=f"Submissions merged up to revision {ingested_revision}; {len(review_queue)} awaiting review.")
+        if not review_queue:
+            ctk.CTkLabel(list_frame, text="No submissions need review.").pack(pady=10)
+            return
+        for entry in list(review_queue):
+            row = ctk.CTkFrame(list_frame)
+            row.pack(fill="x", pady=2)
+            players = " vs ".join(entry["players"]) if entry["players"] else "Unknown pairing"
+            text = f"{entry['match_id']}: {players} {entry['scores'][0]}-{entry['scores'][1]}"
+            if entry["current"]:
+                text += f" (entered {entry['current'][0]}-{entry['current'][1]})"
+            ctk.CTkLabel(row, text=f"{text} | {entry['reason']}", anchor="w").pack(side="left", padx=5)
+            ctk.CTkButton(row, text="Dismiss", width=80,
+                          command=lambda e=entry: (resolve_review(e, False), refresh())).pack(side="right", padx=2)
+            if entry["players"] and "BYE" not in entry["players"]:
+                ctk.CTkButton(row, text="Use Remote", width=100,
+                              command=lambda e=entry: (resolve_review(e, True), refresh())).pack(side="right", padx=2)
+    review_refresh = refresh
+    refresh_button = ctk.CTkButton(tab_frame, text="Refresh", command=refresh)
+    refresh_button.pack(pady=5)
+    refresh()
 
 ##################################
 # UI Functions: Sponsor Logos Tab
@@ -958,6 +1036,8 @@ def setup_prize_table(tab_frame):
             desc = description_entry.get().strip()
             prize = {"prize_name": name, "prize_type": "Non-monetary", "prize_description": desc}
         prize_table.append(prize)
+        journal({"op": "progress", "values": {"prize_table": prize_table}})
+        publish_live_state()
         messagebox.showinfo("Success", "Prize added.")
         prize_name_entry.delete(0, "end")
         amount_entry.delete(0, "end")
@@ -1001,23 +1081,93 @@ def setup_render(tab_frame):
     info.pack(pady=10)
     render_button = ctk.CTkButton(tab_frame, text="Open Event Coverage Index", command=open_event_index)
     render_button.pack(pady=10)
+    setup_auto_publish(tab_frame)
+
+def setup_auto_publish(tab_frame):
+    global auto_publish_label
+    frame = ctk.CTkFrame(tab_frame)
+    frame.pack(pady=10, padx=20, fill="x")
+    title = ctk.CTkLabel(frame, text="Auto-Publish", font=("Arial", 16))
+    title.grid(row=0, column=0, columnspan=2, pady=5)
+    target_var = ctk.StringVar(value=auto_publish_settings["target"] if auto_publish_settings else "Local folder")
+    target_menu = ctk.CTkOptionMenu(frame, variable=target_var, values=["Local folder", "FTP", "Web server"])
+    target_menu.grid(row=1, column=0, columnspan=2, pady=5)
+    fields = {}
+    for row, (key, text, show) in enumerate([
+        ("location", "Folder / FTP host / server URL:", ""),
+        ("user", "FTP username:", ""),
+        ("secret", "FTP password / publish token:", "*"),
+        ("debounce", "Wait after last result (s):", ""),
+        ("budget", "Latency budget (s):", ""),
+    ], start=2):
+        ctk.CTkLabel(frame, text=text).grid(row=row, column=0, padx=5, pady=2, sticky="e")
+        entry = ctk.CTkEntry(frame, width=260, show=show)
+        entry.grid(row=row, column=1, padx=5, pady=2, sticky="w")
+        fields[key] = entry
+    fields["debounce"].insert(0, str(auto_publish_queue.debounce))
+    fields["budget"].insert(0, str(auto_publish_queue.budget))
+    if auto_publish_settings:
+        for key in ("location", "user", "secret"):
+            fields[key].insert(0, auto_publish_settings[key])
+    enabled_var = ctk.BooleanVar(value=auto_publish_settings is not None)
+    def toggle():
+        global auto_publish_settings
+        if not enabled_var.get():
+            auto_publish_settings = None
+            return
+        settings = {key: fields[key].get().strip() for key in ("location", "user", "secret")}
+        settings["target"] = target_var.get()
+        try:
+            debounce = float(fields["debounce"].get())
+            budget = float(fields["budget"].get())
+        except ValueError:
+            messagebox.showerror("Error", "Wait and budget must be numbers of seconds.")
+            enabled_var.set(False)
+            return
+        missing = not settings["location"] or (settings["target"] != "Local folder" and not settings["secret"]) \
+            or (settings["target"] == "FTP" and not settings["user"])
+        if missing:
+            messagebox.showerror("Error", "Please fill in the fields for the selected target.")
+            enabled_var.set(False)
+            return
+        auto_publish_queue.debounce = max(0.0, debounce)
+        auto_publish_queue.budget = max(auto_publish_queue.debounce, budget)
+        auto_publish_settings = settings
+        tournament = get_tournament(current_tournament_id) if current_tournament_id is not None else None
+        if tournament:
+            # The first job pushes every page already rendered; later jobs only changed ones.
+            folder = get_tournament_folder(tournament[1])
+            mark_pages_dirty([name for name in os.listdir(folder) if name.endswith(".html")] +
+                             [page_files(current_tournament_id)["index"]])
+    enabled_switch = ctk.CTkSwitch(frame, text="Publish automatically after each result", variable=enabled_var, command=toggle)
+    enabled_switch.grid(row=7, column=0, columnspan=2, pady=5)
+    auto_publish_label = ctk.CTkLabel(frame, text="")
+    auto_publish_label.grid(row=8, column=0, columnspan=2, pady=5)
 
 def open_event_index():
     global public_ip
     if current_tournament_id is None:
         messagebox.showerror("Error", "No tournament loaded. Please create a tournament first.")
         return
-    conn = create_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT name, date FROM tournaments WHERE id = ?", (current_tournament_id,))
-    result = cursor.fetchone()
-    conn.close()
+    result = execute_query("SELECT name, date FROM tournaments WHERE id = ?", (current_tournament_id,), fetch="one")
     if result:
         tname, tdate = result
     else:
         tname, tdate = "Tournament", ""
-    generated_index = generate_tournament_html(current_tournament_id, tname, tdate)
-    final_index = finalize_tournament_html(tname, generated_index)
+    rounds, prizes, changed = render_snapshot()
+    task_executor.submit("Rendering event pages", render_event_index, current_tournament_id, tname, tdate, rounds, prizes, changed,
+                         on_done=show_event_index,
+                         on_error=lambda e: messagebox.showerror("Error", f"Rendering failed: {e}"))
+
+def render_event_index(task, tournament_id, tname, tdate, rounds, prizes, changed):
+    # Runs on a worker thread.
+    generated_index, report = generate_tournament_html(tournament_id, tname, tdate, rounds, prizes, task, changed)
+    return finalize_tournament_html(tname, generated_index), report
+
+def show_event_index(outcome):
+    final_index, report = outcome
+    show_toast(app, f"{report['written']} pages updated ({report['bytes'] // 1024} KB), "
+                    f"{report['skipped']} unchanged ({report['elapsed']:.2f}s)")
     rendered_dir = os.path.join(os.getcwd(), "rendered")
     relative_path = os.path.relpath(final_index, rendered_dir).replace(os.sep, '/')
     # If public_ip already starts with "http://" or "https://", do not append a port.
@@ -1121,8 +1271,11 @@ def setup_enter_results(tab_frame):
             return
         if sel not in results_by_round:
             results_by_round[sel] = [None] * len(current)
-        results_by_round[sel][idx] = (s1, s2)
-        recalc_player_stats()
+        old_scores = results_by_round[sel][idx]
+        results_by_round[sel][idx] = Result(s1, s2)
+        journal_result(sel, idx, (s1, s2))
+        applied = apply_result_incrementally(sel, p1, p2, tuple(old_scores) if old_scores is not None else None, (s1, s2))
+        publish_result_event(sel, idx + 1, p1, p2, s1, s2, applied)
         if s1 > s2:
             spread_diff = s1 - s2
             msg = f"Result submitted. {p1} wins by {spread_diff}."
@@ -1153,7 +1306,7 @@ def setup_tournament_setup(tab_frame):
     connection_type_menu.pack(pady=5)
     sponsor_logos  # sponsor_logos remains a global variable
     def create_tournament():
-        global current_tournament_id, session_players, current_round_number, completed_rounds, tournament_mode, teams_list, team_size, last_pairing_system, last_team_size, public_ip, shareable_link
+        global current_tournament_id, session_players, current_round_number, completed_rounds, tournament_mode, teams_list, team_size, last_pairing_system, last_team_size, public_ip, shareable_link, round_robin_schedule, ingested_revision, changed_players, loaded_tou_path
         name = tournament_name_entry.get().strip()
         date = tournament_date_entry.get().strip()
         venue = venue_entry.get().strip()
@@ -1176,18 +1329,24 @@ def setup_tournament_setup(tab_frame):
         tournament_id = insert_tournament(None, name, date, venue)
         if tournament_id:
             current_tournament_id = tournament_id
+            loaded_tou_path = None
+            changed_players = None
             session_players = []
             current_round_number = 0
             completed_rounds.clear()
             results_by_round.clear()
-            generated_file = generate_tournament_html(tournament_id, name, date)
-            final_file = finalize_tournament_html(name, generated_file)
-            rendered_dir = os.path.join(os.getcwd(), "rendered")
-            relative_path = os.path.relpath(final_file, rendered_dir).replace(os.sep, '/')
+            pairing_history.clear()
+            round_robin_schedule = None
+            ingested_revision = 0
+            review_queue.clear()
+            submit_tournament_snapshot()  # Base for the progress journal
+            publish_live_state()
 
             # Create folder name for URLs
             folder_name = re.sub(r'[\\/*?:"<>|]', "", name).replace(" ", "_")
-            
+            fallback_link = f"http://direktorexe.onrender.com/tournaments/{folder_name}"
+            ftp_login = None
+
             if connection_type_var.get() == "Local IP":
                 public_ip = get_local_ip()
                 shareable_link = f"http://{public_ip}:{HTTP_PORT}/tournaments/{folder_name}"
@@ -1199,18 +1358,32 @@ def setup_tournament_setup(tab_frame):
                 ftp_user = simpledialog.askstring("FTP Username", "Enter FTP username:")
                 ftp_pass = simpledialog.askstring("FTP Password", "Enter FTP password:", show="*")
                 if ftp_host and ftp_user and ftp_pass:
-                    new_link = mirror_website_via_ftp(ftp_host, ftp_user, ftp_pass)
-                    if new_link:
-                        shareable_link = new_link
-                    else:
-                        public_ip = "http://direktorexe.onrender.com"
-                        shareable_link = f"{public_ip}/tournaments/{folder_name}"
+                    ftp_login = (ftp_host, ftp_user, ftp_pass)
+                    shareable_link = ftp_site_link(ftp_host, name)
                 else:
                     public_ip = "http://direktorexe.onrender.com"
-                    shareable_link = f"{public_ip}/tournaments/{folder_name}"
+                    shareable_link = fallback_link
 
             update_tournament_link(tournament_id, shareable_link)
             show_toast(tab_frame, f"Tournament '{name}' created. Link: {shareable_link}")
+
+            def use_fallback_link(e=None):
+                # The FTP upload failed or could not start: use the Render URL.
+                global public_ip, shareable_link
+                update_tournament_link(tournament_id, fallback_link)
+                if current_tournament_id == tournament_id:
+                    public_ip = "http://direktorexe.onrender.com"
+                    shareable_link = fallback_link
+                    show_toast(app, f"FTP upload failed. Link: {shareable_link}")
+            def rendered(outcome):
+                # The FTP upload starts once the pages it mirrors exist.
+                if ftp_login and current_tournament_id == tournament_id:
+                    if not start_ftp_mirror(*ftp_login, on_error=use_fallback_link):
+                        use_fallback_link()
+            rounds, prizes, changed = render_snapshot()
+            task_executor.submit("Rendering event pages", render_event_index, tournament_id, name, date, rounds, prizes, changed,
+                                 on_done=rendered,
+                                 on_error=lambda e: messagebox.showerror("Error", f"Rendering failed: {e}"))
             update_status()
         else:
             show_toast(tab_frame, "Failed to create tournament.")
@@ -1297,7 +1470,7 @@ def setup_pairings(tab_frame):
     round_selection_var = ctk.StringVar(value="New Round")
     round_dropdown = ctk.CTkOptionMenu(tab_frame, variable=round_selection_var, values=round_options)
     round_dropdown.pack(pady=5)
-    pairing_systems = ["Round Robin", "Random Pairing", "King of the Hills Pairing", "Australian Draw", "Lagged Australian"]
+    pairing_systems = ["Round Robin", "Random Pairing", "King of the Hills Pairing", "Australian Draw", "Lagged Australian", "Optimal Matching"]
     system_var = ctk.StringVar(value=last_pairing_system)
     system_menu = ctk.CTkOptionMenu(tab_frame, variable=system_var, values=pairing_systems)
     system_menu.pack(pady=5)
@@ -1339,8 +1512,10 @@ def setup_pairings(tab_frame):
         last_pairing_system = system_var.get()
         players = get_players_for_tournament(current_tournament_id)
         new_pairings = generate_pairings_system(players, system=last_pairing_system)
+        if new_pairings is None:
+            return
         current_round_number += 1
-        completed_rounds[current_round_number] = new_pairings
+        store_round_pairings(current_round_number, new_pairings)
         update_round_options()
         display_full_schedule()
     def unpair_round(round_var):
@@ -1349,7 +1524,7 @@ def setup_pairings(tab_frame):
             return
         round_num = int(round_var.get().split()[1])
         if round_num in completed_rounds:
-            del completed_rounds[round_num]
+            remove_round_pairings(round_num)
             update_round_options()
             pairing_text.delete("1.0", "end")
     update_round_options()
@@ -1372,6 +1547,9 @@ def setup_ftp_settings(tab_frame):
     pass_label.pack(pady=5)
     pass_entry = ctk.CTkEntry(tab_frame, show="*")
     pass_entry.pack(pady=5)
+    force_var = ctk.BooleanVar(value=False)
+    force_check = ctk.CTkCheckBox(tab_frame, text="Re-upload all files", variable=force_var)
+    force_check.pack(pady=5)
     def mirror_action():
         ftp_host = host_entry.get().strip()
         ftp_user = user_entry.get().strip()
@@ -1379,9 +1557,11 @@ def setup_ftp_settings(tab_frame):
         if not ftp_host or not ftp_user or not ftp_pass:
             messagebox.showerror("Error", "Please fill in all FTP fields.")
             return
-        new_link = mirror_website_via_ftp(ftp_host, ftp_user, ftp_pass)
-        if new_link:
-            messagebox.showinfo("Success", f"Website mirrored successfully!\nShareable link: {new_link}")
+        start_ftp_mirror(ftp_host, ftp_user, ftp_pass,
+                         on_done=lambda outcome: messagebox.showinfo(
+                             "Success", f"Website mirrored successfully! {outcome[1]['uploaded']} files uploaded, "
+                                        f"{outcome[1]['skipped']} unchanged.\nShareable link: {outcome[0]}"),
+                         force=force_var.get())
     mirror_button = ctk.CTkButton(tab_frame, text="Mirror Website", command=mirror_action)
     mirror_button.pack(pady=10)
 
@@ -1407,6 +1587,8 @@ def setup_tab_content(tab_name, tab_frame):
         setup_reports(tab_frame)
     elif tab_name == "Render":
         setup_render(tab_frame)
+    elif tab_name == "Remote Results":
+        setup_remote_results(tab_frame)
     else:
         label = ctk.CTkLabel(tab_frame, text=tab_name, font=("Arial", 18))
         label.pack(pady=20)
@@ -1416,7 +1598,7 @@ def setup_tab_content(tab_name, tab_frame):
     tab_save_button.pack(pady=5)
 
 def build_tab_view(parent):
-    tabs = ["Tournament Setup", "Player Registration", "Pairings", "Enter Results", "Prize Table", "Sponsor Logos", "FTP Settings", "Reports & Exports", "Render"]
+    tabs = ["Tournament Setup", "Player Registration", "Pairings", "Enter Results", "Remote Results", "Prize Table", "Sponsor Logos", "FTP Settings", "Reports & Exports", "Render"]
     tab_view = ctk.CTkTabview(parent, width=880, height=700)
     tab_view.pack(fill="both", expand=True)
     for tab in tabs:
@@ -1466,6 +1648,7 @@ if __name__ == "__main__":
     # Add status label to sidebar
     status_label = ctk.CTkLabel(sidebar_frame, text="No tournament loaded.")
     status_label.pack(pady=20, padx=20)
+    setup_task_status(sidebar_frame)
     
     main_frame_global = ctk.CTkFrame(app)
     main_frame_global.grid(row=0, column=1, sticky="nsew")
@@ -1476,6 +1659,11 @@ if __name__ == "__main__":
     flask_thread = threading.Thread(target=run_flask_app, daemon=True)
     flask_thread.start()
     
+    ingester_thread = threading.Thread(target=result_ingester_loop, daemon=True)
+    ingester_thread.start()
+    app.after(500, drain_remote_results)
+    app.after(100, drain_tasks)
+    
     build_tab_view(main_frame_global)
     
     app.mainloop()
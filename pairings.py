@@ -2,11 +2,20 @@
 pairings.py - Pairing algorithms for Direktor EXE Scrabble Tournament Manager
 
 This module contains all the pairing algorithms used in the tournament manager,
-including Round Robin, Random Pairing, King of the Hills, Australian Draw, and
-Lagged Australian.
+including Round Robin, Random Pairing, King of the Hills, Australian Draw,
+Lagged Australian, and Optimal Matching.
 """
 
 import random
+from matching import max_weight_matching
+
+# Optimal Matching cost weights. The rematch penalty is raised to at least
+# the largest total standings distance a matching can have, so a rematch is
+# never traded for a closer pairing elsewhere.
+OPTIMAL_GAP_WEIGHT = 1
+OPTIMAL_REPEAT_PENALTY = 10 ** 6
+OPTIMAL_BALANCE_WEIGHT = 4
+OPTIMAL_WINDOW = 12
 
 def round_robin(players):
     """
@@ -26,6 +35,28 @@ def round_robin(players):
             pairings.append((players[i], players[j]))
     return pairings
 
+def _circle_round(seating, round_index):
+    """
+    Compute one round of the circle method directly from the seating.
+    
+    Seat 0 stays fixed while the other seats rotate one place per round, so
+    seat p in round k holds seating[1 + (p - 1 - k) mod (n - 1)].
+    
+    Args:
+        seating (list): Player names with an even length (BYE included)
+        round_index (int): Zero-based round within one cycle
+        
+    Returns:
+        list: (seat position, player name) pairs for the round, in pairing order
+    """
+    n = len(seating)
+    rotation = n - 1
+    def at(position):
+        if position == 0:
+            return seating[0]
+        return seating[1 + (position - 1 - round_index) % rotation]
+    return [((j, at(j)), (n - 1 - j, at(n - 1 - j))) for j in range(n // 2)]
+
 def round_robin_rounds(players):
     """
     Generate a round-robin schedule where each round contains pairings
@@ -40,15 +71,76 @@ def round_robin_rounds(players):
     players = players[:]
     if len(players) % 2 == 1:
         players.append("BYE")
-    n = len(players)
-    rounds = []
-    for i in range(n - 1):
-        round_pairs = []
-        for j in range(n // 2):
-            round_pairs.append((players[j], players[n - 1 - j]))
-        players.insert(1, players.pop())
-        rounds.append(round_pairs)
-    return rounds
+    return [[(p1, p2) for (_, p1), (_, p2) in _circle_round(players, k)] for k in range(len(players) - 1)]
+
+def create_round_robin_schedule(players, seed=None, cycles=1, start_round=1):
+    """
+    Describe a deterministic round-robin schedule without building its rounds.
+    
+    The returned dictionary is JSON-serialisable, so it can be cached per
+    tournament and saved in the .tou file; any round is then computed on
+    demand with round_robin_pairing_round.
+    
+    Args:
+        players (list): List of player names
+        seed (int, optional): Seed for shuffling the seating; None keeps the given order
+        cycles (int): 1 for a single round robin, 2 for double, 4 for quadruple
+        start_round (int): Tournament round number of the schedule's first round
+        
+    Returns:
+        dict: Schedule description with seating, seed, cycles and start_round
+    """
+    seating = list(players)
+    if seed is not None:
+        random.Random(seed).shuffle(seating)
+    if len(seating) % 2 == 1:
+        seating.append("BYE")
+    return {"seating": seating, "seed": seed, "cycles": cycles, "start_round": start_round}
+
+def round_robin_round_count(schedule):
+    """
+    Get the number of rounds in a round-robin schedule.
+    
+    Args:
+        schedule (dict): Schedule from create_round_robin_schedule
+        
+    Returns:
+        int: Total rounds across all cycles
+    """
+    return max(len(schedule["seating"]) - 1, 0) * schedule.get("cycles", 1)
+
+def round_robin_pairing_round(schedule, round_number):
+    """
+    Compute a single round of a round-robin schedule, with firsts assigned.
+    
+    Firsts follow the seat positions so that players alternate going first
+    from round to round, and are swapped in every second cycle of a double
+    or quadruple round robin. The same schedule always yields the same round.
+    
+    Args:
+        schedule (dict): Schedule from create_round_robin_schedule
+        round_number (int): One-based round within the schedule
+        
+    Returns:
+        list: List of tuples containing player pairings and first player
+    """
+    per_cycle = len(schedule["seating"]) - 1
+    if per_cycle < 1 or not 1 <= round_number <= round_robin_round_count(schedule):
+        raise ValueError(f"Round {round_number} is outside the round robin schedule.")
+    cycle, round_index = divmod(round_number - 1, per_cycle)
+    pairings = []
+    for (seat1, p1), (seat2, p2) in _circle_round(schedule["seating"], round_index):
+        if p1 == "BYE" or p2 == "BYE":
+            pairings.append((p1, p2, p1 if p1 != "BYE" else p2))
+            continue
+        if seat1 == 0:
+            p1_first = round_index % 2 == 1
+        else:
+            p1_first = seat1 % 2 == 1
+        if cycle % 2 == 1:
+            p1_first = not p1_first
+        pairings.append((p1, p2, p1 if p1_first else p2))
+    return pairings
 
 def assign_firsts(rounds):
     """
@@ -136,7 +228,82 @@ def king_of_the_hills_pairings(players):
         pairings.append((p1, p2, first))
     return pairings
 
-def has_played(player1, player2, completed_rounds):
+def pair_key(player1, player2):
+    """
+    Build the order-independent key used by the pairing history.
+    
+    Args:
+        player1 (str): First player's name
+        player2 (str): Second player's name
+        
+    Returns:
+        tuple: The two names in sorted order
+    """
+    return (player1, player2) if player1 <= player2 else (player2, player1)
+
+def record_pairings(history, pairings):
+    """
+    Add one round of pairings to a pairing history.
+    
+    Args:
+        history (dict): Pairing history mapping pair keys to games played
+        pairings (list): Pairings of the round
+    """
+    for pairing in pairings:
+        if len(pairing) >= 2:
+            key = pair_key(pairing[0], pairing[1])
+            history[key] = history.get(key, 0) + 1
+
+def forget_pairings(history, pairings):
+    """
+    Remove one round of pairings from a pairing history (e.g. when unpairing).
+    
+    Args:
+        history (dict): Pairing history mapping pair keys to games played
+        pairings (list): Pairings of the round
+    """
+    for pairing in pairings:
+        if len(pairing) >= 2:
+            key = pair_key(pairing[0], pairing[1])
+            count = history.get(key, 0) - 1
+            if count > 0:
+                history[key] = count
+            else:
+                history.pop(key, None)
+
+def build_pairing_history(completed_rounds):
+    """
+    Build the repeat-pairing index from completed rounds.
+    
+    The index is built once and then kept current with record_pairings and
+    forget_pairings, so repeat checks are O(1) dictionary lookups.
+    
+    Args:
+        completed_rounds (dict): Dictionary of completed rounds
+        
+    Returns:
+        dict: Pairing history mapping pair keys to games played
+    """
+    history = {}
+    for rnd in completed_rounds.values():
+        record_pairings(history, rnd)
+    return history
+
+def play_count(history, player1, player2):
+    """
+    Get how many times two players have been paired.
+    
+    Args:
+        history (dict): Pairing history from build_pairing_history
+        player1 (str): First player's name
+        player2 (str): Second player's name
+        
+    Returns:
+        int: Number of games between the two players
+    """
+    return history.get(pair_key(player1, player2), 0)
+
+def has_played(player1, player2, completed_rounds, history=None):
     """
     Check if two players have already played against each other.
     
@@ -144,27 +311,29 @@ def has_played(player1, player2, completed_rounds):
         player1 (str): First player's name
         player2 (str): Second player's name
         completed_rounds (dict): Dictionary of completed rounds
+        history (dict, optional): Pairing history; built from completed_rounds if omitted
         
     Returns:
         bool: True if players have played, False otherwise
     """
-    for rnd in completed_rounds.values():
-        for pairing in rnd:
-            if set(pairing[:2]) == set([player1, player2]):
-                return True
-    return False
+    if history is None:
+        history = build_pairing_history(completed_rounds)
+    return play_count(history, player1, player2) > 0
 
-def australian_draw_pairings(players, completed_rounds):
+def australian_draw_pairings(players, completed_rounds, history=None):
     """
     Generate pairings using the Australian Draw system.
     
     Args:
         players (list): List of player tuples
         completed_rounds (dict): Dictionary of completed rounds
+        history (dict, optional): Pairing history; built from completed_rounds if omitted
         
     Returns:
         list: List of tuples containing player pairings and first player
     """
+    if history is None:
+        history = build_pairing_history(completed_rounds)
     sorted_players = sorted(players, key=lambda p: (p[3], p[5]), reverse=True)
     pairings = []
     used = [False] * len(sorted_players)
@@ -178,7 +347,7 @@ def australian_draw_pairings(players, completed_rounds):
         for j in range(i+1, len(sorted_players)):
             if not used[j]:
                 p2 = sorted_players[j][1]
-                if not has_played(p1, p2, completed_rounds):
+                if not play_count(history, p1, p2):
                     pairings.append((p1, p2, random.choice([p1, p2])))
                     used[i] = True
                     used[j] = True
@@ -236,7 +405,7 @@ def compute_lagged_standings(players, results_by_round, completed_rounds, round_
     sorted_players = sorted(players, key=lambda p: (stats[p[1]]["wins"], stats[p[1]]["spread"]), reverse=True)
     return sorted_players
 
-def lagged_australian_pairings(players, current_round_number, results_by_round, completed_rounds):
+def lagged_australian_pairings(players, current_round_number, results_by_round, completed_rounds, history=None):
     """
     Generate pairings using the Lagged Australian system.
     
@@ -245,6 +414,7 @@ def lagged_australian_pairings(players, current_round_number, results_by_round,
         current_round_number (int): Current round number
         results_by_round (dict): Dictionary of results by round
         completed_rounds (dict): Dictionary of completed rounds
+        history (dict, optional): Pairing history; built from completed_rounds if omitted
         
     Returns:
         list: List of tuples containing player pairings and first player
@@ -252,6 +422,8 @@ def lagged_australian_pairings(players, current_round_number, results_by_round,
     if current_round_number < 3:
         return random_pairings(players)
     
+    if history is None:
+        history = build_pairing_history(completed_rounds)
     standings = compute_lagged_standings(players, results_by_round, completed_rounds, current_round_number - 1)
     pairings = []
     used = [False] * len(standings)
@@ -265,7 +437,7 @@ def lagged_australian_pairings(players, current_round_number, results_by_round,
         for j in range(i+1, len(standings)):
             if not used[j]:
                 p2 = standings[j][1]
-                if not has_played(p1, p2, completed_rounds):
+                if not play_count(history, p1, p2):
                     pairings.append((p1, p2, random.choice([p1, p2])))
                     used[i] = True
                     used[j] = True
@@ -282,7 +454,103 @@ def lagged_australian_pairings(players, current_round_number, results_by_round,
         i += 1
     return pairings
 
-def generate_pairings_system(players, system="Round Robin", completed_rounds=None, current_round_number=0, results_by_round=None):
+def first_balance(completed_rounds):
+    """
+    Count, for each player, how many more times they went first than second.
+    
+    Args:
+        completed_rounds (dict): Dictionary of completed rounds
+        
+    Returns:
+        dict: Player name -> firsts minus seconds (BYE pairings ignored)
+    """
+    balance = {}
+    for rnd in completed_rounds.values():
+        for pairing in rnd:
+            if len(pairing) < 3 or "BYE" in pairing[:2]:
+                continue
+            p1, p2, first = pairing[0], pairing[1], pairing[2]
+            second = p2 if first == p1 else p1
+            balance[first] = balance.get(first, 0) + 1
+            balance[second] = balance.get(second, 0) - 1
+    return balance
+
+def _pairing_cost(rank_gap, repeats, balance1, balance2, repeat_penalty):
+    """Cost of pairing two players; lower is better."""
+    cost = OPTIMAL_GAP_WEIGHT * rank_gap * rank_gap + repeat_penalty * repeats
+    # Two players who are both due to go first (or both due second) cannot
+    # both be satisfied; penalise by how far the better-off one drifts.
+    if balance1 * balance2 > 0:
+        cost += OPTIMAL_BALANCE_WEIGHT * min(abs(balance1), abs(balance2))
+    return cost
+
+def optimal_pairings(players, completed_rounds, history=None, window=OPTIMAL_WINDOW):
+    """
+    Generate pairings by minimum-cost perfect matching over the standings.
+    
+    Players are ranked by wins and spread. Every pair within `window` ranks
+    of each other becomes an edge costed by the standings gap, the number of
+    previous meetings and the first/second balance, and the window is widened
+    for any player whose nearby opponents are all rematches. The cheapest
+    perfect matching is found with a maximum weight blossom matching, so the
+    bottom of the field is never stranded into rematches by earlier greedy
+    choices. With an odd field, a BYE joins the bottom of the standings.
+    
+    Args:
+        players (list): List of player tuples
+        completed_rounds (dict): Dictionary of completed rounds
+        history (dict, optional): Pairing history; built from completed_rounds if omitted
+        window (int): Standings distance to consider for each player
+        
+    Returns:
+        list: List of tuples containing player pairings and first player
+    """
+    if history is None:
+        history = build_pairing_history(completed_rounds)
+    sorted_players = sorted(players, key=lambda p: (p[3], p[5]), reverse=True)
+    names = [p[1] for p in sorted_players]
+    if len(names) % 2 == 1:
+        names.append("BYE")
+    n = len(names)
+    if n < 2:
+        return []
+    
+    balance = first_balance(completed_rounds)
+    repeat_penalty = max(OPTIMAL_REPEAT_PENALTY, OPTIMAL_GAP_WEIGHT * n ** 3)
+    max_cost = OPTIMAL_GAP_WEIGHT * n * n + repeat_penalty * (len(completed_rounds) + 1) + OPTIMAL_BALANCE_WEIGHT * n
+    edges = []
+    for i in range(n - 1):
+        found_new_opponent = False
+        for j in range(i + 1, n):
+            if j - i > window and found_new_opponent:
+                break
+            repeats = play_count(history, names[i], names[j])
+            if not repeats:
+                found_new_opponent = True
+            cost = _pairing_cost(j - i, repeats, balance.get(names[i], 0), balance.get(names[j], 0), repeat_penalty)
+            edges.append((i, j, max_cost - cost))
+    
+    mate = max_weight_matching(edges, max_cardinality=True)
+    pairings = []
+    for i in range(n):
+        j = mate[i]
+        if j < i:
+            continue
+        p1, p2 = names[i], names[j]
+        if p1 == "BYE" or p2 == "BYE":
+            first = p1 if p1 != "BYE" else p2
+        else:
+            b1, b2 = balance.get(p1, 0), balance.get(p2, 0)
+            if b1 < b2:
+                first = p1
+            elif b2 < b1:
+                first = p2
+            else:
+                first = random.choice([p1, p2])
+        pairings.append((p1, p2, first))
+    return pairings
+
+def generate_pairings_system(players, system="Round Robin", completed_rounds=None, current_round_number=0, results_by_round=None, history=None):
     """
     Generate pairings based on the selected system.
     
@@ -292,6 +560,7 @@ def generate_pairings_system(players, system="Round Robin", completed_rounds=Non
         completed_rounds (dict): Dictionary of completed rounds
         current_round_number (int): Current round number
         results_by_round (dict): Dictionary of results by round
+        history (dict, optional): Pairing history; built from completed_rounds if omitted
         
     Returns:
         list: List of tuples containing player pairings and first player
@@ -300,19 +569,22 @@ def generate_pairings_system(players, system="Round Robin", completed_rounds=Non
         completed_rounds = {}
     if results_by_round is None:
         results_by_round = {}
+    if history is None:
+        history = build_pairing_history(completed_rounds)
         
     if system == "Round Robin":
-        names = [p[1] for p in players]
-        full_round_robin_schedule = assign_firsts(round_robin_rounds(names))
-        return full_round_robin_schedule
+        schedule = create_round_robin_schedule([p[1] for p in players])
+        return [round_robin_pairing_round(schedule, r) for r in range(1, round_robin_round_count(schedule) + 1)]
     elif system == "Random Pairing":
         return random_pairings(players)
     elif system == "King of the Hills Pairing":
         return king_of_the_hills_pairings(players)
     elif system == "Australian Draw":
-        return australian_draw_pairings(players, completed_rounds)
+        return australian_draw_pairings(players, completed_rounds, history)
     elif system == "Lagged Australian":
-        return lagged_australian_pairings(players, current_round_number, results_by_round, completed_rounds)
+        return lagged_australian_pairings(players, current_round_number, results_by_round, completed_rounds, history)
+    elif system == "Optimal Matching":
+        return optimal_pairings(players, completed_rounds, history)
     else:
         raise ValueError("Invalid pairing system specified.")
 
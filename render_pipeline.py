@@ -0,0 +1,216 @@
+"""
+render_pipeline.py - Incremental page rendering for Direktor EXE Scrabble Tournament Manager
+
+This module writes the generated tournament pages. Each page is described by
+its file name, the data it is built from and a function that builds its HTML.
+The inputs are hashed and compared with a manifest kept in the output folder,
+so pages whose inputs have not changed are skipped; changed pages are built
+and written in a thread pool using atomic temp-file renames. Every page also
+gets precompressed .gz (and, when the brotli package is installed, .br)
+siblings for the web server to send as-is.
+"""
+
+import os
+import json
+import time
+import gzip
+import hashlib
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bump when the page markup changes so every page is rewritten once.
+RENDER_VERSION = 5
+MANIFEST_FILE = ".render_manifest.json"
+MAX_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+def _new_file_mode():
+    # os.umask() can only be read by setting it, so it is read once, at import.
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+NEW_FILE_MODE = _new_file_mode()  # Mode open() gives a new file
+
+def compressed_variants():
+    """Return the (suffix, encoding) pairs written next to every page."""
+    variants = [(".gz", "gzip")]
+    if brotli is not None:
+        variants.append((".br", "br"))
+    return variants
+
+def page_hash(inputs):
+    """
+    Hash the inputs a page is built from.
+
+    Args:
+        inputs: JSON-serialisable data that fully determines the page
+
+    Returns:
+        str: Hex digest of the inputs and the render version
+    """
+    payload = json.dumps([RENDER_VERSION, inputs], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def create_temp_file(folder):
+    """
+    Create a temporary file to be renamed over a file in folder.
+
+    mkstemp() makes the file readable by its owner only. Its mode is reset
+    to the one open() would give, so pages stay readable by a web server
+    running as another user once they are renamed into place.
+
+    Args:
+        folder (str): Folder of the destination file
+
+    Returns:
+        tuple: (file descriptor, temporary file path)
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=".tmp-")
+    if hasattr(os, "fchmod"):
+        os.fchmod(fd, NEW_FILE_MODE)
+    return fd, tmp_path
+
+def write_atomic(path, content):
+    """
+    Write a text file so readers never see a partially written page.
+
+    The content goes to a temporary file in the same folder, which is then
+    renamed over the destination.
+
+    Args:
+        path (str): Destination file path
+        content (str or bytes): File content
+
+    Returns:
+        int: Number of bytes written
+    """
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    folder = os.path.dirname(path) or "."
+    fd, tmp_path = create_temp_file(folder)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return len(data)
+
+def write_page_files(path, content):
+    """
+    Write a page and its precompressed siblings.
+
+    Args:
+        path (str): Destination file path
+        content (str): Page HTML
+
+    Returns:
+        int: Number of bytes written, compressed copies included
+    """
+    data = content.encode("utf-8")
+    written = write_atomic(path, data)
+    # mtime=0 keeps the gzip output identical for identical pages.
+    written += write_atomic(path + ".gz", gzip.compress(data, GZIP_LEVEL, mtime=0))
+    if brotli is not None:
+        written += write_atomic(path + ".br", brotli.compress(data, quality=BROTLI_QUALITY))
+    return written
+
+def load_manifest(out_folder):
+    """Load the page hash manifest of an output folder."""
+    try:
+        with open(os.path.join(out_folder, MANIFEST_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(out_folder, manifest):
+    """Save the page hash manifest of an output folder."""
+    write_atomic(os.path.join(out_folder, MANIFEST_FILE), json.dumps(manifest, sort_keys=True))
+
+_folder_locks = {}
+_folder_locks_lock = threading.Lock()
+
+def folder_lock(out_folder):
+    """Get the lock that serialises renders of one output folder."""
+    key = os.path.abspath(out_folder)
+    with _folder_locks_lock:
+        return _folder_locks.setdefault(key, threading.Lock())
+
+def render_pages(out_folder, pages, max_workers=MAX_WORKERS, progress=None, unchanged=None):
+    """
+    Build and write every page whose inputs changed since the last render.
+
+    Args:
+        out_folder (str): Folder the pages are written to
+        pages (list): (filename, inputs, build) tuples, where build() returns the page HTML
+        max_workers (int): Size of the writer thread pool
+        progress (callable): Optional progress(done, total) called as pages are
+            written; an exception it raises stops the render, and the pages
+            written so far stay recorded in the manifest
+        unchanged (set): Optional file names the caller knows have not changed
+            since the last render; they are skipped without hashing their
+            inputs if the manifest lists them and their files exist
+
+    Returns:
+        dict: Render report with "written", "skipped", "bytes" (written,
+        compressed copies included), "elapsed" (seconds) and the list of
+        "written_files"
+    """
+    # Renders of the same folder take turns, so neither loses the other's
+    # manifest entries.
+    with folder_lock(out_folder):
+        return _render_pages(out_folder, pages, max_workers, progress, unchanged)
+
+def _render_pages(out_folder, pages, max_workers, progress, unchanged):
+    start = time.perf_counter()
+    manifest = load_manifest(out_folder)
+    unchanged = unchanged or ()
+    pending = []
+    skipped = 0
+    suffixes = [""] + [suffix for suffix, _ in compressed_variants()]
+    for filename, inputs, build in pages:
+        path = os.path.join(out_folder, filename)
+        if filename in unchanged and filename in manifest and all(os.path.exists(path + suffix) for suffix in suffixes):
+            skipped += 1
+            continue
+        digest = page_hash(inputs)
+        if manifest.get(filename) == digest and all(os.path.exists(path + suffix) for suffix in suffixes):
+            skipped += 1
+        else:
+            pending.append((filename, digest, build))
+
+    def write_page(page):
+        filename, digest, build = page
+        written = write_page_files(os.path.join(out_folder, filename), build())
+        return filename, digest, written
+
+    written_bytes = 0
+    if pending:
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending))))
+        try:
+            for done, (filename, digest, written) in enumerate(executor.map(write_page, pending), start=1):
+                manifest[filename] = digest
+                written_bytes += written
+                if progress is not None:
+                    progress(done, len(pending))
+        finally:
+            # A stopped render drops the pages that have not started yet.
+            executor.shutdown(cancel_futures=True)
+            save_manifest(out_folder, manifest)
+
+    return {
+        "written": len(pending),
+        "skipped": skipped,
+        "bytes": written_bytes,
+        "elapsed": time.perf_counter() - start,
+        "written_files": [filename for filename, _, _ in pending],
+    }
@@ -1,21 +1,32 @@
-from database_utils import get_db_connection, execute_query
+"""
+schema.py - Database schema for Direktor EXE Scrabble Tournament Manager
+
+The schema is built by numbered migrations that run in order, each in its
+own transaction. Applied versions are recorded in the schema_version table,
+so initialize_database() only runs the migrations a database is missing and
+behaves the same for SQLite and PostgreSQL.
+"""
+
 import os
+import sqlite3
+from datetime import datetime
+from database_utils import pooled_connection
 
-def init_sqlite_schema():
-    """Initialize SQLite schema."""
-    queries = [
-        """
+def _base_tables(cursor, backend):
+    """Create the tournaments and players tables."""
+    key = "SERIAL PRIMARY KEY" if backend == "postgres" else "INTEGER PRIMARY KEY AUTOINCREMENT"
+    cursor.execute(f"""
         CREATE TABLE IF NOT EXISTS tournaments (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            id {key},
             name TEXT NOT NULL,
             date TEXT NOT NULL,
             venue TEXT,
             shareable_link TEXT
         )
-        """,
-        """
+    """)
+    cursor.execute(f"""
         CREATE TABLE IF NOT EXISTS players (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            id {key},
             name TEXT NOT NULL,
             rating INTEGER,
             tournament_id INTEGER,
@@ -29,52 +40,182 @@ def init_sqlite_schema():
             country TEXT,
             FOREIGN KEY (tournament_id) REFERENCES tournaments (id)
         )
-        """
-    ]
-    
-    for query in queries:
-        execute_query(query)
-
-def init_postgres_schema():
-    """Initialize PostgreSQL schema."""
-    queries = [
-        """
-        CREATE TABLE IF NOT EXISTS tournaments (
-            id SERIAL PRIMARY KEY,
-            name TEXT NOT NULL,
-            date TEXT NOT NULL,
-            venue TEXT,
-            shareable_link TEXT
+    """)
+
+def _results_table(cursor, backend):
+    """Create the results table for remotely submitted scores."""
+    key = "SERIAL PRIMARY KEY" if backend == "postgres" else "INTEGER PRIMARY KEY AUTOINCREMENT"
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS results (
+            id {key},
+            match_id TEXT NOT NULL,
+            player1_score INTEGER NOT NULL,
+            player2_score INTEGER NOT NULL,
+            tournament TEXT NOT NULL,
+            submission_time TEXT NOT NULL
         )
-        """,
-        """
-        CREATE TABLE IF NOT EXISTS players (
-            id SERIAL PRIMARY KEY,
-            name TEXT NOT NULL,
-            rating INTEGER,
-            tournament_id INTEGER,
-            wins REAL DEFAULT 0,
-            losses REAL DEFAULT 0,
-            spread INTEGER DEFAULT 0,
-            last_result TEXT,
-            scorecard TEXT,
-            team TEXT,
-            player_number INTEGER DEFAULT 1,
-            country TEXT,
-            FOREIGN KEY (tournament_id) REFERENCES tournaments (id)
+    """)
+
+def _upgrade_legacy_results(cursor, backend):
+    """
+    Bring results tables created by older releases up to date.
+
+    Older databases lack the tournament and submission_time columns and make
+    match_id unique across all tournaments. Missing columns are added, the
+    global constraint is dropped and duplicate submissions are removed,
+    keeping the latest one for each tournament and match.
+    """
+    if backend == "postgres":
+        cursor.execute("ALTER TABLE results ADD COLUMN IF NOT EXISTS tournament TEXT NOT NULL DEFAULT ''")
+        cursor.execute("ALTER TABLE results ADD COLUMN IF NOT EXISTS submission_time TEXT NOT NULL DEFAULT ''")
+        cursor.execute("ALTER TABLE results DROP CONSTRAINT IF EXISTS results_match_id_key")
+        cursor.execute("DELETE FROM results WHERE match_id IS NULL")
+    else:
+        cursor.execute("PRAGMA table_info(results)")
+        columns = {row[1] for row in cursor.fetchall()}
+        cursor.execute("PRAGMA index_list(results)")
+        unique_indexes = [row[1] for row in cursor.fetchall() if row[2]]
+        match_id_unique = False
+        for index_name in unique_indexes:
+            cursor.execute(f"PRAGMA index_info('{index_name}')")
+            if [row[2] for row in cursor.fetchall()] == ["match_id"]:
+                match_id_unique = True
+        if match_id_unique or not {"tournament", "submission_time"} <= columns:
+            # SQLite cannot drop a column constraint, so the table is rebuilt.
+            tournament = "COALESCE(tournament, '')" if "tournament" in columns else "''"
+            submission_time = "COALESCE(submission_time, '')" if "submission_time" in columns else "''"
+            cursor.execute("""
+                CREATE TABLE results_migrated (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    match_id TEXT NOT NULL,
+                    player1_score INTEGER NOT NULL,
+                    player2_score INTEGER NOT NULL,
+                    tournament TEXT NOT NULL,
+                    submission_time TEXT NOT NULL
+                )
+            """)
+            cursor.execute(f"""
+                INSERT INTO results_migrated (id, match_id, player1_score, player2_score, tournament, submission_time)
+                SELECT id, match_id, COALESCE(player1_score, 0), COALESCE(player2_score, 0), {tournament}, {submission_time}
+                FROM results WHERE match_id IS NOT NULL
+            """)
+            cursor.execute("DROP TABLE results")
+            cursor.execute("ALTER TABLE results_migrated RENAME TO results")
+    cursor.execute("""
+        DELETE FROM results WHERE id NOT IN (
+            SELECT MAX(id) FROM results GROUP BY tournament, match_id
+        )
+    """)
+
+def _indexes(cursor, backend):
+    """Index results by tournament and match, results by time and players by tournament."""
+    cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_results_tournament_match ON results (tournament, match_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_results_tournament_time ON results (tournament, submission_time)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_players_tournament_name ON players (tournament_id, name)")
+
+def _results_tournament_id_index(cursor, backend):
+    """Index results by tournament and id for the keyset-paginated results API."""
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_results_tournament_id ON results (tournament, id)")
+
+def _results_revision(cursor, backend):
+    """
+    Number every write to the results table.
+
+    Each insert or changed resubmission takes the next revision, so readers
+    that remember the highest revision they saw also see corrected scores,
+    which keep their row id. Existing rows take their id as revision.
+    """
+    if backend == "postgres":
+        cursor.execute("ALTER TABLE results ADD COLUMN IF NOT EXISTS revision BIGINT NOT NULL DEFAULT 0")
+    else:
+        cursor.execute("PRAGMA table_info(results)")
+        if "revision" not in {row[1] for row in cursor.fetchall()}:
+            cursor.execute("ALTER TABLE results ADD COLUMN revision INTEGER NOT NULL DEFAULT 0")
+    cursor.execute("UPDATE results SET revision = id WHERE revision = 0")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_results_tournament_revision ON results (tournament, revision)")
+
+# (version, description, function(cursor, backend)); append new migrations, never reorder.
+MIGRATIONS = [
+    (1, "Create tournaments and players tables", _base_tables),
+    (2, "Create results table", _results_table),
+    (3, "Upgrade legacy results tables", _upgrade_legacy_results),
+    (4, "Index results and players", _indexes),
+    (5, "Index results by tournament and id", _results_tournament_id_index),
+    (6, "Number results by revision", _results_revision),
+]
+
+def _applied_versions(cursor):
+    cursor.execute("SELECT version FROM schema_version")
+    return {row[0] for row in cursor.fetchall()}
+
+def migrate(conn, backend):
+    """
+    Apply every pending migration to a database.
+
+    Each migration runs in its own transaction together with the
+    schema_version row that records it, so a failed migration leaves the
+    database at the previous version.
+
+    Args:
+        conn: sqlite3 or psycopg2 connection
+        backend (str): "sqlite" or "postgres"
+
+    Returns:
+        list: Versions applied by this call
+    """
+    placeholder = "%s" if backend == "postgres" else "?"
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            description TEXT,
+            applied_at TEXT
         )
-        """
-    ]
-    
-    for query in queries:
-        execute_query(query)
+    """)
+    if backend == "sqlite":
+        conn.commit()
+    applied = []
+    for version, description, apply in MIGRATIONS:
+        if backend == "postgres":
+            conn.autocommit = False
+            # Serialise concurrent workers running the same migration.
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", (7415,))
+        else:
+            cursor.execute("BEGIN IMMEDIATE")
+        try:
+            if version not in _applied_versions(cursor):
+                apply(cursor, backend)
+                cursor.execute(
+                    f"INSERT INTO schema_version (version, description, applied_at) VALUES ({placeholder}, {placeholder}, {placeholder})",
+                    (version, description, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+                )
+                applied.append(version)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            if backend == "postgres":
+                conn.autocommit = True
+    cursor.close()
+    return applied
 
 def initialize_database():
     """Initialize the appropriate database schema."""
     database_url = os.environ.get("DATABASE_URL")
-    if database_url:
-        # We're on Render, use PostgreSQL
-        init_postgres_schema()
-    else:
-        # We're local, use SQLite
-        init_sqlite_schema()
\ No newline at end of file
+    # We're on Render with PostgreSQL, or local with SQLite
+    backend = "postgres" if database_url else "sqlite"
+    with pooled_connection() as conn:
+        if isinstance(conn, sqlite3.Connection):
+            # Manage transactions explicitly so DDL is covered by them as well.
+            isolation_level = conn.isolation_level
+            conn.isolation_level = None
+            try:
+                applied = migrate(conn, backend)
+            finally:
+                conn.isolation_level = isolation_level
+        else:
+            applied = migrate(conn, backend)
+    for version in applied:
+        print(f"Applied schema migration {version}")
+    return applied
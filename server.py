@@ -6,54 +6,388 @@ handling remote result submissions.
 """
 
 import os
+import gzip
+import json
 import sqlite3
-from flask import Flask, send_from_directory, request, abort, redirect, render_template_string, jsonify
-from werkzeug.security import generate_password_hash, check_password_hash
+import hmac
+import hashlib
+import time
+import mimetypes
+import threading
+from collections import OrderedDict
+from flask import Flask, send_file, request, abort, redirect, render_template_string, jsonify, Response
+from werkzeug.security import generate_password_hash, check_password_hash, safe_join
 from datetime import datetime
+from database_utils import get_sqlite_connection, get_pool_stats
+from data.database import get_tournament, get_all_tournaments, get_players_for_tournament
+from site_templates import tournament_pages
+from render_pipeline import compressed_variants, write_atomic
+from tou_format import read_tou_header, read_tou_rounds
+from tou_journal import journal_path, read_records, apply_record
+from utils import sanitize_filename, parse_match_id
+from schema import initialize_database
+import live_events
 
 app = Flask(__name__)
 PORT = int(os.environ.get("PORT", 8000))
 DATABASE_FILE = "direktor.db"
 
+# Dynamic mode renders tournament pages on request instead of serving the
+# files last written by the desktop app.
+DYNAMIC_PAGES = os.environ.get("DYNAMIC_PAGES", "").lower() in ("1", "true", "yes")
+PAGE_CACHE_SIZE = int(os.environ.get("PAGE_CACHE_SIZE", 256))
+
+_state_lock = threading.Lock()
+_published_state = {}  # Tournament folder name -> state published by the desktop app
+_result_versions = {}  # Tournament folder name -> bumped whenever its results change
+_page_cache = OrderedDict()  # (folder, state version, result version, filename, base URL) -> (HTML bytes, gzip bytes, ETag)
+_page_cache_lock = threading.Lock()
+_etag_cache = {}  # File path -> (mtime_ns, size, ETag)
+_etag_lock = threading.Lock()
+_saved_state_cache = {}  # Tournament folder name -> newest .tou file, its file versions and the state read from it
+_saved_state_lock = threading.Lock()
+
+# Auto-publish uploads (PUT /api/publish/...) are accepted only with this token.
+PUBLISH_TOKEN = os.environ.get("PUBLISH_TOKEN", "")
+MAX_PUBLISH_BYTES = int(os.environ.get("MAX_PUBLISH_BYTES", 10 * 1024 * 1024))
+
 # Simple in-memory admin credentials (replace with database in production)
 ADMIN_USERNAME = "admin"
 ADMIN_PASSWORD_HASH = generate_password_hash("admin123")  # Default password, should be changed
 
+# Every write to the results table takes the next revision, so the desktop
+# app's ingester sees corrected scores as well as new ones.
+NEXT_RESULT_REVISION = "(SELECT COALESCE(MAX(revision), 0) + 1 FROM results)"
+
+TOURNAMENTS_DIR = os.path.join("rendered", "tournaments")
+FOLDER_INDEX_TTL = float(os.environ.get("FOLDER_INDEX_TTL", 5))
+
+_folder_index = {"folders": [], "root_mtime": None, "checked": 0.0}  # Folders sorted latest first
+_folder_index_lock = threading.Lock()
+
+# Bring the schema up to date on import, so "gunicorn server:app" and every
+# other entry point have the results indexes before the first request.
+initialize_database()
+
+def _scan_tournament_folders():
+    """List tournament folders sorted by modification time (latest first)."""
+    entries = []
+    with os.scandir(TOURNAMENTS_DIR) as it:
+        for entry in it:
+            try:
+                if entry.is_dir():
+                    entries.append((entry.stat().st_mtime, entry.name))
+            except OSError:
+                continue  # Removed while scanning
+    entries.sort(reverse=True)
+    return [name for _, name in entries]
+
+def tournament_folder_index():
+    """
+    Get the cached list of tournament folders, latest first.
+
+    The folder list is rescanned when a folder is added or removed, which
+    changes the mtime of the tournaments directory, and at most every
+    FOLDER_INDEX_TTL seconds otherwise to pick up folders whose pages were
+    rewritten. Between rescans a request costs a single stat.
+
+    Returns:
+        list: Tournament folder names sorted by modification time
+    """
+    try:
+        root_mtime = os.stat(TOURNAMENTS_DIR).st_mtime_ns
+    except OSError:
+        return []
+    now = time.monotonic()
+    index = _folder_index
+    if index["root_mtime"] == root_mtime and now - index["checked"] < FOLDER_INDEX_TTL:
+        return index["folders"]
+    # One request rescans; the others keep serving the previous list.
+    if not _folder_index_lock.acquire(blocking=index["root_mtime"] is None):
+        return index["folders"]
+    try:
+        try:
+            folders = _scan_tournament_folders()
+        except OSError:
+            folders = []
+        _folder_index.update(folders=folders, root_mtime=root_mtime, checked=now)
+        return folders
+    finally:
+        _folder_index_lock.release()
+
+def refresh_tournament_folder_index():
+    """Force the next tournament_folder_index() call to rescan, e.g. after rendering."""
+    _folder_index["checked"] = 0.0
+
 def get_latest_tournament_folder():
     """Get the most recently modified tournament folder."""
-    tournaments_dir = os.path.join("rendered", "tournaments")
-    if not os.path.exists(tournaments_dir):
-        return None
-    
-    # Get a list of tournament folders
-    folders = [d for d in os.listdir(tournaments_dir)
-               if os.path.isdir(os.path.join(tournaments_dir, d))]
-    if not folders:
-        return None
-    
-    # Sort folders by modification time (latest first)
-    folders.sort(key=lambda d: os.path.getmtime(os.path.join(tournaments_dir, d)), reverse=True)
-    return folders[0]
+    folders = tournament_folder_index()
+    return folders[0] if folders else None
 
 def get_all_tournament_folders():
     """Get all tournament folders sorted by modification time (latest first)."""
-    tournaments_dir = os.path.join("rendered", "tournaments")
-    if not os.path.exists(tournaments_dir):
-        return []
-    
-    # Get a list of tournament folders
-    folders = [d for d in os.listdir(tournaments_dir)
-               if os.path.isdir(os.path.join(tournaments_dir, d))]
-    
-    # Sort folders by modification time (latest first)
-    folders.sort(key=lambda d: os.path.getmtime(os.path.join(tournaments_dir, d)), reverse=True)
-    return folders
+    return list(tournament_folder_index())
 
 def create_connection():
-    """Create a database connection."""
-    conn = sqlite3.connect(DATABASE_FILE)
-    conn.row_factory = sqlite3.Row  # Return rows as dictionaries
-    return conn
+    """
+    Get this thread's pooled database connection.
+
+    The connection is shared with later requests on the same thread, so
+    callers must not close it; use dict_cursor() for dictionary rows.
+    """
+    return get_sqlite_connection(DATABASE_FILE)
+
+def dict_cursor(conn):
+    """Create a cursor that returns rows as dictionaries."""
+    cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+    return cursor
+
+def publish_tournament_state(tournament_id, tournament_name, completed_rounds, prize_table=None):
+    """
+    Publish the desktop app's live tournament state for dynamic pages.
+
+    Args:
+        tournament_id (int): Tournament ID
+        tournament_name (str): Tournament name
+        completed_rounds (dict): Pairings keyed by round number
+        prize_table (list): Prize dictionaries
+    """
+    folder_name = sanitize_filename(tournament_name)
+    rounds = {round_number: list(pairings) for round_number, pairings in completed_rounds.items()}
+    with _state_lock:
+        previous = _published_state.get(folder_name)
+        _published_state[folder_name] = {
+            "id": tournament_id,
+            "completed_rounds": rounds,
+            "prize_table": list(prize_table or []),
+            "version": ("published", previous["version"][1] + 1 if previous else 1),
+        }
+
+def invalidate_tournament(tournament_name):
+    """Mark a tournament's cached pages stale after its results change."""
+    folder_name = sanitize_filename(tournament_name)
+    with _state_lock:
+        _result_versions[folder_name] = _result_versions.get(folder_name, 0) + 1
+
+def _newest_tou_file(folder):
+    """Find the most recently saved .tou file in a folder, skipping temporary and hidden files."""
+    try:
+        paths = [os.path.join(folder, f) for f in os.listdir(folder) if f.endswith(".tou") and not f.startswith(".")]
+        return max(paths, key=os.path.getmtime) if paths else None
+    except OSError:
+        return None
+
+def _load_saved_state(folder_name):
+    """
+    Read tournament state from the newest .tou file in a tournament folder.
+
+    The state is cached. A request stats the folder, the .tou file and its
+    journal; the folder is listed again only when its modification time
+    changes, and the file is read again only when it or its journal does.
+    Journal records are applied, so pairings made since the last snapshot
+    are shown too.
+    """
+    folder = os.path.join("rendered", "tournaments", folder_name)
+    try:
+        folder_mtime = os.stat(folder).st_mtime_ns
+    except OSError:
+        return None
+    with _saved_state_lock:
+        cached = _saved_state_cache.get(folder_name)
+    if cached is not None and cached["folder_mtime"] == folder_mtime:
+        path = cached["path"]
+    else:
+        path = _newest_tou_file(folder)
+    if path is None:
+        return None
+    try:
+        tou_stat = os.stat(path)
+    except OSError:
+        return None
+    try:
+        journal_stat = os.stat(journal_path(path))
+        journal_version = (journal_stat.st_size, journal_stat.st_mtime_ns)
+    except OSError:
+        journal_version = (0, 0)
+    version = ("saved", tou_stat.st_mtime_ns) + journal_version
+    if cached is not None and cached["path"] == path and cached["state"]["version"] == version:
+        if cached["folder_mtime"] != folder_mtime:
+            with _saved_state_lock:
+                cached["folder_mtime"] = folder_mtime
+        return cached["state"]
+    try:
+        # Players are not needed, so only the header and pairings are read.
+        header = read_tou_header(path)
+        completed_rounds, _ = read_tou_rounds(path, results=False)
+    except (OSError, ValueError, sqlite3.Error):
+        return None
+    progress = {"completed_rounds": completed_rounds, "prize_table": header["progress"].get("prize_table", [])}
+    for record in read_records(path):
+        apply_record(progress, record)
+    state = {
+        "id": header["tournament"].get("id"),
+        "completed_rounds": progress["completed_rounds"],
+        "prize_table": progress.get("prize_table") or [],
+        "version": version,
+    }
+    with _saved_state_lock:
+        _saved_state_cache[folder_name] = {"folder_mtime": folder_mtime, "path": path, "state": state}
+    return state
+
+def get_tournament_state(folder_name):
+    """
+    Get the state dynamic pages are rendered from.
+
+    State published by the desktop app wins over the saved .tou file; with
+    neither, the tournament is looked up in the database by folder name.
+
+    Args:
+        folder_name (str): Tournament folder name
+
+    Returns:
+        dict: Tournament "id", "completed_rounds", "prize_table" and "version",
+        or None if the tournament is unknown
+    """
+    with _state_lock:
+        state = _published_state.get(folder_name)
+    if state is None:
+        state = _load_saved_state(folder_name)
+    if state is None or state["id"] is None:
+        for tournament in get_all_tournaments() or []:
+            if sanitize_filename(tournament[1]) == folder_name:
+                state = dict(state or {"completed_rounds": {}, "prize_table": [], "version": ("db", 0)})
+                state["id"] = tournament[0]
+                break
+        else:
+            return None
+    return state
+
+def render_dynamic_page(folder_name, filename):
+    """
+    Render one tournament page from the database and tournament state.
+
+    Pages are kept in an LRU cache keyed by tournament, state version and
+    result version, so a page is rendered once per change.
+
+    Args:
+        folder_name (str): Tournament folder name
+        filename (str): Page file name, e.g. "index.html"
+
+    Returns:
+        tuple: (HTML bytes, gzip bytes, ETag), or None if the page does not exist
+    """
+    state = get_tournament_state(folder_name)
+    if state is None:
+        return None
+    base_url = f"{request.host_url.rstrip('/')}/tournaments/{folder_name}"
+    with _state_lock:
+        result_version = _result_versions.get(folder_name, 0)
+    key = (folder_name, state["version"], result_version, filename, base_url)
+    with _page_cache_lock:
+        page = _page_cache.get(key)
+        if page is not None:
+            _page_cache.move_to_end(key)
+            return page
+    tournament = get_tournament(state["id"])
+    if not tournament:
+        return None
+    players = get_players_for_tournament(state["id"]) or []
+    pages = tournament_pages(tournament[0], tournament[1], tournament[2], tournament[3] or "",
+                             players, state["completed_rounds"], state["prize_table"], base_url)
+    build = next((build for name, _, build in pages if name == filename), None)
+    if build is None:
+        return None
+    data = build().encode("utf-8")
+    page = (data, gzip.compress(data, mtime=0), hashlib.sha256(data).hexdigest()[:32])
+    with _page_cache_lock:
+        _page_cache[key] = page
+        _page_cache.move_to_end(key)
+        while len(_page_cache) > PAGE_CACHE_SIZE:
+            _page_cache.popitem(last=False)
+    return page
+
+def file_etag(path, stat_result):
+    """
+    Get a strong ETag for a file from a hash of its content.
+
+    Hashes are cached until the file's size or modification time changes.
+
+    Args:
+        path (str): File path
+        stat_result (os.stat_result): Result of os.stat(path)
+
+    Returns:
+        str: ETag value, without quotes
+    """
+    with _etag_lock:
+        cached = _etag_cache.get(path)
+    if cached and cached[0] == stat_result.st_mtime_ns and cached[1] == stat_result.st_size:
+        return cached[2]
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    etag = digest.hexdigest()[:32]
+    with _etag_lock:
+        _etag_cache[path] = (stat_result.st_mtime_ns, stat_result.st_size, etag)
+    return etag
+
+def accepts_encoding(encoding):
+    """Check whether the client accepts a content encoding."""
+    return request.accept_encodings[encoding] > 0
+
+def send_tournament_file(folder, filename):
+    """
+    Send a rendered file, preferring a precompressed sibling the client accepts.
+
+    Responses carry a strong ETag and Last-Modified, and conditional
+    requests for an unchanged file are answered with 304 Not Modified.
+
+    Args:
+        folder (str): Tournament folder
+        filename (str): File path relative to the folder
+
+    Returns:
+        Response: File response, or None if the file does not exist
+    """
+    path = safe_join(os.path.abspath(folder), filename)
+    if path is None or not os.path.isfile(path):
+        return None
+    variant, encoding = path, None
+    # Brotli is listed last by compressed_variants() and preferred when present.
+    for suffix, candidate in reversed(compressed_variants()):
+        if accepts_encoding(candidate) and os.path.isfile(path + suffix):
+            variant, encoding = path + suffix, candidate
+            break
+    stat_result = os.stat(variant)
+    response = send_file(
+        variant,
+        mimetype=mimetypes.guess_type(filename)[0] or "application/octet-stream",
+        etag=file_etag(variant, stat_result),
+        last_modified=stat_result.st_mtime,
+        conditional=True,
+    )
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    # Let clients cache pages but revalidate on every poll; unchanged pages cost a 304.
+    response.cache_control.no_cache = True
+    return response
+
+def send_dynamic_page(page):
+    """Send a page rendered by render_dynamic_page() with the same caching headers."""
+    data, gzip_data, etag = page
+    if accepts_encoding("gzip"):
+        response = Response(gzip_data, mimetype="text/html")
+        response.headers["Content-Encoding"] = "gzip"
+        etag += "-gz"
+    else:
+        response = Response(data, mimetype="text/html")
+    response.set_etag(etag)
+    response.vary.add("Accept-Encoding")
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
 
 @app.route("/")
 def index():
@@ -97,20 +431,45 @@ def index():
 @app.route("/tournament/<tournament_name>")
 def tournament_index(tournament_name):
     """Serve the tournament index page."""
+    if DYNAMIC_PAGES:
+        page = render_dynamic_page(tournament_name, "index.html")
+        if page is not None:
+            return send_dynamic_page(page)
     folder = os.path.join("rendered", "tournaments", tournament_name)
-    if os.path.exists(os.path.join(folder, "index.html")):
-        return send_from_directory(folder, "index.html")
-    else:
+    response = send_tournament_file(folder, "index.html")
+    if response is None:
         abort(404, f"Tournament '{tournament_name}' not found.")
+    return response
 
 @app.route("/tournament/<tournament_name>/<path:filename>")
 def tournament_files(tournament_name, filename):
     """Serve tournament files."""
+    if DYNAMIC_PAGES and filename.endswith(".html"):
+        page = render_dynamic_page(tournament_name, filename)
+        if page is not None:
+            return send_dynamic_page(page)
     folder = os.path.join("rendered", "tournaments", tournament_name)
-    if os.path.exists(os.path.join(folder, filename)):
-        return send_from_directory(folder, filename)
-    else:
+    response = send_tournament_file(folder, filename)
+    if response is None:
         abort(404, f"File '{filename}' not found in tournament '{tournament_name}'.")
+    return response
+
+@app.route("/tournament/<tournament_name>/events")
+def tournament_events(tournament_name):
+    """Stream a tournament's live result events as Server-Sent Events."""
+    subscriber = live_events.subscribe(tournament_name)
+
+    def stream():
+        try:
+            yield from live_events.iter_events(subscriber)
+        finally:
+            live_events.unsubscribe(tournament_name, subscriber)
+
+    response = Response(stream(), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    # Stop reverse proxies from buffering the stream.
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
 
 @app.route("/tournaments/<tournament_name>")
 def tournaments_index(tournament_name):
@@ -122,6 +481,33 @@ def tournaments_files(tournament_name, filename):
     """Alternative route for tournament files."""
     return tournament_files(tournament_name, filename)
 
+@app.route("/tournaments/<tournament_name>/events")
+def tournaments_events(tournament_name):
+    """Alternative route for tournament events."""
+    return tournament_events(tournament_name)
+
+def match_players(folder_name, match_id):
+    """
+    Look up the players of a match in a tournament's current pairings.
+
+    Args:
+        folder_name (str): Tournament folder name
+        match_id (str): Match ID, e.g. "R3-M12"
+
+    Returns:
+        tuple: (player1, player2), or None if the match is unknown
+    """
+    parsed = parse_match_id(match_id)
+    state = get_tournament_state(folder_name) if parsed else None
+    if state is None:
+        return None
+    round_number, match_number = parsed
+    rounds = state["completed_rounds"]
+    pairings = rounds.get(round_number, rounds.get(str(round_number), []))
+    if not 1 <= match_number <= len(pairings):
+        return None
+    return pairings[match_number - 1][0], pairings[match_number - 1][1]
+
 @app.route("/submit_results", methods=["GET", "POST"])
 def submit_results():
     """Handle result submission form."""
@@ -219,27 +605,150 @@ def submit_results():
         
         # Connect to database
         conn = create_connection()
-        cursor = conn.cursor()
+        cursor = dict_cursor(conn)
         
-        # Check if result already exists
-        cursor.execute("SELECT * FROM results WHERE match_id = ?", (match_id,))
+        # Check if result already exists; match IDs repeat across tournaments
+        match_id = match_id.strip().upper()
+        cursor.execute("SELECT 1 FROM results WHERE tournament = ? AND match_id = ?", (tournament, match_id))
         if cursor.fetchone():
-            conn.close()
+            cursor.close()
             return jsonify({"success": False, "message": "Result for this match has already been submitted"})
         
         # Insert the result
         try:
             cursor.execute(
-                "INSERT INTO results (match_id, player1_score, player2_score, tournament, submission_time) VALUES (?, ?, ?, ?, ?)",
+                f"INSERT INTO results (match_id, player1_score, player2_score, tournament, submission_time, revision) VALUES (?, ?, ?, ?, ?, {NEXT_RESULT_REVISION})",
                 (match_id, score1, score2, tournament, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
             )
             conn.commit()
-            conn.close()
+            cursor.close()
+            invalidate_tournament(tournament)
+            folder_name = sanitize_filename(tournament)
+            players = match_players(folder_name, match_id) or ("Player 1", "Player 2")
+            live_events.publish(folder_name, "result", live_events.result_event(match_id, players[0], players[1], score1, score2))
             return jsonify({"success": True, "message": "Result submitted successfully"})
         except Exception as e:
-            conn.close()
+            conn.rollback()
+            cursor.close()
             return jsonify({"success": False, "message": f"Database error: {str(e)}"})
 
+def validate_batch_result(entry, pairings):
+    """
+    Check one entry of a batch submission against the current pairings.
+
+    Args:
+        entry (dict): {"match_id": ..., "score1": ..., "score2": ...}
+        pairings (dict): Pairings keyed by round number
+
+    Returns:
+        tuple: (match_id, score1, score2, players, error message or None)
+    """
+    if not isinstance(entry, dict):
+        return None, None, None, None, "Entry must be an object"
+    match_id = str(entry.get("match_id", "")).strip().upper()
+    parsed = parse_match_id(match_id)
+    if not parsed:
+        return match_id, None, None, None, "Invalid match ID"
+    try:
+        score1 = int(entry.get("score1"))
+        score2 = int(entry.get("score2"))
+    except (TypeError, ValueError):
+        return match_id, None, None, None, "Scores must be integers"
+    round_number, match_number = parsed
+    round_pairings = pairings.get(round_number, pairings.get(str(round_number)))
+    if not round_pairings or not 1 <= match_number <= len(round_pairings):
+        return match_id, score1, score2, None, "No such match in the current pairings"
+    players = (round_pairings[match_number - 1][0], round_pairings[match_number - 1][1])
+    if "BYE" in players:
+        return match_id, score1, score2, players, "BYE pairings take no result"
+    return match_id, score1, score2, players, None
+
+@app.route("/api/results/batch", methods=["POST"])
+def api_results_batch():
+    """
+    Submit a batch of results, such as a whole round, in one request.
+
+    Expects JSON {"tournament": name, "results": [{"match_id", "score1", "score2"}, ...]}.
+    Every entry is validated against the tournament's current pairings;
+    valid entries are upserted on (tournament, match_id) in a single
+    transaction. A resubmission with different scores replaces the earlier
+    one under a new revision, so the desktop app reviews the correction; an
+    identical resubmission changes nothing. The response lists a status for
+    every entry: inserted, updated, unchanged or rejected.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or not data.get("tournament") or not isinstance(data.get("results"), list):
+        return jsonify({"success": False, "message": "Expected JSON with 'tournament' and a 'results' list"}), 400
+    tournament = str(data["tournament"]).strip()
+    folder_name = sanitize_filename(tournament)
+    state = get_tournament_state(folder_name)
+    if state is None:
+        return jsonify({"success": False, "message": f"Tournament '{tournament}' not found"}), 404
+
+    statuses = []
+    accepted = {}
+    for entry in data["results"]:
+        match_id, score1, score2, players, error = validate_batch_result(entry, state["completed_rounds"])
+        if error is None and match_id in accepted:
+            error = "Duplicate match in batch"
+        if error:
+            statuses.append({"match_id": match_id, "status": "rejected", "message": error})
+        else:
+            accepted[match_id] = (score1, score2, players)
+            statuses.append({"match_id": match_id, "status": None})
+
+    if accepted:
+        submitted = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        conn = create_connection()
+        cursor = conn.cursor()
+        try:
+            if conn.in_transaction:
+                conn.commit()
+            # The write lock is taken before the lookup, so no other
+            # submission can change which matches exist before the upsert.
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                placeholders = ", ".join("?" for _ in accepted)
+                cursor.execute(
+                    f"SELECT match_id, player1_score, player2_score FROM results WHERE tournament = ? AND match_id IN ({placeholders})",
+                    (tournament, *accepted)
+                )
+                existing = {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+                changed = {m: scores for m, scores in accepted.items() if existing.get(m) != scores[:2]}
+                cursor.executemany(
+                    f"""
+                    INSERT INTO results (match_id, player1_score, player2_score, tournament, submission_time, revision)
+                    VALUES (?, ?, ?, ?, ?, {NEXT_RESULT_REVISION})
+                    ON CONFLICT (tournament, match_id) DO UPDATE SET
+                        player1_score = excluded.player1_score,
+                        player2_score = excluded.player2_score,
+                        submission_time = excluded.submission_time,
+                        revision = excluded.revision
+                    """,
+                    [(m, score1, score2, tournament, submitted) for m, (score1, score2, _) in changed.items()]
+                )
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+        except Exception as e:
+            cursor.close()
+            return jsonify({"success": False, "message": f"Database error: {str(e)}"}), 500
+        cursor.close()
+        for status in statuses:
+            if status["status"] is None:
+                match_id = status["match_id"]
+                status["status"] = "unchanged" if match_id not in changed else "updated" if match_id in existing else "inserted"
+        if changed:
+            invalidate_tournament(tournament)
+        for match_id, (score1, score2, players) in changed.items():
+            live_events.publish(folder_name, "result", live_events.result_event(match_id, players[0], players[1], score1, score2))
+
+    counts = {}
+    for status in statuses:
+        counts[status["status"]] = counts.get(status["status"], 0) + 1
+    return jsonify({"success": "rejected" not in counts, "counts": counts, "results": statuses})
+
 @app.route("/admin", methods=["GET", "POST"])
 def admin_login():
     """Admin login page."""
@@ -293,12 +802,12 @@ def admin_dashboard():
     
     # Get recent submissions
     conn = create_connection()
-    cursor = conn.cursor()
+    cursor = dict_cursor(conn)
     cursor.execute(
         "SELECT match_id, player1_score, player2_score, tournament, submission_time FROM results ORDER BY submission_time DESC LIMIT 20"
     )
     submissions = cursor.fetchall()
-    conn.close()
+    cursor.close()
     
     return render_template_string("""
     <!DOCTYPE html>
@@ -348,34 +857,117 @@ def admin_dashboard():
     </html>
     """, submissions=submissions)
 
+RESULT_FIELDS = ("id", "match_id", "player1_score", "player2_score", "tournament", "submission_time")
+RESULTS_PAGE_SIZE = 500
+RESULTS_MAX_PAGE_SIZE = 5000
+RESULTS_FETCH_SIZE = 200
+
 @app.route("/api/results", methods=["GET"])
 def api_results():
-    """API endpoint to get results."""
+    """
+    API endpoint to get results, one page at a time.
+
+    Query parameters:
+        tournament: Only results of this tournament
+        after: Only results with an id greater than this (keyset cursor)
+        since: Only results submitted after this "YYYY-MM-DD HH:MM:SS" time
+        limit: Page size (default 500, at most 5000)
+        fields: Comma-separated subset of RESULT_FIELDS to return
+
+    Results are ordered by id. The response is streamed as
+    {"results": [...], "count": n, "next_after": id or null}; pass
+    next_after back as after= to fetch the next page.
+    """
     tournament = request.args.get("tournament")
-    
+    since = request.args.get("since")
+    try:
+        after = int(request.args.get("after", 0))
+        limit = int(request.args.get("limit", RESULTS_PAGE_SIZE))
+    except ValueError:
+        return jsonify({"error": "after and limit must be integers"}), 400
+    if not 1 <= limit <= RESULTS_MAX_PAGE_SIZE:
+        return jsonify({"error": f"limit must be between 1 and {RESULTS_MAX_PAGE_SIZE}"}), 400
+    if request.args.get("fields"):
+        fields = [field.strip() for field in request.args["fields"].split(",") if field.strip()]
+        unknown = [field for field in fields if field not in RESULT_FIELDS]
+        if unknown:
+            return jsonify({"error": f"Unknown fields: {', '.join(unknown)}"}), 400
+    else:
+        fields = [field for field in RESULT_FIELDS if not (tournament and field == "tournament")]
+
+    conditions = ["id > ?"]
+    params = [after]
+    if tournament:
+        conditions.append("tournament = ?")
+        params.append(tournament)
+    if since:
+        conditions.append("submission_time > ?")
+        params.append(since)
+    # One extra row tells whether another page follows.
+    params.append(limit + 1)
+    query = f"SELECT id, {', '.join(fields)} FROM results WHERE {' AND '.join(conditions)} ORDER BY id LIMIT ?"
+
     conn = create_connection()
     cursor = conn.cursor()
-    
-    if tournament:
-        cursor.execute(
-            "SELECT match_id, player1_score, player2_score, submission_time FROM results WHERE tournament = ? ORDER BY submission_time DESC",
-            (tournament,)
-        )
-    else:
-        cursor.execute(
-            "SELECT match_id, player1_score, player2_score, tournament, submission_time FROM results ORDER BY submission_time DESC"
-        )
-    
-    results = cursor.fetchall()
-    conn.close()
-    
-    # Convert to list of dictionaries for JSON response
-    results_list = []
-    for result in results:
-        result_dict = dict(result)
-        results_list.append(result_dict)
-    
-    return jsonify({"results": results_list})
+    cursor.execute(query, params)
+
+    def generate():
+        count = 0
+        last_id = None
+        next_after = None
+        try:
+            yield '{"results":['
+            while next_after is None:
+                rows = cursor.fetchmany(min(RESULTS_FETCH_SIZE, limit + 1 - count))
+                if not rows:
+                    break
+                for row in rows:
+                    if count == limit:
+                        # The extra row: more results follow the last one sent.
+                        next_after = last_id
+                        break
+                    yield ("," if count else "") + json.dumps(dict(zip(fields, row[1:])), separators=(",", ":"))
+                    count += 1
+                    last_id = row[0]
+            yield f'],"count":{count},"next_after":{json.dumps(next_after)}}}'
+        finally:
+            cursor.close()
+
+    return Response(generate(), mimetype="application/json")
+
+@app.route("/api/publish/<tournament_name>/<path:filename>", methods=["PUT"])
+def api_publish(tournament_name, filename):
+    """
+    Receive one rendered page from a desktop app's auto-publish job.
+
+    The request must carry "Authorization: Bearer <PUBLISH_TOKEN>"; with no
+    PUBLISH_TOKEN configured the endpoint is disabled. The body is written
+    atomically to the tournament folder. Names starting with a dot are
+    refused so the manifests and journal cannot be overwritten.
+    """
+    if not PUBLISH_TOKEN:
+        abort(404)
+    authorization = request.headers.get("Authorization", "")
+    if not hmac.compare_digest(authorization.encode("utf-8"), f"Bearer {PUBLISH_TOKEN}".encode("utf-8")):
+        return jsonify({"success": False, "message": "Invalid publish token"}), 401
+    if tournament_name != sanitize_filename(tournament_name) or tournament_name.startswith(".") or \
+            any(part.startswith(".") for part in filename.split("/")):
+        return jsonify({"success": False, "message": "Invalid file name"}), 400
+    if request.content_length is None or request.content_length > MAX_PUBLISH_BYTES:
+        return jsonify({"success": False, "message": "Missing or too large Content-Length"}), 413
+    folder = os.path.abspath(os.path.join(TOURNAMENTS_DIR, tournament_name))
+    path = safe_join(folder, filename)
+    if path is None:
+        return jsonify({"success": False, "message": "Invalid file name"}), 400
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    size = write_atomic(path, request.get_data(cache=False))
+    refresh_tournament_folder_index()
+    return jsonify({"success": True, "bytes": size})
+
+@app.route("/api/pool_stats", methods=["GET"])
+def api_pool_stats():
+    """API endpoint reporting database connection pool size and wait time."""
+    return jsonify(get_pool_stats())
 
 def run_flask_app():
     """Run the Flask application."""
@@ -383,14 +975,7 @@ def run_flask_app():
 
 if __name__ == "__main__":
     print("Starting Flask server directly...")
-    # Try to initialize the database if possible
-    try:
-        from schema import initialize_database
-        print("Initializing database...")
-        initialize_database()
-    except ImportError:
-        print("Could not import initialize_database, skipping database initialization")
-    
+    # The database was initialized when this module was imported.
     # Run the Flask app directly
     app.run(host="0.0.0.0", port=int(os.environ.get("PORT", 8000)), debug=False)
 
@@ -0,0 +1,393 @@
+"""
+site_templates.py - Tournament page templates for Direktor EXE Scrabble Tournament Manager
+
+This module renders the public tournament pages (index, pairings, roster,
+standings, scorecards and prize table) from Jinja2 templates. The templates
+share one layout for the header, navbar and footer and are compiled once
+and cached, so the desktop app and the Flask server render through the
+same template cache. It has no GUI dependencies.
+"""
+
+import json
+import random
+from functools import partial
+from jinja2 import Environment, DictLoader
+from utils import sanitize_filename
+
+FOOTER_TEXT = "Direktor Scrabble Tournament Manager by Manuelito"
+
+TEMPLATES = {
+    "layout.html": """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+  <base href="{{ base_href }}">
+  <title>Tournament</title>
+  <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
+  <style>
+    body { background-color: #f8f9fa; color: #343a40; }
+    .container-custom { max-width:800px; margin:auto; }
+    footer { margin-top: 40px; font-size: 0.9em; text-align: center; padding: 20px 0; }
+  </style>
+</head>
+<body>
+{% block navbar %}{% endblock %}
+  <div class="container container-custom">
+{% block content %}{% endblock %}
+  </div>
+  <footer class="bg-light">{{ footer_text }}</footer>
+  <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
+{% block scripts %}{% endblock %}
+</body>
+</html>
+""",
+    "navbar.html": """<nav class="navbar navbar-expand-lg navbar-light bg-light mb-4">
+  <div class="container">
+    <a class="navbar-brand" href="./index.html"></a>
+    <button class="navbar-toggler" type="button" data-bs-toggle="collapse"
+            data-bs-target="#navbarNav" aria-controls="navbarNav" aria-expanded="false"
+            aria-label="Toggle navigation">
+      <span class="navbar-toggler-icon"></span>
+    </button>
+    <div class="collapse navbar-collapse" id="navbarNav">
+      <ul class="navbar-nav ms-auto">
+        <li class="nav-item"><a class="nav-link" href="./index.html">Home</a></li>
+        <li class="nav-item"><a class="nav-link" href="./{{ files.roster }}">Roster</a></li>
+        <li class="nav-item"><a class="nav-link" href="./{{ files.standings }}">Standings</a></li>
+        <li class="nav-item"><a class="nav-link" href="./{{ files.prize }}">Prize Table</a></li>
+      </ul>
+    </div>
+  </div>
+</nav>
+""",
+    "flag.html": """{% macro flag(player) %}{% if player|length > 10 and player[10] %} <img src="https://flagcdn.com/16x12/{{ player[10].strip().lower() }}.png">{% endif %}{% endmacro %}""",
+    "live.html": """<script>
+(function () {
+  // Patch the page in place from the tournament's live result events.
+  if (!window.EventSource) return;
+  var source = new EventSource("{{ events_url }}");
+  function patchStandings(players) {
+    var body = document.getElementById("standings-body");
+    if (body && players.length) {
+      players.forEach(function (p) {
+        var row = body.querySelector('tr[data-player-id="' + p.id + '"]');
+        if (!row) return;
+        row.dataset.wins = p.wins;
+        row.dataset.spread = p.spread;
+        row.cells[2].textContent = p.wins;
+        row.cells[3].textContent = p.losses;
+        row.cells[4].textContent = p.spread;
+        row.cells[5].textContent = p.last;
+      });
+      var rows = Array.prototype.slice.call(body.rows);
+      rows.sort(function (a, b) {
+        return (b.dataset.wins - a.dataset.wins) || (b.dataset.spread - a.dataset.spread);
+      });
+      rows.forEach(function (row, i) {
+        row.cells[0].textContent = i + 1;
+        body.appendChild(row);
+      });
+    }
+  }
+  source.addEventListener("standings", function (e) {
+    patchStandings(JSON.parse(e.data).players);
+  });
+  source.addEventListener("result", function (e) {
+    var data = JSON.parse(e.data);
+    patchStandings(data.players);
+    var feed = document.getElementById("live-results");
+    if (feed) {
+      var item = document.createElement("li");
+      item.className = "list-group-item";
+      item.textContent = data.match + ": " + data.text;
+      feed.insertBefore(item, feed.firstChild);
+      feed.hidden = false;
+    }
+  });
+})();
+</script>
+""",
+    "index.html": """{% extends "layout.html" %}
+{% block navbar %}{% include "navbar.html" %}{% endblock %}
+{% block content %}
+    <h1 class="mb-3">{{ tournament_name }}</h1>
+    <p class="lead">{{ tournament_date }} | {{ tournament_venue }}</p>
+    <h2 class="mt-4">Event Coverage Index</h2>
+    <ul class="list-group">
+      <li class="list-group-item"><a href="{{ shareable }}/{{ files.roster }}">Player Roster</a></li>
+{% for round_number, link in round_links %}
+      <li class='list-group-item'><a href='./{{ link }}'>Round {{ round_number }} Pairings</a></li>
+{% endfor %}
+      <li class="list-group-item"><a href="{{ shareable }}/{{ files.standings }}">Standings</a></li>
+      <li class="list-group-item"><a href="{{ shareable }}/{{ files.prize }}">Prize Table</a></li>
+    </ul>
+    <br>
+    <a href="/submit_results" class="btn btn-primary">Submit Results</a>
+    <br><br>
+    <p>Shareable URL: <a href="{{ shareable }}">{{ shareable }}</a></p>
+    <ul class="list-group" id="live-results" hidden></ul>
+{% endblock %}
+{% block scripts %}{% include "live.html" %}{% endblock %}
+""",
+    "pairings.html": """{% extends "layout.html" %}
+{% block navbar %}{% include "navbar.html" %}{% endblock %}
+{% block content %}
+    <h1 class="mb-3">{{ tournament_name }}</h1>
+    <h2>Round {{ round_number }} Pairings</h2>
+    <table class='table table-bordered'>
+      <thead><tr><th>#</th><th>Pairing</th><th>First</th><th>Match ID</th></tr></thead>
+      <tbody>
+{% for row in rows %}
+        <tr><td>{{ row.number }}</td><td>{{ row.player1 }} vs {{ row.player2 }}</td><td>{{ row.first }}</td><td>{{ row.match_id }} <button onclick='navigator.clipboard.writeText("{{ row.match_id }}")'>Copy</button></td></tr>
+{% endfor %}
+      </tbody>
+    </table>
+    <a href="./index.html" class="btn btn-secondary">Back to Index</a>
+{% endblock %}
+""",
+    "roster.html": """{% extends "layout.html" %}
+{% from "flag.html" import flag %}
+{% block content %}
+    <h1 class="mt-4">Player Roster - {{ tournament_name }}</h1>
+    <table class="table table-striped">
+      <thead><tr><th>#</th><th>Name</th><th>Rating</th></tr></thead>
+      <tbody>
+{% for p in players %}
+        <tr><td>{{ loop.index }}</td><td>{{ p[1] }}{{ flag(p) }}</td><td>{{ p[2] }}</td></tr>
+{% else %}
+        <tr><td colspan="3">No players registered.</td></tr>
+{% endfor %}
+      </tbody>
+    </table>
+    <a href="./index.html" class="btn btn-secondary">Back to Index</a>
+{% endblock %}
+""",
+    "standings.html": """{% extends "layout.html" %}
+{% from "flag.html" import flag %}
+{% block content %}
+    <h1 class="mt-4">Standings - {{ tournament_name }}</h1>
+    <table class="table table-hover">
+      <thead>
+        <tr><th>Rank</th><th>Name</th><th>Wins</th><th>Losses</th><th>Spread</th><th>Last Result</th></tr>
+      </thead>
+      <tbody id="standings-body">
+{% for p in players %}
+        <tr data-player-id="{{ p[0] }}" data-wins="{{ p[3] }}" data-spread="{{ p[5] }}"><td>{{ loop.index }}</td><td><a href='./tournament_{{ tournament_id }}_player_{{ p[0] }}.html'>{{ p[1] }}{{ flag(p) }}</a></td><td>{{ p[3] }}</td><td>{{ p[4] }}</td><td>{{ p[5] }}</td><td>{{ p[6] }}</td></tr>
+{% else %}
+        <tr><td colspan="6">No standings available.</td></tr>
+{% endfor %}
+      </tbody>
+    </table>
+    <a href="./index.html" class="btn btn-secondary">Back to Index</a>
+{% endblock %}
+{% block scripts %}{% include "live.html" %}{% endblock %}
+""",
+    "scorecard.html": """{% extends "layout.html" %}
+{% block content %}
+    <h1 class="mt-4">Scorecard</h1>
+    <h3>{{ player[1] }} (Rating: {{ player[2] }})</h3>
+    <table class="table table-striped">
+      <thead>
+        <tr><th>Round</th><th>Result</th><th>Cumulative Spread</th></tr>
+      </thead>
+      <tbody>
+{% for entry in scorecard %}
+        <tr><td>{{ entry.get('round', 'N/A') }}</td><td>{{ entry.get('result', 'N/A') }}</td><td>{{ entry.get('cumulative', 'N/A') }}</td></tr>
+{% else %}
+        <tr><td colspan="3">No scorecard data available.</td></tr>
+{% endfor %}
+      </tbody>
+    </table>
+    <a href="./index.html" class="btn btn-secondary">Back to Standings</a>
+{% endblock %}
+""",
+    "prize.html": """{% extends "layout.html" %}
+{% block content %}
+    <h1 class="mt-4">Prize Table - {{ tournament_name }}</h1>
+    <table class="table table-bordered">
+      <thead><tr><th>Prize Name</th><th>Details</th></tr></thead>
+      <tbody>
+{% for prize in prizes %}
+{% if prize["prize_type"] == "Monetary" %}
+        <tr><td>{{ prize["prize_name"] }}</td><td>{{ prize["currency"] }} {{ prize["amount"] }}</td></tr>
+{% else %}
+        <tr><td>{{ prize["prize_name"] }}</td><td>{{ prize["prize_description"] }}</td></tr>
+{% endif %}
+{% else %}
+        <tr><td colspan="2">No prizes set.</td></tr>
+{% endfor %}
+      </tbody>
+    </table>
+    <a href="./index.html" class="btn btn-secondary">Back to Index</a>
+{% endblock %}
+""",
+}
+
+# Templates are compiled on first use and kept for the life of the process.
+_env = Environment(
+    loader=DictLoader(TEMPLATES),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True,
+    auto_reload=False,
+    cache_size=len(TEMPLATES),
+)
+_env.globals.update(base_href="./", footer_text=FOOTER_TEXT)
+
+def render_page(template_name, **context):
+    """
+    Render a page template from the shared template cache.
+
+    Args:
+        template_name (str): Name of the template, e.g. "standings.html"
+        **context: Template variables
+
+    Returns:
+        str: Rendered HTML
+    """
+    return _env.get_template(template_name).render(**context)
+
+def page_files(tournament_id):
+    """
+    Get the file names of a tournament's fixed pages.
+
+    Args:
+        tournament_id (int): Tournament ID
+
+    Returns:
+        dict: File names keyed by "index", "roster", "standings" and "prize"
+    """
+    return {
+        "index": "index.html",
+        "roster": f"tournament_{tournament_id}_roster.html",
+        "standings": f"tournament_{tournament_id}_standings.html",
+        "prize": f"tournament_{tournament_id}_prize.html",
+    }
+
+def pairings_file(tournament_id, round_number):
+    """Get the file name of a round's pairings page."""
+    return f"tournament_{tournament_id}_pairings_round_{round_number}.html"
+
+def scorecard_file(tournament_id, player_id):
+    """Get the file name of a player's scorecard page."""
+    return f"tournament_{tournament_id}_player_{player_id}.html"
+
+def events_url(tournament_name):
+    """Get the path of a tournament's live event stream on the Flask server."""
+    return f"/tournaments/{sanitize_filename(tournament_name)}/events"
+
+def pairing_rows(round_number, round_pairings):
+    """
+    Turn a round's pairings into table rows with match IDs.
+
+    Args:
+        round_number (int): Round number
+        round_pairings (list): (player1, player2[, first]) tuples
+
+    Returns:
+        list: Row dictionaries for the pairings template
+    """
+    rows = []
+    for i, pairing in enumerate(round_pairings, start=1):
+        if len(pairing) == 3:
+            p1, p2, first = pairing
+        elif len(pairing) == 2:
+            p1, p2 = pairing
+            first = random.choice([p1, p2])
+        else:
+            p1, p2, first = "???", "???", "???"
+        rows.append({"number": i, "player1": p1, "player2": p2, "first": first, "match_id": f"R{round_number}-M{i}"})
+    return rows
+
+def build_scorecard_html(player):
+    """
+    Render a player's scorecard page.
+
+    Args:
+        player (tuple): Player row as returned by get_players_for_tournament
+
+    Returns:
+        str: Rendered HTML
+    """
+    try:
+        scorecard = json.loads(player[7]) if player[7] else []
+    except Exception:
+        scorecard = []
+    return render_page("scorecard.html", player=player, scorecard=scorecard)
+
+def build_pairings_html(tournament_id, tournament_name, round_number, round_pairings):
+    """Render a round's pairings page."""
+    return render_page("pairings.html", tournament_name=tournament_name, round_number=round_number,
+                       rows=pairing_rows(round_number, round_pairings), files=page_files(tournament_id))
+
+def build_roster_html(tournament_name, players):
+    """Render the player roster page."""
+    return render_page("roster.html", tournament_name=tournament_name, players=players)
+
+def build_standings_html(tournament_id, tournament_name, sorted_players):
+    """Render the standings page for players already sorted by rank."""
+    return render_page("standings.html", tournament_id=tournament_id, tournament_name=tournament_name,
+                       players=sorted_players, events_url=events_url(tournament_name))
+
+def build_prize_html(tournament_name, prizes):
+    """Render the prize table page."""
+    return render_page("prize.html", tournament_name=tournament_name, prizes=prizes)
+
+def build_index_html(tournament_id, tournament_name, tournament_date, tournament_venue, round_links, shareable):
+    """Render the event coverage index page."""
+    return render_page("index.html", tournament_name=tournament_name, tournament_date=tournament_date,
+                       tournament_venue=tournament_venue, round_links=round_links, shareable=shareable,
+                       files=page_files(tournament_id), events_url=events_url(tournament_name))
+
+def sort_standings(players):
+    """Sort players by wins, then spread, best first."""
+    return sorted(players, key=lambda x: (x[3], x[5]), reverse=True)
+
+def tournament_pages(tournament_id, tournament_name, tournament_date, tournament_venue,
+                     players, completed_rounds, prize_table, shareable):
+    """
+    Describe every page of a tournament site.
+
+    Args:
+        tournament_id (int): Tournament ID
+        tournament_name (str): Tournament name
+        tournament_date (str): Tournament date
+        tournament_venue (str): Tournament venue
+        players (list): Player rows as returned by get_players_for_tournament
+        completed_rounds (dict): Pairings keyed by round number
+        prize_table (list): Prize dictionaries
+        shareable (str): Public base URL of the tournament folder
+
+    Returns:
+        list: (filename, inputs, build) tuples for render_pipeline.render_pages,
+        where inputs determine the page and build() returns its HTML
+    """
+    files = page_files(tournament_id)
+    pages = []
+    round_links = []
+    # Round keys are strings once a tournament has been saved to and loaded from JSON.
+    for idx, round_number in enumerate(sorted(completed_rounds, key=int), start=1):
+        round_pairings = completed_rounds[round_number]
+        round_file = pairings_file(tournament_id, idx)
+        round_links.append((idx, round_file))
+        pages.append((round_file, [tournament_name, idx, round_pairings, files],
+                      partial(build_pairings_html, tournament_id, tournament_name, idx, round_pairings)))
+    # The roster and standings inputs hold only the columns those pages show,
+    # so a new scorecard entry does not rewrite the roster.
+    roster_inputs = [(p[1], p[2], p[10] if len(p) > 10 else None) for p in players]
+    pages.append((files["roster"], [tournament_name, roster_inputs],
+                  partial(build_roster_html, tournament_name, players)))
+    sorted_players = sort_standings(players)
+    standings_inputs = [tuple(p[:7]) + (p[10] if len(p) > 10 else None,) for p in sorted_players]
+    pages.append((files["standings"], [tournament_id, tournament_name, standings_inputs],
+                  partial(build_standings_html, tournament_id, tournament_name, sorted_players)))
+    for player in players:
+        pages.append((scorecard_file(tournament_id, player[0]), player,
+                      partial(build_scorecard_html, player)))
+    prizes = list(prize_table)
+    pages.append((files["prize"], [tournament_name, prizes],
+                  partial(build_prize_html, tournament_name, prizes)))
+    index_inputs = [tournament_id, tournament_name, tournament_date, tournament_venue, round_links, shareable]
+    pages.append((files["index"], index_inputs, partial(build_index_html, *index_inputs)))
+    return pages
@@ -0,0 +1,173 @@
+"""
+task_executor.py - Background tasks for Direktor EXE Scrabble Tournament Manager
+
+Rendering, standings recalculation and FTP uploads can take long enough to
+freeze the window if they run on the Tk main thread. A TaskExecutor runs
+them on a small thread pool instead. Workers never touch widgets: their
+progress, results and errors are put on a queue, and the GUI drains it
+with poll() from an app.after() loop, so every callback runs on the Tk
+thread.
+
+A task function receives its Task as the first argument. It reports
+progress with task.report() and should call task.check_cancelled() between
+steps so a cancelled task stops at the next safe point.
+"""
+
+import queue
+import logging
+import threading
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+MAX_WORKERS = 2
+
+logger = logging.getLogger(__name__)
+
+class TaskCancelled(Exception):
+    """Raised inside a task function when its task has been cancelled."""
+
+class Task:
+    """One submitted task and its latest progress."""
+    __slots__ = ("id", "name", "done", "total", "message", "state", "_cancel", "_callbacks", "_executor")
+
+    def __init__(self, executor, task_id, name, callbacks):
+        self._executor = executor
+        self.id = task_id
+        self.name = name
+        self.done = 0
+        self.total = 0
+        self.message = ""
+        self.state = "queued"  # queued, running, finished, failed or cancelled
+        self._cancel = threading.Event()
+        self._callbacks = callbacks
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def cancel(self):
+        """Ask the task to stop; it does so at its next check_cancelled()."""
+        self._cancel.set()
+
+    def report(self, done, total, message=""):
+        """
+        Report progress from the worker thread.
+
+        Args:
+            done (int): Steps completed
+            total (int): Total number of steps
+            message (str): Optional description of the current step
+        """
+        self._executor._events.put((self, "progress", (done, total, message)))
+
+    def check_cancelled(self):
+        """Raise TaskCancelled if the task has been cancelled."""
+        if self._cancel.is_set():
+            raise TaskCancelled()
+
+    def fraction(self):
+        """Progress as a number between 0 and 1, or None if the total is unknown."""
+        return self.done / self.total if self.total else None
+
+    def __repr__(self):
+        return f"Task({self.id}, {self.name!r}, {self.state})"
+
+class TaskExecutor:
+    """
+    Thread pool whose results are delivered on the thread that calls poll().
+
+    Args:
+        max_workers (int): Number of worker threads
+    """
+
+    def __init__(self, max_workers=MAX_WORKERS):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="task")
+        self._events = queue.Queue()
+        self._ids = itertools.count(1)
+        self._tasks = {}
+
+    def submit(self, name, fn, *args, on_done=None, on_error=None, on_cancel=None, on_progress=None):
+        """
+        Run fn(task, *args) on a worker thread.
+
+        Callbacks run on the thread that calls poll(): on_done(result),
+        on_error(exception), on_cancel() and on_progress(task).
+
+        Args:
+            name (str): Description shown to the user
+            fn (callable): Task function
+
+        Returns:
+            Task: The submitted task
+        """
+        task = Task(self, next(self._ids), name, {
+            "done": on_done, "error": on_error, "cancel": on_cancel, "progress": on_progress,
+        })
+        self._tasks[task.id] = task
+        self._pool.submit(self._run, task, fn, args)
+        return task
+
+    def _run(self, task, fn, args):
+        if task.cancelled:
+            self._events.put((task, "cancel", None))
+            return
+        self._events.put((task, "start", None))
+        try:
+            result = fn(task, *args)
+        except TaskCancelled:
+            self._events.put((task, "cancel", None))
+        except Exception as e:
+            self._events.put((task, "error", e))
+        else:
+            if task.cancelled:
+                self._events.put((task, "cancel", None))
+            else:
+                self._events.put((task, "done", result))
+
+    def poll(self):
+        """
+        Deliver queued task events; call this from the GUI thread.
+
+        Returns:
+            int: Number of events delivered
+        """
+        delivered = 0
+        while True:
+            try:
+                task, kind, value = self._events.get_nowait()
+            except queue.Empty:
+                return delivered
+            delivered += 1
+            if kind == "start":
+                task.state = "running"
+                continue
+            if kind == "progress":
+                task.done, task.total, task.message = value
+                callback = task._callbacks["progress"]
+                if callback:
+                    callback(task)
+                continue
+            task.state = {"done": "finished", "error": "failed", "cancel": "cancelled"}[kind]
+            self._tasks.pop(task.id, None)
+            callback = task._callbacks[kind]
+            if kind == "error" and callback is None:
+                logger.error("Background task %r failed", task.name, exc_info=value)
+            elif kind == "cancel":
+                if callback is not None:
+                    callback()
+            elif callback is not None:
+                callback(value)
+
+    def active_tasks(self):
+        """Tasks that are queued or running, oldest first."""
+        return sorted(self._tasks.values(), key=lambda task: task.id)
+
+    def cancel_all(self):
+        """Cancel every queued and running task."""
+        for task in list(self._tasks.values()):
+            task.cancel()
+
+    def shutdown(self):
+        """Cancel all tasks and stop the worker threads."""
+        self.cancel_all()
+        self._pool.shutdown(wait=False)
@@ -0,0 +1,276 @@
+"""
+tou_format.py - Tournament save files for Direktor EXE Scrabble Tournament Manager
+
+A .tou file holds a tournament's details, its players and its progress. The
+original format is a single JSON document; the current format is an SQLite
+database with separate sections:
+
+    meta      format version and the tournament details
+    players   one row per player, scorecard stored as plain text
+    progress  every progress value except the rounds, one JSON value per key
+    rounds    one row per round with its pairings and results
+
+so the header, the player list and individual rounds can each be read
+without decoding the rest of the file. Both formats are read by the same
+functions, which tell them apart by the file's first bytes, and any file
+converts losslessly to the other format with convert_tou().
+
+    python tou_format.py <source.tou> <target.tou> [--json]
+"""
+
+import os
+import sys
+import json
+import sqlite3
+import tempfile
+
+FORMAT_VERSION = 2  # Version 1 is the JSON format
+SQLITE_MAGIC = b"SQLite format 3\x00"
+ROUND_KEYS = ("completed_rounds", "results_by_round")
+
+def is_sqlite_tou(path):
+    """Check whether a .tou file uses the SQLite format rather than JSON."""
+    with open(path, "rb") as f:
+        return f.read(len(SQLITE_MAGIC)) == SQLITE_MAGIC
+
+def _read_json(path):
+    with open(path, "r") as f:
+        return json.load(f)
+
+def _connect(path):
+    # Read-only, so loading never creates or modifies a file.
+    uri = "file:" + os.path.abspath(path).replace("?", "%3F").replace("#", "%23") + "?mode=ro"
+    return sqlite3.connect(uri, uri=True)
+
+def _round_number(key):
+    try:
+        return int(key)
+    except (TypeError, ValueError):
+        raise ValueError(f"Round key {key!r} is not a number")
+
+def write_tou(path, data):
+    """
+    Save tournament data in the SQLite format.
+
+    The file is built next to the destination and renamed over it, so an
+    interrupted save leaves the previous file intact.
+
+    Args:
+        path (str): Destination .tou file
+        data (dict): Tournament data with "tournament", "players" and "progress" keys
+    """
+    progress = data.get("progress") or {}
+    rounds = {}
+    for column, key in enumerate(ROUND_KEYS):
+        for round_key, value in (progress.get(key) or {}).items():
+            rounds.setdefault(_round_number(round_key), [None, None])[column] = value
+
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".tmp-", suffix=".tou")
+    os.close(fd)
+    try:
+        conn = sqlite3.connect(temp_path)
+        try:
+            conn.executescript("""
+                PRAGMA journal_mode = OFF;
+                PRAGMA synchronous = OFF;
+                CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+                CREATE TABLE players (position INTEGER PRIMARY KEY, name TEXT, scorecard TEXT, fields TEXT);
+                CREATE TABLE progress (position INTEGER PRIMARY KEY, key TEXT UNIQUE, value TEXT);
+                CREATE TABLE rounds (round INTEGER PRIMARY KEY, pairings TEXT, results TEXT);
+            """)
+            conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+                ("format_version", str(FORMAT_VERSION)),
+                ("tournament", json.dumps(data.get("tournament") or {})),
+            ])
+            # Keys outside the three standard sections are kept in meta as well.
+            conn.executemany("INSERT INTO meta VALUES (?, ?)",
+                             [(f"extra.{key}", json.dumps(value)) for key, value in data.items()
+                              if key not in ("tournament", "players", "progress")])
+            players = []
+            for position, player in enumerate(data.get("players") or []):
+                # Name and scorecard get their own columns; fields keeps their place in the key order.
+                fields = {key: None if key in ("name", "scorecard") else value for key, value in player.items()}
+                players.append((position, player.get("name"), player.get("scorecard"), json.dumps(fields)))
+            conn.executemany("INSERT INTO players VALUES (?, ?, ?, ?)", players)
+            # The round data lives in the rounds table; its progress rows only keep the key order.
+            conn.executemany("INSERT INTO progress VALUES (?, ?, ?)", [
+                (position, key, None if key in ROUND_KEYS else json.dumps(value))
+                for position, (key, value) in enumerate(progress.items())
+            ])
+            conn.executemany("INSERT INTO rounds VALUES (?, ?, ?)", [
+                (round_number, None if pairings is None else json.dumps(pairings),
+                 None if results is None else json.dumps(results))
+                for round_number, (pairings, results) in sorted(rounds.items())
+            ])
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def write_tou_json(path, data):
+    """Save tournament data in the original JSON format."""
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".tmp-", suffix=".tou")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def read_tou_header(path):
+    """
+    Read a .tou file's tournament details and progress, without players or rounds.
+
+    Args:
+        path (str): .tou file
+
+    Returns:
+        dict: "tournament", "progress" (without the round data) and
+        "rounds", the sorted round numbers that have pairings or results
+    """
+    if not is_sqlite_tou(path):
+        data = _read_json(path)
+        progress = dict(data.get("progress") or {})
+        round_numbers = set()
+        for key in ROUND_KEYS:
+            round_numbers.update(_round_number(k) for k in progress.pop(key, None) or {})
+        return {"tournament": data.get("tournament") or {}, "progress": progress, "rounds": sorted(round_numbers)}
+    conn = _connect(path)
+    try:
+        meta = dict(conn.execute("SELECT key, value FROM meta WHERE key IN ('format_version', 'tournament')"))
+        if int(meta.get("format_version", 0)) > FORMAT_VERSION:
+            raise ValueError(f"{path} was saved by a newer version (format {meta['format_version']})")
+        progress = {key: json.loads(value) for key, value in
+                    conn.execute("SELECT key, value FROM progress WHERE value IS NOT NULL ORDER BY position")}
+        round_numbers = [row[0] for row in conn.execute("SELECT round FROM rounds ORDER BY round")]
+    finally:
+        conn.close()
+    return {"tournament": json.loads(meta.get("tournament", "{}")), "progress": progress, "rounds": round_numbers}
+
+def read_tou_rounds(path, round_numbers=None, results=True):
+    """
+    Read some or all rounds of a .tou file.
+
+    Args:
+        path (str): .tou file
+        round_numbers (list): Rounds to read, or None for every round
+        results (bool): Whether to read results as well as pairings
+
+    Returns:
+        tuple: (completed_rounds, results_by_round) dicts keyed by round number
+    """
+    wanted = None if round_numbers is None else {int(n) for n in round_numbers}
+    completed_rounds, results_by_round = {}, {}
+    if not is_sqlite_tou(path):
+        progress = _read_json(path).get("progress") or {}
+        for target, key in ((completed_rounds, "completed_rounds"), (results_by_round, "results_by_round")):
+            if key == "results_by_round" and not results:
+                continue
+            for round_key, value in (progress.get(key) or {}).items():
+                if wanted is None or _round_number(round_key) in wanted:
+                    target[_round_number(round_key)] = value
+        return completed_rounds, results_by_round
+    conn = _connect(path)
+    try:
+        columns = "round, pairings, results" if results else "round, pairings, NULL"
+        if wanted is None:
+            rows = conn.execute(f"SELECT {columns} FROM rounds ORDER BY round")
+        else:
+            placeholders = ", ".join("?" * len(wanted))
+            rows = conn.execute(f"SELECT {columns} FROM rounds WHERE round IN ({placeholders}) ORDER BY round",
+                                sorted(wanted))
+        for round_number, pairings, round_results in rows:
+            if pairings is not None:
+                completed_rounds[round_number] = json.loads(pairings)
+            if round_results is not None:
+                results_by_round[round_number] = json.loads(round_results)
+    finally:
+        conn.close()
+    return completed_rounds, results_by_round
+
+def read_tou_players(path):
+    """
+    Read the players of a .tou file.
+
+    Args:
+        path (str): .tou file
+
+    Returns:
+        list: Player dictionaries in saved order
+    """
+    if not is_sqlite_tou(path):
+        return _read_json(path).get("players") or []
+    conn = _connect(path)
+    try:
+        players = []
+        for name, scorecard, fields in conn.execute("SELECT name, scorecard, fields FROM players ORDER BY position"):
+            player = json.loads(fields)
+            if "name" in player:
+                player["name"] = name
+            if "scorecard" in player:
+                player["scorecard"] = scorecard
+            players.append(player)
+    finally:
+        conn.close()
+    return players
+
+def read_tou(path):
+    """
+    Read a whole .tou file in either format.
+
+    Round numbers are returned as integers in both formats.
+
+    Args:
+        path (str): .tou file
+
+    Returns:
+        dict: Tournament data with "tournament", "players" and "progress" keys
+    """
+    if not is_sqlite_tou(path):
+        data = _read_json(path)
+        progress = data.get("progress")
+        if isinstance(progress, dict):
+            for key in ROUND_KEYS:
+                if isinstance(progress.get(key), dict):
+                    progress[key] = {_round_number(k): v for k, v in progress[key].items()}
+        return data
+    header = read_tou_header(path)
+    rounds = dict(zip(ROUND_KEYS, read_tou_rounds(path)))
+    conn = _connect(path)
+    try:
+        progress = {}
+        for key, value in conn.execute("SELECT key, value FROM progress ORDER BY position"):
+            progress[key] = rounds[key] if value is None else header["progress"][key]
+        data = {"tournament": header["tournament"], "players": read_tou_players(path), "progress": progress}
+        for key, value in conn.execute("SELECT key, value FROM meta WHERE key LIKE 'extra.%'"):
+            data[key[len("extra."):]] = json.loads(value)
+    finally:
+        conn.close()
+    return data
+
+def convert_tou(source, target, binary=True):
+    """
+    Convert a .tou file to the SQLite format, or back to JSON.
+
+    Args:
+        source (str): .tou file in either format
+        target (str): File to write; may be the same as source
+        binary (bool): True for the SQLite format, False for JSON
+    """
+    data = read_tou(source)
+    if binary:
+        write_tou(target, data)
+    else:
+        write_tou_json(target, data)
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (3, 4) or (len(sys.argv) == 4 and sys.argv[3] != "--json"):
+        print("Usage: python tou_format.py <source.tou> <target.tou> [--json]")
+        sys.exit(1)
+    convert_tou(sys.argv[1], sys.argv[2], binary=len(sys.argv) == 3)
@@ -0,0 +1,198 @@
+"""
+tou_journal.py - Progress journal for Direktor EXE Scrabble Tournament Manager
+
+Every pairing and result change is appended to a journal file next to the
+tournament's .tou file and flushed to disk before the change is reported
+as done, so a crash loses nothing that was entered. Records are JSON lines
+that set a value rather than change it, which makes replaying a record
+twice harmless:
+
+    {"op": "pairings", "round": 3, "pairings": [["A", "B", "A"], ...]}
+    {"op": "unpair", "round": 3}
+    {"op": "result", "round": 3, "index": 0, "scores": [412, 388]}
+    {"op": "progress", "values": {"current_round_number": 3}}
+
+The journal is compacted by saving a new .tou snapshot and then emptying
+the journal. A crash between the two steps only means the records are
+replayed onto a snapshot that already contains them.
+"""
+
+import os
+import json
+import logging
+import tempfile
+import threading
+
+logger = logging.getLogger(__name__)
+
+COMPACT_EVERY = 50  # Records appended before the desktop app writes a new snapshot
+
+_lock = threading.Lock()
+
+def journal_path(tou_path):
+    """
+    Get the journal file belonging to a .tou file.
+
+    The name starts with a dot so uploads and page manifests skip it.
+
+    Args:
+        tou_path (str): .tou file
+
+    Returns:
+        str: Journal file path
+    """
+    folder, name = os.path.split(tou_path)
+    return os.path.join(folder, f".{name}.journal")
+
+def append_records(tou_path, records):
+    """
+    Append records to a journal and flush them to disk.
+
+    The cost depends only on the records written, not on the size of the
+    tournament or the journal.
+
+    Args:
+        tou_path (str): .tou file the journal belongs to
+        records (list): JSON-serialisable record dictionaries
+    """
+    lines = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+    path = journal_path(tou_path)
+    with _lock:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+
+def count_records(tou_path):
+    """Count the records in a journal, or 0 if it does not exist."""
+    try:
+        with open(journal_path(tou_path), "rb") as f:
+            return sum(chunk.count(b"\n") for chunk in iter(lambda: f.read(1 << 16), b""))
+    except FileNotFoundError:
+        return 0
+
+def read_records(tou_path):
+    """
+    Read the records of a journal.
+
+    A partly written last line, left by a crash during an append, is
+    ignored.
+
+    Args:
+        tou_path (str): .tou file the journal belongs to
+
+    Returns:
+        list: Record dictionaries in the order they were appended
+    """
+    records = []
+    try:
+        with open(journal_path(tou_path), "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    logger.warning("Skipping unreadable journal record in %s", tou_path)
+    except FileNotFoundError:
+        pass
+    return records
+
+def apply_record(progress, record):
+    """
+    Apply one journal record to a progress dictionary.
+
+    Args:
+        progress (dict): Progress as read by tou_format.read_tou(); round keys are integers
+        record (dict): Journal record
+    """
+    op = record.get("op")
+    completed_rounds = progress.setdefault("completed_rounds", {})
+    results_by_round = progress.setdefault("results_by_round", {})
+    if op == "pairings":
+        completed_rounds[int(record["round"])] = record["pairings"]
+    elif op == "unpair":
+        completed_rounds.pop(int(record["round"]), None)
+    elif op == "result":
+        round_number = int(record["round"])
+        round_results = results_by_round.setdefault(round_number, [])
+        index = record["index"]
+        size = max(index + 1, len(completed_rounds.get(round_number) or []))
+        round_results.extend([None] * (size - len(round_results)))
+        round_results[index] = record["scores"]
+    elif op == "progress":
+        progress.update(record["values"])
+    else:
+        logger.warning("Skipping unknown journal record %r", op)
+
+def replay(tou_path, progress):
+    """
+    Apply a .tou file's journal to the progress read from it.
+
+    Args:
+        tou_path (str): .tou file
+        progress (dict): Progress read from the .tou file, updated in place
+
+    Returns:
+        int: Number of records replayed
+    """
+    records = read_records(tou_path)
+    for record in records:
+        apply_record(progress, record)
+    _truncate_partial_record(tou_path)
+    return len(records)
+
+def _truncate_partial_record(tou_path):
+    # Drop a partly written last line so later appends start on a new line.
+    try:
+        with open(journal_path(tou_path), "rb+") as f:
+            data = f.read()
+            end = data.rfind(b"\n") + 1
+            if end != len(data):
+                f.truncate(end)
+                f.flush()
+                os.fsync(f.fileno())
+    except FileNotFoundError:
+        pass
+
+def journal_size(tou_path):
+    """Get the size of a journal in bytes, or 0 if it does not exist."""
+    try:
+        return os.path.getsize(journal_path(tou_path))
+    except OSError:
+        return 0
+
+def clear(tou_path, upto=None):
+    """
+    Drop journal records after they have been saved in a .tou snapshot.
+
+    Args:
+        tou_path (str): .tou file the journal belongs to
+        upto (int): Journal size the snapshot covers, from journal_size();
+            records appended after it are kept. None empties the journal.
+    """
+    path = journal_path(tou_path)
+    with _lock:
+        if not os.path.exists(path):
+            return
+        if upto is None:
+            with open(path, "w") as f:
+                f.flush()
+                os.fsync(f.fileno())
+            return
+        with open(path, "rb") as f:
+            f.seek(upto)
+            tail = f.read()
+        # The kept records go to a new file that replaces the journal, so a
+        # crash leaves either the old journal or the new one.
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(tail)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
@@ -0,0 +1,196 @@
+"""
+tournament_state.py - Typed round data for Direktor EXE Scrabble Tournament Manager
+
+Pairings and results are kept in a RoundTable: a list of Round objects
+indexed by round number, so looking up a round is a list index rather than
+a hash of a key whose type depends on where the data came from. The table
+offers two dictionary-like views, pairings and results, with the same
+interface the desktop app has always used for completed_rounds and
+results_by_round. Round keys are converted to integers on the way in, so
+keys read back from JSON as strings find the same rounds.
+
+Pairing and Result are named tuples: they unpack and index like the plain
+tuples they replace and are written to JSON as lists.
+"""
+
+from collections.abc import MutableMapping
+from typing import NamedTuple, Optional
+
+class Pairing(NamedTuple):
+    """One game of a round; first is the player who starts."""
+    player1: str
+    player2: str
+    first: Optional[str] = None
+
+class Result(NamedTuple):
+    """Scores of one game, in the order of its pairing."""
+    score1: int
+    score2: int
+
+def to_pairings(pairings):
+    """Convert a round's pairings, as tuples or lists, to Pairing objects."""
+    return [pairing if isinstance(pairing, Pairing) else Pairing(*pairing) for pairing in pairings]
+
+def to_results(results):
+    """Convert a round's results, as tuples, lists or None, to Result objects."""
+    return [result if result is None or isinstance(result, Result) else Result(*result) for result in results]
+
+def round_number(key):
+    """
+    Convert a round key to a round number.
+
+    Args:
+        key (int or str): Round key, e.g. 3 or "3"
+
+    Returns:
+        int: Round number
+
+    Raises:
+        KeyError: If the key is not a positive whole number
+    """
+    try:
+        number = int(key)
+    except (TypeError, ValueError):
+        raise KeyError(key)
+    if number < 1:
+        raise KeyError(key)
+    return number
+
+class Round:
+    """Pairings and results of one round; either is None until it is set."""
+    __slots__ = ("number", "pairings", "results")
+
+    def __init__(self, number, pairings=None, results=None):
+        self.number = number
+        self.pairings = pairings
+        self.results = results
+
+    def __repr__(self):
+        return f"Round({self.number}, pairings={self.pairings!r}, results={self.results!r})"
+
+class RoundView(MutableMapping):
+    """Dictionary-like view of one field of every round in a RoundTable."""
+    __slots__ = ("_table", "_field", "_convert")
+
+    def __init__(self, table, field, convert):
+        self._table = table
+        self._field = field
+        self._convert = convert
+
+    def _round(self, key):
+        number = round_number(key)
+        rounds = self._table.rounds
+        entry = rounds[number] if number < len(rounds) else None
+        if entry is None or getattr(entry, self._field) is None:
+            raise KeyError(key)
+        return entry
+
+    def __getitem__(self, key):
+        return getattr(self._round(key), self._field)
+
+    def __setitem__(self, key, value):
+        setattr(self._table.round(round_number(key), create=True), self._field, self._convert(value))
+
+    def __delitem__(self, key):
+        setattr(self._round(key), self._field, None)
+
+    def __contains__(self, key):
+        try:
+            self._round(key)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        field = self._field
+        return (entry.number for entry in self._table.rounds if entry is not None and getattr(entry, field) is not None)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key, default=None):
+        # Return the stored (converted) value so callers can update it in place.
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def clear(self):
+        for entry in self._table.rounds:
+            if entry is not None:
+                setattr(entry, self._field, None)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+class RoundTable:
+    """
+    Round-indexed store of a tournament's pairings and results.
+
+    Attributes:
+        rounds (list): Round objects indexed by round number; index 0 and
+            rounds that were never set are None
+        pairings (RoundView): Pairing lists keyed by round number
+        results (RoundView): Result lists keyed by round number; a game
+            without a result is None
+    """
+    __slots__ = ("rounds", "pairings", "results")
+
+    def __init__(self):
+        self.rounds = [None]
+        self.pairings = RoundView(self, "pairings", to_pairings)
+        self.results = RoundView(self, "results", to_results)
+
+    def round(self, number, create=False):
+        """
+        Get a round by number.
+
+        Args:
+            number (int): Round number
+            create (bool): Whether to add the round if it does not exist
+
+        Returns:
+            Round: The round, or None if it does not exist and create is False
+        """
+        rounds = self.rounds
+        if number >= len(rounds):
+            if not create:
+                return None
+            rounds.extend([None] * (number + 1 - len(rounds)))
+        if rounds[number] is None and create:
+            rounds[number] = Round(number)
+        return rounds[number]
+
+    @classmethod
+    def from_progress(cls, progress):
+        """
+        Build a table from the progress section of a .tou file.
+
+        Args:
+            progress (dict): Progress with "completed_rounds" and "results_by_round"
+                keyed by round number as int or str
+
+        Returns:
+            RoundTable: The table
+        """
+        table = cls()
+        for key, pairings in (progress.get("completed_rounds") or {}).items():
+            table.pairings[key] = pairings
+        for key, results in (progress.get("results_by_round") or {}).items():
+            table.results[key] = results
+        return table
+
+    def to_progress(self):
+        """
+        Export the rounds for saving.
+
+        Returns:
+            tuple: (completed_rounds, results_by_round) dicts keyed by round
+            number, which JSON-encode like the dicts they replace
+        """
+        return dict(self.pairings.items()), dict(self.results.items())
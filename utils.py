@@ -71,6 +71,21 @@ def generate_match_id(round_number, match_number):
     """
     return f"R{round_number}-M{match_number}"
 
+def parse_match_id(match_id):
+    """
+    Parse a match ID generated by generate_match_id.
+    
+    Args:
+        match_id (str): Match ID, e.g. "R3-M12"
+        
+    Returns:
+        tuple: (round_number, match_number), or None if the ID is malformed
+    """
+    match = re.fullmatch(r"R(\d+)-M(\d+)", (match_id or "").strip(), re.IGNORECASE)
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
 def generate_random_id(length=8):
     """
     Generate a random ID.
@@ -135,10 +150,51 @@ def save_json_file(file_path, data):
     except Exception:
         return False
 
+def format_game_result(own_score, opponent_score):
+    """
+    Format a game result from one player's point of view.
+    
+    Args:
+        own_score (int): The player's score
+        opponent_score (int): The opponent's score
+        
+    Returns:
+        str: Result such as "W 420-380", "L 380-420" or "T 400-400"
+    """
+    if own_score > opponent_score:
+        outcome = "W"
+    elif own_score < opponent_score:
+        outcome = "L"
+    else:
+        outcome = "T"
+    return f"{outcome} {own_score}-{opponent_score}"
+
+def _record_game(stats, round_num, opponent, own_score, opponent_score):
+    """Add one game to a player's running stats and scorecard."""
+    if own_score > opponent_score:
+        stats["wins"] += 1
+    elif own_score < opponent_score:
+        stats["losses"] += 1
+    else:
+        stats["wins"] += 0.5
+        stats["losses"] += 0.5
+    stats["spread"] += own_score - opponent_score
+    stats["last_result"] = format_game_result(own_score, opponent_score)
+    stats["scorecard"].append({
+        "round": round_num,
+        "opponent": opponent,
+        "result": stats["last_result"],
+        "cumulative": stats["spread"]
+    })
+
 def recalculate_player_stats(players, completed_rounds, results_by_round):
     """
     Recalculate player statistics based on match results.
     
+    Every player's wins, losses, spread, last result and scorecard are
+    rebuilt in a single pass over the entered results, so the cost is
+    linear in the number of games rather than players x games.
+    
     Args:
         players (list): List of player tuples
         completed_rounds (dict): Dictionary of completed rounds
@@ -150,8 +206,7 @@ def recalculate_player_stats(players, completed_rounds, results_by_round):
     # Reset player stats
     player_stats = {}
     for player in players:
-        player_name = player[1]
-        player_stats[player_name] = {
+        player_stats[player[1]] = {
             "wins": 0,
             "losses": 0,
             "spread": 0,
@@ -168,82 +223,22 @@ def recalculate_player_stats(players, completed_rounds, results_by_round):
             if i >= len(round_results) or round_results[i] is None:
                 continue
                 
-            p1, p2, _ = pairing
+            p1, p2 = pairing[0], pairing[1]
             score1, score2 = round_results[i]
             
-            # Skip BYE pairings
+            # Skip BYE pairings and players no longer registered
             if p1 == "BYE" or p2 == "BYE":
                 continue
+            if p1 not in player_stats or p2 not in player_stats:
+                continue
                 
-            # Update player 1 stats
-            if score1 > score2:
-                player_stats[p1]["wins"] += 1
-                player_stats[p1]["spread"] += (score1 - score2)
-                player_stats[p1]["last_result"] = f"W {score1}-{score2}"
-                player_stats[p1]["scorecard"].append({
-                    "round": round_num,
-                    "opponent": p2,
-                    "result": f"W {score1}-{score2}",
-                    "cumulative": player_stats[p1]["spread"]
-                })
-            elif score1 < score2:
-                player_stats[p1]["losses"] += 1
-                player_stats[p1]["spread"] -= (score2 - score1)
-                player_stats[p1]["last_result"] = f"L {score1}-{score2}"
-                player_stats[p1]["scorecard"].append({
-                    "round": round_num,
-                    "opponent": p2,
-                    "result": f"L {score1}-{score2}",
-                    "cumulative": player_stats[p1]["spread"]
-                })
-            else:  # Tie
-                player_stats[p1]["wins"] += 0.5
-                player_stats[p1]["losses"] += 0.5
-                player_stats[p1]["last_result"] = f"T {score1}-{score2}"
-                player_stats[p1]["scorecard"].append({
-                    "round": round_num,
-                    "opponent": p2,
-                    "result": f"T {score1}-{score2}",
-                    "cumulative": player_stats[p1]["spread"]
-                })
-                
-            # Update player 2 stats
-            if score2 > score1:
-                player_stats[p2]["wins"] += 1
-                player_stats[p2]["spread"] += (score2 - score1)
-                player_stats[p2]["last_result"] = f"W {score2}-{score1}"
-                player_stats[p2]["scorecard"].append({
-                    "round": round_num,
-                    "opponent": p1,
-                    "result": f"W {score2}-{score1}",
-                    "cumulative": player_stats[p2]["spread"]
-                })
-            elif score2 < score1:
-                player_stats[p2]["losses"] += 1
-                player_stats[p2]["spread"] -= (score1 - score2)
-                player_stats[p2]["last_result"] = f"L {score2}-{score1}"
-                player_stats[p2]["scorecard"].append({
-                    "round": round_num,
-                    "opponent": p1,
-                    "result": f"L {score2}-{score1}",
-                    "cumulative": player_stats[p2]["spread"]
-                })
-            else:  # Tie
-                player_stats[p2]["wins"] += 0.5
-                player_stats[p2]["losses"] += 0.5
-                player_stats[p2]["last_result"] = f"T {score2}-{score1}"
-                player_stats[p2]["scorecard"].append({
-                    "round": round_num,
-                    "opponent": p1,
-                    "result": f"T {score2}-{score1}",
-                    "cumulative": player_stats[p2]["spread"]
-                })
+            _record_game(player_stats[p1], round_num, p2, score1, score2)
+            _record_game(player_stats[p2], round_num, p1, score2, score1)
     
     # Update player tuples with new stats
     updated_players = []
     for player in players:
-        player_name = player[1]
-        stats = player_stats.get(player_name, {"wins": 0, "losses": 0, "spread": 0, "last_result": "", "scorecard": []})
+        stats = player_stats[player[1]]
         
         # Create a new player tuple with updated stats
         # (id, name, rating, wins, losses, spread, last_result, scorecard, team, player_number, country)
@@ -264,3 +259,95 @@ def recalculate_player_stats(players, completed_rounds, results_by_round):
     
     return updated_players
 
+def _outcome_counts(own_score, opponent_score):
+    """Return the (wins, losses) a single game is worth."""
+    if own_score > opponent_score:
+        return 1, 0
+    if own_score < opponent_score:
+        return 0, 1
+    return 0.5, 0.5
+
+def apply_result_delta(player, round_num, opponent, old_scores=None, new_scores=None):
+    """
+    Apply one entered or corrected result to a single player's stats.
+    
+    Only the player's own scorecard is touched: the entry for the round is
+    added, replaced or removed, and every later cumulative spread is shifted
+    by the change in spread, so the cost is O(rounds played by the player).
+    
+    Args:
+        player (tuple): Player tuple as returned by get_players_for_tournament
+        round_num (int): Round of the result
+        opponent (str): Opponent's name
+        old_scores (tuple, optional): (own, opponent) scores previously entered, or None
+        new_scores (tuple, optional): (own, opponent) scores now entered, or None to clear
+        
+    Returns:
+        tuple: Updated player tuple, or None if the stored stats do not match
+        old_scores and a full recalculation is needed
+    """
+    try:
+        scorecard = json.loads(player[7]) if player[7] else []
+        entry_rounds = [int(entry["round"]) for entry in scorecard]
+    except (ValueError, TypeError, KeyError):
+        return None
+    round_num = int(round_num)
+    wins, losses, spread = player[3] or 0, player[4] or 0, player[5] or 0
+    expected_spread = scorecard[-1].get("cumulative") if scorecard else 0
+    if expected_spread != spread or wins + losses != len(scorecard):
+        return None
+    if entry_rounds.count(round_num) > 1:
+        return None
+    
+    position = entry_rounds.index(round_num) if round_num in entry_rounds else None
+    spread_delta = 0
+    if old_scores is not None:
+        own, other = old_scores
+        if position is None:
+            return None
+        old_entry = scorecard[position]
+        if old_entry.get("opponent") != opponent or old_entry.get("result") != format_game_result(own, other):
+            return None
+        old_wins, old_losses = _outcome_counts(own, other)
+        wins -= old_wins
+        losses -= old_losses
+        spread_delta -= own - other
+        del scorecard[position]
+    elif position is not None:
+        return None
+    else:
+        position = len([r for r in entry_rounds if r < round_num])
+    
+    if new_scores is not None:
+        own, other = new_scores
+        new_wins, new_losses = _outcome_counts(own, other)
+        wins += new_wins
+        losses += new_losses
+        spread_delta += own - other
+        previous = scorecard[position - 1]["cumulative"] if position > 0 else 0
+        scorecard.insert(position, {
+            "round": round_num,
+            "opponent": opponent,
+            "result": format_game_result(own, other),
+            "cumulative": previous + own - other
+        })
+        position += 1
+    
+    for entry in scorecard[position:]:
+        entry["cumulative"] += spread_delta
+    spread += spread_delta
+    last_result = scorecard[-1]["result"] if scorecard else ""
+    
+    return (
+        player[0],
+        player[1],
+        player[2],
+        wins,
+        losses,
+        spread,
+        last_result,
+        json.dumps(scorecard),
+        player[8] if len(player) > 8 else "",
+        player[9] if len(player) > 9 else 1,
+        player[10] if len(player) > 10 else ""
+    )